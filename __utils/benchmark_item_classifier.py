@@ -0,0 +1,182 @@
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from extractors.item_classifier import VacancyItemClassifier, ItemType
+from extractors.pattern_matcher import required_literals
+
+
+# Характерные элементы требований и обязанностей
+FIXTURE_ITEMS = [
+    "Опыт коммерческой разработки на Python от 3 лет",
+    "Уверенное знание SQL и опыт оптимизации запросов",
+    "Разработка и поддержка микросервисов на FastAPI",
+    "Участие в проектировании архитектуры новых сервисов",
+    "Взаимодействие с командой аналитиков и тестировщиков",
+    "Понимание принципов работы HTTP, REST, очередей сообщений",
+    "Написание юнит-тестов и проведение код-ревью",
+    "Опыт работы с Docker, Kubernetes, CI/CD будет плюсом",
+    "Высшее техническое образование",
+    "Английский язык на уровне чтения технической документации",
+    "Мы предлагаем ДМС и гибкий график",
+    "Офис в центре города, 5/2",
+    "За 15 лет мы помогли 200+ компаниям внедрить системное управление",
+    "Сбор и анализ требований, подготовка отчетов",
+    "Знание BPMN, UML; опыт работы в Jira и Confluence",
+]
+
+FILLER_WORDS = [
+    'опыт', 'работы', 'от', '3', 'лет', 'python', 'sql', 'знание', 'разработка',
+    'и', 'поддержка', 'систем', 'участие', 'в', 'проектах', 'Опыт', 'ОПЫТ',
+    'анализ', 'данных;', 'умение', 'не', 'менее', '2', 'года', '10+', 'компаний',
+]
+
+
+class ReferenceItemClassifier(VacancyItemClassifier):
+    """Эталон: каждый паттерн запускается отдельно (прежняя реализация)"""
+
+    def __init__(self):
+        super().__init__()
+        flags = re.IGNORECASE | re.UNICODE
+        self.families = {
+            'noise': [re.compile(p, flags) for p in self.NOISE_PATTERNS],
+            'requirement': [re.compile(p, flags) for p in self.REQUIREMENT_PATTERNS],
+            'responsibility': [re.compile(p, flags) for p in self.RESPONSIBILITY_PATTERNS],
+            'requirement_stop': [re.compile(p, flags) for p in self.REQUIREMENT_STOP_WORDS],
+            'responsibility_stop': [re.compile(p, flags) for p in self.RESPONSIBILITY_STOP_WORDS],
+        }
+
+    def classify(self, text: str) -> ItemType:
+        if not text or len(text.strip()) < 10:
+            return ItemType.UNKNOWN
+
+        text_clean = text.strip()
+
+        if any(p.search(text_clean) for p in self.families['noise']):
+            return ItemType.NOISE
+
+        text_lower = text_clean.lower()
+        if len(text_clean) < 15 or len(text_clean) > 500:
+            return ItemType.NOISE
+        if text_lower.startswith(self.MARKETING_STARTS):
+            return ItemType.NOISE
+        if any(re.search(p, text_lower) for p in self.COMPANY_INFO_PATTERNS):
+            return ItemType.NOISE
+
+        req_score = sum(len(p.findall(text_clean)) for p in self.families['requirement'])
+        resp_score = sum(len(p.findall(text_clean)) for p in self.families['responsibility'])
+
+        if any(p.search(text_clean) for p in self.families['requirement_stop']):
+            req_score = max(0, req_score - 2)
+        if any(p.search(text_clean) for p in self.families['responsibility_stop']):
+            resp_score = max(0, resp_score - 2)
+
+        if req_score > resp_score and req_score > 0:
+            return ItemType.REQUIREMENT
+        elif resp_score > req_score and resp_score > 0:
+            return ItemType.RESPONSIBILITY
+        else:
+            return ItemType.UNKNOWN
+
+
+def generate_items(rng, n_items):
+    """
+    Генерация элементов из литералов паттернов и обычных слов.
+
+    Args:
+        rng: Генератор случайных чисел
+        n_items: Количество элементов
+
+    Returns:
+        Список элементов
+    """
+    c = VacancyItemClassifier
+    literals = set()
+    for patterns in (c.NOISE_PATTERNS, c.REQUIREMENT_PATTERNS, c.RESPONSIBILITY_PATTERNS,
+                     c.REQUIREMENT_STOP_WORDS, c.RESPONSIBILITY_STOP_WORDS):
+        for pattern in patterns:
+            literals |= required_literals(pattern, re.IGNORECASE) or set()
+    literals = sorted(literals)
+
+    items = []
+    for _ in range(n_items):
+        words = []
+        for _ in range(rng.randint(1, 14)):
+            word = rng.choice(literals) if rng.random() < 0.5 else rng.choice(FILLER_WORDS)
+            if rng.random() < 0.2:
+                word = word.upper()
+            elif rng.random() < 0.2:
+                word = word.capitalize()
+            words.append(word)
+        items.append(' '.join(words) + rng.choice(['', '.', ';', ' 2 года']))
+
+    return items
+
+
+def check_parity(n_random=30000, seed=42):
+    """
+    Сравнение классификатора с эталоном.
+
+    Args:
+        n_random: Количество случайных элементов
+        seed: Зерно генератора
+
+    Returns:
+        Список расхождений (элемент, ожидаемый тип, полученный тип)
+    """
+    items = FIXTURE_ITEMS + generate_items(random.Random(seed), n_random)
+
+    reference = ReferenceItemClassifier()
+    classifier = VacancyItemClassifier()
+
+    mismatches = [
+        (item, reference.classify(item), classifier.classify(item))
+        for item in items
+        if reference.classify(item) != classifier.classify(item)
+    ]
+
+    print(f"🔍 Проверено элементов: {len(items)}, расхождений: {len(mismatches)}")
+
+    for item, expected, actual in mismatches[:5]:
+        print(f"\n   {item!r}")
+        print(f"   эталон: {expected.value}, получено: {actual.value}")
+
+    return mismatches
+
+
+def benchmark(n_items=20000, seed=1):
+    """
+    Замер скорости классификации.
+
+    Args:
+        n_items: Количество элементов
+        seed: Зерно генератора
+    """
+    rng = random.Random(seed)
+    items = [rng.choice(FIXTURE_ITEMS) for _ in range(n_items)]
+
+    results = {}
+
+    for name, classifier in (
+            ('reference', ReferenceItemClassifier()),
+            ('matcher', VacancyItemClassifier())
+    ):
+        start = time.perf_counter()
+        for item in items:
+            classifier.classify(item)
+        results[name] = time.perf_counter() - start
+
+        print(f"⏱️  {name:>9}: {results[name]:.3f} сек ({n_items / results[name]:.0f} элементов/сек)")
+
+    print(f"🚀 Ускорение: x{results['reference'] / results['matcher']:.1f}")
+
+
+if __name__ == '__main__':
+    mismatches = check_parity()
+    benchmark()
+
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,132 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from parsers.text_cleaner import HtmlTextCleaner, FastHtmlTextCleaner
+
+
+# Характерные фрагменты описаний вакансий hh.ru
+SAMPLES = [
+    "<p><strong>Обязанности:</strong></p><ul><li>разработка <em>backend</em>-сервисов</li>"
+    "<li>ревью кода</li></ul><p><strong>Требования:</strong></p>"
+    "<ul><li>опыт Python от 3 лет</li><li>знание SQL, Docker</li></ul>",
+    "<p>Мы ищем разработчика<br />в команду&nbsp;платформы.</p><p>Условия: ДМС &amp; спорт</p>",
+    "&lt;p&gt;Экранированный &lt;b&gt;HTML&lt;/b&gt;&lt;/p&gt; текст &amp;amp; символы &#1076;",
+    "<div><h2>О компании</h2>Текст<br>без абзацев<br/>и <b>выделения</b></div>хвост",
+    "<p>Незакрытый абзац<li>пункт<ul><li>вложенный",
+    "</p>лишний закрывающий<p>абзац</p></div><!-- комментарий -->текст",
+    "<script>var a = 1;</script>видимый<style>p {}</style> текст",
+    "<table><tr><td>Зарплата</td><td>от 200 000</td></tr></table>",
+    "Обычный текст без разметки,\n\n\n   с  лишними   пробелами",
+    "",
+]
+
+FUZZ_TAGS = ['p', 'div', 'li', 'ul', 'b', 'strong', 'em', 'span', 'br', 'h2',
+             'tr', 'td', 'table', 'script', 'a', 'template']
+FUZZ_TEXT = ['Python', 'опыт', '&amp;', '&lt;b&gt;', '&nbsp;', '  ', '\n', 'SQL,',
+             '&quot;', '<!-- c -->', '&#1076;', '&mdash;', '&amp;foo;', 'x < y',
+             '<a href="x">', '<BR>', '<img src=x>', '<hr/>']
+
+
+def generate_html(rng, n_tokens):
+    """
+    Генерация случайного (в том числе некорректного) HTML.
+
+    Args:
+        rng: Генератор случайных чисел
+        n_tokens: Количество фрагментов
+
+    Returns:
+        Строка HTML
+    """
+    parts = []
+
+    for _ in range(n_tokens):
+        r = rng.random()
+        if r < 0.3:
+            parts.append(f'<{rng.choice(FUZZ_TAGS)}>')
+        elif r < 0.35:
+            parts.append(f'<{rng.choice(FUZZ_TAGS)}/>')
+        elif r < 0.6:
+            parts.append(f'</{rng.choice(FUZZ_TAGS)}>')
+        else:
+            parts.append(rng.choice(FUZZ_TEXT))
+
+    return ''.join(parts)
+
+
+def check_parity(n_random=5000, seed=42):
+    """
+    Сравнение FastHtmlTextCleaner с HtmlTextCleaner.
+
+    Args:
+        n_random: Количество случайных документов
+        seed: Зерно генератора
+
+    Returns:
+        Список расхождений (preserve_structure, html, ожидаемое, полученное)
+    """
+    rng = random.Random(seed)
+    documents = SAMPLES + [generate_html(rng, rng.randint(1, 30)) for _ in range(n_random)]
+
+    mismatches = []
+
+    for preserve_structure in (True, False):
+        reference = HtmlTextCleaner(preserve_structure)
+        fast = FastHtmlTextCleaner(preserve_structure)
+
+        for html in documents:
+            expected = reference.clean(html)
+            actual = fast.clean(html)
+            if expected != actual:
+                mismatches.append((preserve_structure, html, expected, actual))
+
+    print(f"🔍 Проверено документов: {len(documents) * 2}, расхождений: {len(mismatches)}")
+
+    for preserve_structure, html, expected, actual in mismatches[:5]:
+        print(f"\n   preserve_structure={preserve_structure}: {html!r}")
+        print(f"   bs4:  {expected!r}")
+        print(f"   fast: {actual!r}")
+
+    return mismatches
+
+
+def benchmark(n_documents=2000, repeat=3):
+    """
+    Замер скорости очистки описаний.
+
+    Args:
+        n_documents: Количество описаний
+        repeat: Количество повторов (берется лучший результат)
+    """
+    # Описание типичного размера: несколько разделов со списками
+    document = ''.join(SAMPLES[:4]) * 4
+    documents = [document] * n_documents
+
+    results = {}
+
+    for name, cleaner in (
+            ('bs4', HtmlTextCleaner(preserve_structure=True)),
+            ('fast', FastHtmlTextCleaner(preserve_structure=True))
+    ):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for html in documents:
+                cleaner.clean(html)
+            best = min(best, time.perf_counter() - start)
+
+        results[name] = best
+        print(f"⏱️  {name:>4}: {best:.3f} сек ({n_documents / best:.0f} описаний/сек)")
+
+    print(f"🚀 Ускорение: x{results['bs4'] / results['fast']:.1f}")
+
+
+if __name__ == '__main__':
+    mismatches = check_parity()
+    benchmark()
+
+    sys.exit(1 if mismatches else 0)
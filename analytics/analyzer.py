@@ -5,11 +5,14 @@
 Реализует интерфейс IVacancyAnalyzer (Dependency Inversion).
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 from collections import Counter
 
 from core.interfaces import IVacancyAnalyzer
+from core.vacancy_record import VacancyRecord, as_record
+from analytics.keyword_matcher import KeywordMatcher
 
 
 class VacancyAnalyzer(IVacancyAnalyzer):
@@ -23,20 +26,29 @@ class VacancyAnalyzer(IVacancyAnalyzer):
     - Группировка по компаниям, формату работы и метро
 
     Attributes:
-        vacancies (List[Dict]): Список словарей с данными о вакансиях
+        vacancies (List[Union[Dict, VacancyRecord]]): Вакансии (ответы API или записи)
         df (Optional[pd.DataFrame]): DataFrame с обработанными данными
+        skills (Optional[pd.DataFrame]): Навыки вакансий в длинном формате
+        metro (Optional[pd.DataFrame]): Станции метро вакансий в длинном формате
     """
 
-    def __init__(self, vacancies: List[Dict]):
+    def __init__(self, vacancies: List[Union[Dict, VacancyRecord]]):
         """
         Инициализация анализатора.
 
         Args:
-            vacancies: Список словарей с данными о вакансиях
+            vacancies: Список словарей с данными о вакансиях или записей VacancyRecord
         """
         self.vacancies = vacancies
         self.df: Optional[pd.DataFrame] = None
 
+        # Длинные таблицы навыков и станций метро (vacancy_index - строка df)
+        self.skills: Optional[pd.DataFrame] = None
+        self.metro: Optional[pd.DataFrame] = None
+
+        # Поисковики ключевых слов по спискам ключевых слов
+        self._keyword_matchers: Dict[Tuple[str, ...], KeywordMatcher] = {}
+
     # ==================== ИЗВЛЕЧЕНИЕ ДАННЫХ ====================
 
     def extract_data(self) -> pd.DataFrame:
@@ -44,77 +56,46 @@ class VacancyAnalyzer(IVacancyAnalyzer):
         Извлечение и структурирование данных из вакансий.
 
         Преобразует сырые данные вакансий в структурированный DataFrame
-        для дальнейшего анализа.
+        для дальнейшего анализа. Таблица собирается по колонкам;
+        компания, формат работы, опыт и регион хранятся категориями,
+        навыки и станции метро дополнительно раскладываются в длинные
+        таблицы skills и metro (по строке на навык или станцию вакансии).
 
         Returns:
             pd.DataFrame: Структурированные данные о вакансиях
         """
-        data = []
-
-        for vac in self.vacancies:
-            # Безопасное извлечение данных с проверкой на None
-            salary = vac.get('salary')
-            experience = vac.get('experience', {})
-            schedule = vac.get('schedule', {})
-            employer = vac.get('employer', {})
-            address = vac.get('address', {})
-
-            # Обработка информации о метро
-            metro_stations = self._extract_metro_stations(address)
-
-            # Формирование записи
-            item = {
-                'id': vac.get('id'),
-                'name': vac.get('name'),
-                'company': employer.get('name') if employer else None,
-                'company_url': employer.get('alternate_url') if employer else None,
-                'salary_from': salary.get('from') if salary else None,
-                'salary_to': salary.get('to') if salary else None,
-                'currency': salary.get('currency') if salary else None,
-                'experience': experience.get('name') if experience else None,
-                'schedule': schedule.get('name') if schedule else None,
-                'description': vac.get('description', ''),
-                'key_skills': [skill['name'] for skill in vac.get('key_skills', [])],
-                'url': vac.get('alternate_url'),
-                'area': vac.get('area', {}).get('name') if vac.get('area') else None,
-                'metro_stations': metro_stations,
-                'employment': vac.get('employment', {}).get('name') if vac.get('employment') else None,
-            }
-            data.append(item)
-
-        self.df = pd.DataFrame(data)
-        return self.df
-
-    def _extract_metro_stations(self, address: Optional[Dict]) -> List[str]:
-        """
-        Извлечение названий станций метро из адреса.
+        # Ответы API проецируются в записи (поля с проверкой на None)
+        records = [as_record(vac) for vac in self.vacancies]
+
+        def column(name: str) -> list:
+            return [getattr(record, name) for record in records]
+
+        key_skills = [list(record.key_skills) for record in records]
+        metro_stations = [list(record.metro_stations) for record in records]
+
+        self.df = pd.DataFrame({
+            'id': column('id'),
+            'name': column('name'),
+            'company': _categorical(column('company')),
+            'company_url': column('company_url'),
+            'salary_from': column('salary_from'),
+            'salary_to': column('salary_to'),
+            'currency': column('currency'),
+            'experience': _categorical(column('experience')),
+            'schedule': _categorical(column('schedule')),
+            # Описания не копируются: колонка ссылается на строки записей
+            'description': pd.Series(column('description'), dtype=object),
+            'key_skills': key_skills,
+            'url': column('url'),
+            'area': _categorical(column('area')),
+            'metro_stations': metro_stations,
+            'employment': column('employment'),
+        })
+
+        self.skills = _long_table(key_skills, 'skill')
+        self.metro = _long_table(metro_stations, 'station')
 
-        Args:
-            address: Словарь с информацией об адресе
-
-        Returns:
-            List[str]: Список названий станций метро
-        """
-        metro_stations = []
-
-        if not address or not address.get('metro'):
-            return metro_stations
-
-        metro = address.get('metro', {})
-
-        # Обработка различных форматов данных метро
-        if isinstance(metro, dict):
-            station_name = metro.get('station_name', '')
-            if station_name:
-                metro_stations.append(station_name)
-        elif isinstance(metro, list):
-            metro_stations = [
-                m.get('station_name', '')
-                for m in metro
-                if m.get('station_name')
-            ]
-
-        return metro_stations
+        return self.df
 
     # ==================== АНАЛИЗ НАВЫКОВ ====================
 
@@ -130,17 +111,9 @@ class VacancyAnalyzer(IVacancyAnalyzer):
         if self.df is None:
             self.extract_data()
 
-        # Сбор всех навыков
-        all_skills = []
-        for skills in self.df['key_skills']:
-            all_skills.extend(skills)
-
-        # Подсчет частоты
-        skills_count = Counter(all_skills)
-        skills_df = pd.DataFrame(
-            skills_count.most_common(),
-            columns=['Навык', 'Количество']
-        )
+        # Подсчет частоты по длинной таблице навыков
+        skills_df = _most_common(self.skills['skill'])
+        skills_df.columns = ['Навык', 'Количество']
 
         # Добавление процента
         if len(skills_df) > 0:
@@ -159,7 +132,8 @@ class VacancyAnalyzer(IVacancyAnalyzer):
         """
         Анализ требований из описаний вакансий.
 
-        Ищет упоминания технических ключевых слов в описаниях вакансий.
+        Ищет упоминания технических ключевых слов в описаниях вакансий
+        (все слова ищутся за один просмотр описания, с учетом границ слов).
 
         Args:
             tech_keywords: Список ключевых слов для поиска.
@@ -216,14 +190,16 @@ class VacancyAnalyzer(IVacancyAnalyzer):
         if not text:
             return []
 
-        text_lower = text.lower()
-        found_keywords = []
+        return self._get_keyword_matcher(keywords_list).find(text)
+
+    def _get_keyword_matcher(self, keywords_list: List[str]) -> KeywordMatcher:
+        """Поисковик для списка ключевых слов (строится один раз на список)"""
+        key = tuple(keywords_list)
 
-        for keyword in keywords_list:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
+        if key not in self._keyword_matchers:
+            self._keyword_matchers[key] = KeywordMatcher(keywords_list)
 
-        return found_keywords
+        return self._keyword_matchers[key]
 
     def _get_default_keywords(self) -> List[str]:
         """
@@ -317,8 +293,13 @@ class VacancyAnalyzer(IVacancyAnalyzer):
         if self.df is None:
             self.extract_data()
 
-        # Подсчет по формату работы
-        schedule_counts = self.df['schedule'].fillna('Не указано').value_counts().reset_index()
+        # Подсчет по формату работы (для пропусков в категориальной
+        # колонке значение сначала добавляется в категории)
+        schedule = self.df['schedule']
+        if isinstance(schedule.dtype, pd.CategoricalDtype) and 'Не указано' not in schedule.cat.categories:
+            schedule = schedule.cat.add_categories('Не указано')
+
+        schedule_counts = _most_common(schedule.fillna('Не указано'))
         schedule_counts.columns = ['Формат работы', 'Количество']
 
         # Вычисление процента
@@ -356,31 +337,20 @@ class VacancyAnalyzer(IVacancyAnalyzer):
         if self.df is None:
             self.extract_data()
 
-        # Сбор всех станций метро
-        all_metro_stations = []
-        for stations in self.df['metro_stations']:
-            if stations:
-                all_metro_stations.extend(stations)
-
         # Проверка наличия данных
-        if not all_metro_stations:
+        if len(self.metro) == 0:
             return pd.DataFrame({
                 'Станция метро': ['Нет данных'],
                 'Количество': [0],
                 'Процент': [0.0]
             })
 
-        # Подсчет частоты
-        metro_counts = Counter(all_metro_stations)
-        metro_df = pd.DataFrame(
-            metro_counts.most_common(top_n),
-            columns=['Станция метро', 'Количество']
-        )
+        # Подсчет частоты по длинной таблице станций
+        metro_df = _most_common(self.metro['station']).head(top_n)
+        metro_df.columns = ['Станция метро', 'Количество']
 
         # Вычисление процента от вакансий с указанным метро
-        vacancies_with_metro = sum(
-            1 for stations in self.df['metro_stations'] if stations
-        )
+        vacancies_with_metro = self.metro['vacancy_index'].nunique()
 
         if vacancies_with_metro > 0:
             metro_df['Процент'] = (
@@ -388,3 +358,43 @@ class VacancyAnalyzer(IVacancyAnalyzer):
             ).round(2)
 
         return metro_df
+
+
+def _categorical(values: list) -> pd.Categorical:
+    """Категориальная колонка с категориями в порядке первого появления"""
+    codes, categories = pd.factorize(pd.Series(values, dtype=object))
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def _long_table(lists: List[list], value_name: str) -> pd.DataFrame:
+    """Длинная таблица из колонки списков: строка df и значение"""
+    lengths = np.fromiter((len(values) for values in lists), dtype=np.int64, count=len(lists))
+
+    return pd.DataFrame({
+        'vacancy_index': np.repeat(np.arange(len(lists)), lengths),
+        value_name: pd.Series(
+            [value for values in lists for value in values], dtype=object
+        ),
+    })
+
+
+def _most_common(values: pd.Series) -> pd.DataFrame:
+    """
+    Частоты значений по убыванию (как Counter.most_common).
+
+    При равной частоте значения идут в порядке первого появления.
+
+    Args:
+        values: Значения
+
+    Returns:
+        pd.DataFrame: Колонки value и count
+    """
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    order = np.argsort(-counts, kind='stable')
+
+    return pd.DataFrame({
+        'value': np.asarray(uniques, dtype=object)[order],
+        'count': counts[order],
+    })
@@ -0,0 +1,121 @@
+"""
+Модуль поиска ключевых слов в тексте.
+Все ключевые слова собираются в префиксное дерево, которое
+компилируется в одно регулярное выражение: движок re проходит
+по дереву на каждой позиции текста, поэтому описание просматривается
+один раз независимо от размера словаря навыков.
+"""
+
+import re
+from typing import Dict, List
+
+
+class KeywordMatcher:
+    """
+    Поиск ключевых слов (без учета регистра) с учетом границ слов.
+
+    Ключевое слово, которое начинается (заканчивается) буквой или цифрой,
+    засчитывается, только если перед ним (после него) в тексте нет буквы
+    или цифры: 'R', 'Go' и 'C' не находятся внутри других слов,
+    а 'C++', 'C#' и 'CI/CD' находятся как обычно.
+    """
+
+    def __init__(self, keywords: List[str]):
+        """
+        Args:
+            keywords: Ключевые слова (пустые строки игнорируются)
+        """
+        self.keywords = list(keywords)
+
+        # Ключевое слово в нижнем регистре -> номера в исходном списке
+        self._indexes: Dict[str, List[int]] = {}
+        for index, keyword in enumerate(self.keywords):
+            if keyword:
+                self._indexes.setdefault(keyword.lower(), []).append(index)
+
+        trie = self._build_trie(self._indexes)
+        self.pattern = re.compile(self._trie_to_regex(trie, '') if trie else r'(?!)')
+
+        # Для найденного слова - более короткие слова, которые являются
+        # его началом (на той же позиции выражение находит только самое длинное)
+        self._prefixes: Dict[str, List[str]] = {
+            word: [word[:length] for length in range(1, len(word)) if word[:length] in self._indexes]
+            for word in self._indexes
+        }
+
+    @staticmethod
+    def _build_trie(words) -> Dict:
+        trie: Dict = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = word
+        return trie
+
+    def _trie_to_regex(self, node: Dict, last_char: str) -> str:
+        """Выражение для поддерева (на каждом узле предпочитается более длинное слово)"""
+        alternatives = []
+
+        for char in sorted(key for key in node if key):
+            head = re.escape(char)
+            if not last_char and _is_word_char(char):
+                # Граница слова перед первым символом
+                head += r'(?<!\w.)'
+            alternatives.append(head + self._trie_to_regex(node[char], char))
+
+        if '' in node:
+            # Граница слова после последнего символа
+            alternatives.append(r'(?!\w)' if _is_word_char(last_char) else '')
+
+        if len(alternatives) == 1:
+            return alternatives[0]
+
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    def find(self, text: str) -> List[str]:
+        """
+        Ключевые слова, встречающиеся в тексте.
+
+        Args:
+            text: Текст для анализа
+
+        Returns:
+            List[str]: Найденные ключевые слова в порядке исходного списка
+        """
+        if not text:
+            return []
+
+        text_lower = text.lower()
+        found = set()
+        position = 0
+
+        while True:
+            match = self.pattern.search(text_lower, position)
+            if match is None:
+                break
+
+            word = match.group()
+            found.add(word)
+
+            for prefix in self._prefixes[word]:
+                if prefix not in found and self._ends_at_boundary(text_lower, match.start(), prefix):
+                    found.add(prefix)
+
+            # Совпадения могут пересекаться: поиск продолжается со следующего символа
+            position = match.start() + 1
+
+        return [
+            self.keywords[index]
+            for index in sorted(index for word in found for index in self._indexes[word])
+        ]
+
+    @staticmethod
+    def _ends_at_boundary(text: str, start: int, word: str) -> bool:
+        end = start + len(word)
+        return not (_is_word_char(word[-1]) and end < len(text) and _is_word_char(text[end]))
+
+
+def _is_word_char(char: str) -> bool:
+    """Символ слова в смысле \\w регулярных выражений"""
+    return char.isalnum() or char == '_'
@@ -18,12 +18,44 @@ class Config:
 
     # ==================== РЕЖИМЫ РАБОТЫ ====================
 
-    # Режим работы приложения: 'single' - одна вакансия, 'batch' - несколько
+    # Режим работы приложения: 'single' - одна вакансия, 'batch' - несколько,
+    # 'reprocess' - повторный анализ сохраненных сырых данных без обращения к API
     MODE: str = 'single'
 
     # Режим парсинга: 'sync' - синхронный, 'async' - асинхронный
     PARSING_MODE: str = 'sync'
 
+    # Потоковый режим: описания обрабатываются по мере получения вакансий,
+    # параллельно с загрузкой (полный эффект - при PARSING_MODE = 'async').
+    # С журналом batch-запуска (RESUMABLE_RUNS) описания обрабатываются
+    # порциями контрольных точек; при параллельном batch-сборе
+    # (async, BATCH_CONCURRENCY > 1) детали собираются заранее и режим не действует
+    STREAMING_MODE: bool = True
+
+    # Инкрементальный режим: повторный запуск запрашивает только вакансии,
+    # опубликованные после последней собранной, и дополняет raw.json
+    # (новые вакансии собираются все - MAX_PAGES и MAX_VACANCIES не действуют)
+    INCREMENTAL_MODE: bool = False
+
+    # Файл с водяными знаками (дата последней вакансии по запросу и региону)
+    WATERMARKS_PATH: str = './result/watermarks.json'
+
+    # Журнал batch-запуска: после сбоя повторный запуск с теми же параметрами
+    # продолжает работу с последней контрольной точки
+    RESUMABLE_RUNS: bool = True
+
+    # Сколько деталей вакансий получать между контрольными точками
+    CHECKPOINT_CHUNK_SIZE: int = 200
+
+    # Через сколько часов журнал прерванного запуска устаревает
+    # (вакансии в нем уже не актуальны) и запуск начинается заново
+    # (None - продолжать запуск любой давности)
+    JOURNAL_MAX_AGE_HOURS: Optional[float] = 24.0
+
+    # Сколько batch-запросов выполнять одновременно (для async режима;
+    # 1 - по очереди). Общие вакансии запросов загружаются один раз
+    BATCH_CONCURRENCY: int = 3
+
     # ==================== ЗАПРОСЫ ====================
 
     # Запрос для single режима
@@ -36,6 +68,9 @@ class Config:
         'Бизнес аналитик'
     ]
 
+    # Запросы для reprocess режима (None - все запросы с сохраненными данными)
+    REPROCESS_QUERIES: Optional[List[str]] = None
+
     # ==================== ПАРАМЕТРЫ ПОИСКА ====================
 
     # Код региона (1 - Москва, 2 - Санкт-Петербург)
@@ -50,9 +85,67 @@ class Config:
     # Максимальное количество страниц для парсинга
     MAX_PAGES_LIMIT: int = 20
 
+    # Разбивать выдачу больше 2000 вакансий (лимит API) на окна по дате
+    # публикации, чтобы собрать все вакансии (для async режима)
+    SEARCH_SHARDING: bool = True
+
+    # За сколько последних дней искать вакансии при разбиении
+    SEARCH_PERIOD_DAYS: int = 30
+
     # Максимальное количество одновременных запросов (для async режима)
     MAX_CONCURRENT: int = 10
 
+    # Количество потоков загрузки деталей (для sync режима, 1 - последовательно)
+    SYNC_MAX_WORKERS: int = 4
+
+    # Использовать HTTP/2 в sync режиме (если установлен httpx[http2])
+    HTTP2_ENABLED: bool = True
+
+    # Разрешённая частота запросов к API (запросов в секунду)
+    RATE_LIMIT_PER_SECOND: float = 8.0
+
+    # Максимальное количество запросов подряд без ожидания
+    RATE_LIMIT_BURST: int = 10
+
+    # Частота запросов в sync режиме (запросов в секунду, без burst):
+    # 5.0 соответствует прежней паузе 0.2 с между запросами
+    SYNC_RATE_LIMIT_PER_SECOND: float = 5.0
+
+    # Адаптивная параллельность загрузки деталей: лимит растёт, пока API
+    # отвечает без ошибок, и снижается при 429/503 (для async режима)
+    ADAPTIVE_CONCURRENCY: bool = True
+
+    # Нижняя и верхняя границы адаптивного лимита параллельности
+    MIN_CONCURRENT: int = 1
+    MAX_CONCURRENT_CEILING: int = 50
+
+    # ==================== ПОВТОРНЫЕ ПОПЫТКИ ====================
+
+    # Стратегия повторных попыток: 'exponential', 'linear', 'fibonacci',
+    # 'exponential_jitter', 'adaptive', 'circuit_breaker' или None (без повторов).
+    # Применяется и к страницам async-поиска (при None - 3 повтора страницы)
+    RETRY_STRATEGY: Optional[str] = 'exponential_jitter'
+
+    # Максимальное количество повторных попыток для одной вакансии (страницы поиска)
+    RETRY_MAX_ATTEMPTS: int = 3
+
+    # ==================== КЭШИРОВАНИЕ ====================
+
+    # Использовать ли постоянный кэш детальной информации о вакансиях
+    CACHE_ENABLED: bool = True
+
+    # Путь к файлу кэша (SQLite)
+    CACHE_PATH: str = './cache/vacancies.sqlite'
+
+    # Время жизни записи в кэше (часы)
+    CACHE_TTL_HOURS: float = 24.0
+
+    # Максимальное количество записей в кэше (None - без ограничений)
+    CACHE_MAX_ENTRIES: Optional[int] = 200_000
+
+    # Сколько хранить устаревшие записи для проверки по ETag/Last-Modified (часы)
+    CACHE_MAX_STALE_HOURS: float = 24.0 * 7
+
     # ==================== ВЫВОД ====================
 
     # Директория для сохранения результатов
@@ -61,6 +154,18 @@ class Config:
     # Показывать ли графики в окне (True) или только сохранять (False)
     SHOW_PLOTS: bool = True
 
+    # Формат хранения сырых и обработанных данных: 'parquet' - колоночный набор
+    # данных со сжатием zstd (нужен pyarrow), 'json' - raw.json и processed.csv
+    STORAGE_FORMAT: str = 'parquet'
+
+    # Корневая директория набора данных Parquet (разделы по запросу и дате запуска)
+    DATASET_DIR: str = './result/dataset'
+
+    # После сохранения сырых данных держать в памяти только поля вакансий,
+    # нужные для анализа (компактные записи вместо полных ответов API);
+    # при параллельном batch-сборе - сразу после получения всех деталей запроса
+    COMPACT_RECORDS: bool = True
+
     # ==================== ТЕХНИЧЕСКИЕ КЛЮЧЕВЫЕ СЛОВА ====================
 
     # Список технологий и навыков для анализа требований
@@ -143,3 +248,31 @@ class Config:
 
     # Использовать ли классификатор для разделения требований и обязанностей
     USE_CLASSIFIER: bool = True
+
+    # Количество процессов для обработки описаний (None - по числу ядер,
+    # 1 - в основном процессе)
+    DESCRIPTION_WORKERS: Optional[int] = None
+
+    # Очистка HTML описаний: 'fast' - потоковый парсер, 'bs4' - BeautifulSoup
+    # (результат одинаковый, 'fast' быстрее)
+    HTML_CLEANER: str = 'fast'
+
+    # Группировать ли похожие формулировки в частотном анализе требований
+    # и обязанностей (по всему корпусу, через MinHash/LSH)
+    CLUSTER_FREQUENCIES: bool = True
+
+    # Порог схожести формулировок при группировке (0.0 - 1.0)
+    CLUSTER_SIMILARITY_THRESHOLD: float = 0.85
+
+    # Кэшировать ли результаты очистки, извлечения и классификации по хэшу
+    # текста (повторно опубликованные вакансии не обрабатываются заново)
+    MEMO_ENABLED: bool = True
+
+    # Файл кэша обработки текста (SQLite, None - только в памяти)
+    MEMO_PATH: Optional[str] = './cache/text_memo.sqlite'
+
+    # Максимальное количество записей в памяти
+    MEMO_MAX_ENTRIES: int = 50_000
+
+    # Максимальное количество записей на диске (лишние вытесняются, начиная со старых)
+    MEMO_MAX_DISK_ENTRIES: Optional[int] = 1_000_000
@@ -0,0 +1,136 @@
+from collections import deque
+from typing import Dict
+import asyncio
+import time
+
+
+class AdaptiveConcurrencyController:
+    """
+    Адаптивное ограничение параллельности по схеме AIMD
+
+    (Additive Increase / Multiplicative Decrease)
+    - Пока ответы чистые: после каждых `limit` успешных запросов лимит +1
+    - При 429/503 (перегрузка API): лимит уменьшается в decrease_factor раз
+    - Повторные сигналы перегрузки в течение cooldown игнорируются,
+      чтобы одна волна отказов не обнулила лимит
+
+    Используется как асинхронный контекстный менеджер вместо Semaphore:
+        async with controller:
+            ...
+    """
+
+    def __init__(
+            self,
+            initial_limit: int = 10,
+            min_limit: int = 1,
+            max_limit: int = 50,
+            decrease_factor: float = 0.5,
+            cooldown: float = 2.0
+    ):
+        """
+        Args:
+            initial_limit: Начальное количество параллельных запросов
+            min_limit: Нижняя граница лимита
+            max_limit: Верхняя граница лимита
+            decrease_factor: Множитель уменьшения лимита при перегрузке
+            cooldown: Минимальный интервал между уменьшениями (секунды)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self._limit = min(max(initial_limit, self.min_limit), self.max_limit)
+        self._in_flight = 0
+        self._waiters = deque()
+        self._successes_since_change = 0
+        self._last_decrease = 0.0
+
+        self.peak_limit = self._limit
+        self.increases = 0
+        self.decreases = 0
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    async def acquire(self) -> None:
+        """Ожидает свободный слот"""
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                # Слот уже был выдан - возвращаем его
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Освобождает слот"""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def record_success(self) -> None:
+        """Учитывает успешный ответ (аддитивное увеличение)"""
+        self._successes_since_change += 1
+
+        if self._successes_since_change >= self._limit and self._limit < self.max_limit:
+            self._limit += 1
+            self._successes_since_change = 0
+            self.increases += 1
+            self.peak_limit = max(self.peak_limit, self._limit)
+            self._wake_waiters()
+
+    def record_overload(self) -> None:
+        """Учитывает сигнал перегрузки (мультипликативное уменьшение)"""
+        now = time.monotonic()
+        self._successes_since_change = 0
+
+        if now - self._last_decrease < self.cooldown:
+            return
+
+        new_limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        if new_limit < self._limit:
+            print(f"📉 Перегрузка API: параллельность {self._limit} → {new_limit}")
+            self._limit = new_limit
+            self.decreases += 1
+
+        self._last_decrease = now
+
+    @property
+    def limit(self) -> int:
+        """Текущий лимит параллельных запросов"""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Количество выполняющихся запросов"""
+        return self._in_flight
+
+    def get_statistics(self) -> Dict:
+        return {
+            'limit': self._limit,
+            'peak_limit': self.peak_limit,
+            'in_flight': self._in_flight,
+            'waiting': len(self._waiters),
+            'increases': self.increases,
+            'decreases': self.decreases
+        }
@@ -6,7 +6,9 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, AsyncIterator
+import asyncio
 import pandas as pd
 
 
@@ -26,7 +28,8 @@ class IVacancySearcher(ABC):
             query: str,
             area: int = 1,
             max_pages: int = 20,
-            max_vacancies: Optional[int] = None
+            max_vacancies: Optional[int] = None,
+            date_from: Optional[str] = None
     ) -> List[Dict]:
         """
         Поиск вакансий по запросу.
@@ -36,6 +39,7 @@ class IVacancySearcher(ABC):
             area: Код региона поиска
             max_pages: Максимальное количество страниц для парсинга
             max_vacancies: Максимальное количество вакансий (None = все)
+            date_from: Искать только вакансии, опубликованные не раньше (ISO 8601)
 
         Returns:
             List[Dict]: Список вакансий с краткой информацией
@@ -64,12 +68,138 @@ class IVacancyDetailsFetcher(ABC):
         """
         pass
 
+    async def iter_details_async(self, vacancy_ids: List[str]) -> AsyncIterator[Dict]:
+        """
+        Асинхронный итератор по вакансиям с детальной информацией.
+
+        Реализация по умолчанию выполняет fetch_details в отдельном потоке
+        и отдает результат целиком. Асинхронные реализации переопределяют
+        метод и отдают вакансии по мере получения (порядок не гарантируется).
+
+        Args:
+            vacancy_ids: Список идентификаторов вакансий
+
+        Yields:
+            Dict: Вакансия с детальной информацией
+        """
+        loop = asyncio.get_running_loop()
+        vacancies = await loop.run_in_executor(None, self.fetch_details, vacancy_ids)
+
+        for vacancy in vacancies:
+            yield vacancy
+
     @abstractmethod
     def get_error_statistics(self) -> Dict:
         """Возвращает статистику по ошибкам"""
         pass
 
 
+# ==================== КЭШИРОВАНИЕ ====================
+
+@dataclass
+class CachedVacancy:
+    """Запись кэша вакансии вместе с валидаторами для условных запросов"""
+    data: Dict
+    fetched_at: float
+    is_fresh: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def can_revalidate(self) -> bool:
+        """Можно ли проверить актуальность записи условным запросом"""
+        return bool(self.etag or self.last_modified)
+
+
+class IVacancyCache(ABC):
+    """
+    Интерфейс постоянного кэша детальной информации о вакансиях.
+
+    Определяет контракт для хранилищ, которые позволяют не запрашивать
+    повторно уже полученные вакансии.
+    """
+
+    @abstractmethod
+    def get(self, vacancy_id: str) -> Optional[Dict]:
+        """
+        Получение вакансии из кэша.
+
+        Args:
+            vacancy_id: Идентификатор вакансии
+
+        Returns:
+            Optional[Dict]: Данные вакансии или None, если записи нет или она устарела
+        """
+        pass
+
+    @abstractmethod
+    def set(
+            self,
+            vacancy_id: str,
+            data: Dict,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None
+    ) -> None:
+        """
+        Сохранение вакансии в кэш.
+
+        Args:
+            vacancy_id: Идентификатор вакансии
+            data: Ответ API с детальной информацией
+            etag: Заголовок ETag ответа
+            last_modified: Заголовок Last-Modified ответа
+        """
+        pass
+
+    @abstractmethod
+    def get_entries(self, vacancy_ids: List[str]) -> Dict[str, CachedVacancy]:
+        """
+        Получение записей кэша, включая устаревшие.
+
+        Устаревшие записи с ETag/Last-Modified можно обновить условным
+        запросом вместо полной загрузки.
+
+        Args:
+            vacancy_ids: Список идентификаторов вакансий
+
+        Returns:
+            Dict[str, CachedVacancy]: Найденные записи по ID вакансий
+        """
+        pass
+
+    @abstractmethod
+    def touch(self, vacancy_id: str) -> None:
+        """
+        Продление срока жизни записи (ответ 304 Not Modified).
+
+        Args:
+            vacancy_id: Идентификатор вакансии
+        """
+        pass
+
+    def get_many(self, vacancy_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Получение нескольких вакансий из кэша.
+
+        Args:
+            vacancy_ids: Список идентификаторов вакансий
+
+        Returns:
+            Dict[str, Dict]: Найденные вакансии по их ID
+        """
+        found = {}
+        for vacancy_id in vacancy_ids:
+            data = self.get(vacancy_id)
+            if data is not None:
+                found[vacancy_id] = data
+        return found
+
+    @abstractmethod
+    def get_statistics(self) -> Dict:
+        """Возвращает статистику использования кэша"""
+        pass
+
+
 # ==================== СОХРАНЕНИЕ ДАННЫХ ====================
 
 # ==================== СОХРАНЕНИЕ ДАННЫХ ====================
@@ -250,12 +380,21 @@ class ITextSectionExtractor(ABC):
     """
 
     @abstractmethod
-    def extract(self, text: str) -> List[str]:
+    def extract(
+            self,
+            text: str,
+            layout: Optional[Any] = None,
+            folded: Optional[Dict[str, str]] = None
+    ) -> List[str]:
         """
         Извлечение релевантных секций из текста.
 
         Args:
             text: Очищенный текст вакансии
+            layout: Разметка текста на секции (DescriptionLayout), общая
+                для экстракторов одного документа (None - размечается экстрактором)
+            folded: Формы fold элементов документа, общие для экстракторов
+                и классификатора (дополняются)
 
         Returns:
             List[str]: Список извлеченных элементов
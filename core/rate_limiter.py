@@ -0,0 +1,170 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict
+import asyncio
+import threading
+import time
+
+
+class IRateLimiter(ABC):
+    """Интерфейс ограничителя частоты запросов (Strategy Pattern)"""
+
+    @abstractmethod
+    async def acquire(self) -> None:
+        """Ожидает разрешения на следующий запрос (asyncio)"""
+        pass
+
+    @abstractmethod
+    def acquire_sync(self) -> None:
+        """Ожидает разрешения на следующий запрос (блокирующая версия)"""
+        pass
+
+    @abstractmethod
+    def get_statistics(self) -> Dict:
+        """Возвращает статистику для мониторинга"""
+        pass
+
+
+class TokenBucketRateLimiter(IRateLimiter):
+    """
+    Ограничитель частоты по алгоритму Token Bucket
+
+    Токены пополняются со скоростью rate в секунду, но не больше burst.
+    Каждый запрос забирает токен; если токенов нет, запрос резервирует
+    следующий и ждёт ровно до момента его появления (порядок FIFO).
+    Один экземпляр можно разделять между поисковиком и fetcher'ом,
+    а также между потоками и циклами событий.
+    """
+
+    def __init__(
+            self,
+            rate: float = 8.0,
+            burst: int = 10,
+            window: float = 10.0
+    ):
+        """
+        Args:
+            rate: Разрешённое количество запросов в секунду
+            burst: Максимальное количество запросов подряд без ожидания
+            window: Окно (в секундах) для расчёта фактической скорости
+        """
+        if rate <= 0:
+            raise ValueError("rate должен быть положительным")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.window = window
+
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self._grants = deque()  # Моменты выдачи разрешений
+        self._waiting = 0
+        self.total_acquired = 0
+        self.total_wait_time = 0.0
+
+    async def acquire(self) -> None:
+        """
+        Ожидает токен, не блокируя цикл событий.
+
+        Токен резервируется сразу, поэтому конкурентные корутины
+        получают разрешения в порядке вызова.
+        """
+        delay = self._reserve()
+        if delay <= 0:
+            return
+
+        self._change_waiting(1)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._change_waiting(-1)
+
+    def acquire_sync(self) -> None:
+        """
+        Ожидает токен, блокируя текущий поток.
+
+        Резервирование общее с acquire, поэтому лимит соблюдается
+        и при смешанном использовании из потоков и корутин.
+        """
+        delay = self._reserve()
+        if delay <= 0:
+            return
+
+        self._change_waiting(1)
+        try:
+            time.sleep(delay)
+        finally:
+            self._change_waiting(-1)
+
+    def _reserve(self) -> float:
+        """Резервирует токен и возвращает время ожидания до него"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+
+            # Отрицательный баланс - очередь уже зарезервированных токенов
+            self._tokens -= 1
+            delay = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+            self._grants.append(now + delay)
+            self._trim_grants(now)
+            self.total_acquired += 1
+            self.total_wait_time += delay
+
+            return delay
+
+    def _trim_grants(self, now: float) -> None:
+        """Удаляет выдачи старше окна (вызывается под блокировкой)"""
+        # Моменты выдачи не убывают (резервирование в порядке FIFO)
+        while self._grants and self._grants[0] < now - self.window:
+            self._grants.popleft()
+
+    def _change_waiting(self, delta: int) -> None:
+        """Изменяет счетчик ожидающих токен запросов (для queue_depth)"""
+        with self._lock:
+            self._waiting += delta
+
+    @property
+    def current_rate(self) -> float:
+        """Фактическая скорость запросов за последнее окно (запросов/с)"""
+        with self._lock:
+            now = time.monotonic()
+            self._trim_grants(now)
+
+            granted = sum(1 for moment in self._grants if moment <= now)
+
+        return granted / self.window
+
+    @property
+    def queue_depth(self) -> int:
+        """Количество запросов, ожидающих токен"""
+        with self._lock:
+            return self._waiting
+
+    def get_statistics(self) -> Dict:
+        """
+        Статистика ограничителя.
+
+        Returns:
+            Dict: Лимит, burst, фактическая скорость за окно, глубина
+                очереди, количество выданных токенов и среднее ожидание
+        """
+        avg_wait = (
+            self.total_wait_time / self.total_acquired
+            if self.total_acquired else 0.0
+        )
+
+        return {
+            'rate_limit': self.rate,
+            'burst': self.burst,
+            'current_rate': round(self.current_rate, 2),
+            'queue_depth': self.queue_depth,
+            'total_acquired': self.total_acquired,
+            'avg_wait': round(avg_wait, 3)
+        }
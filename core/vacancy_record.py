@@ -0,0 +1,166 @@
+"""
+Модуль компактной записи вакансии.
+Ответ API о вакансии содержит десятки вложенных полей, из которых
+анализ и обработка описаний используют около пятнадцати. Запись
+хранит только их в слотах (без словаря атрибутов), а повторяющиеся
+строки (компания, регион, формат работы, станции метро, навыки)
+интернируются и хранятся в памяти один раз на весь запуск.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+class VacancyRecord:
+    """
+    Вакансия в объеме, нужном VacancyAnalyzer и процессору описаний.
+
+    Значения совпадают с колонками VacancyAnalyzer.extract_data;
+    списки навыков и станций метро хранятся кортежами.
+    """
+
+    __slots__ = (
+        'id',
+        'name',
+        'published_at',
+        'company',
+        'company_url',
+        'salary_from',
+        'salary_to',
+        'currency',
+        'experience',
+        'schedule',
+        'description',
+        'key_skills',
+        'url',
+        'area',
+        'metro_stations',
+        'employment',
+    )
+
+    def __init__(
+            self,
+            id: Any = None,
+            name: Optional[str] = None,
+            published_at: Optional[str] = None,
+            company: Optional[str] = None,
+            company_url: Optional[str] = None,
+            salary_from: Optional[float] = None,
+            salary_to: Optional[float] = None,
+            currency: Optional[str] = None,
+            experience: Optional[str] = None,
+            schedule: Optional[str] = None,
+            description: Optional[str] = '',
+            key_skills: Tuple[str, ...] = (),
+            url: Optional[str] = None,
+            area: Optional[str] = None,
+            metro_stations: Tuple[str, ...] = (),
+            employment: Optional[str] = None
+    ):
+        self.id = id
+        self.name = name
+        self.published_at = published_at
+        self.company = company
+        self.company_url = company_url
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.currency = currency
+        self.experience = experience
+        self.schedule = schedule
+        self.description = description
+        self.key_skills = key_skills
+        self.url = url
+        self.area = area
+        self.metro_stations = metro_stations
+        self.employment = employment
+
+    @classmethod
+    def from_api(cls, vacancy: Dict) -> 'VacancyRecord':
+        """
+        Проекция ответа API о вакансии.
+
+        Args:
+            vacancy: Словарь с данными вакансии (ответ API)
+
+        Returns:
+            VacancyRecord: Компактная запись
+        """
+        salary = vacancy.get('salary')
+        employer = vacancy.get('employer', {})
+
+        return cls(
+            id=vacancy.get('id'),
+            name=vacancy.get('name'),
+            published_at=vacancy.get('published_at'),
+            company=_intern(employer.get('name')) if employer else None,
+            company_url=_intern(employer.get('alternate_url')) if employer else None,
+            salary_from=salary.get('from') if salary else None,
+            salary_to=salary.get('to') if salary else None,
+            currency=_intern(salary.get('currency')) if salary else None,
+            experience=_name(vacancy, 'experience'),
+            schedule=_name(vacancy, 'schedule'),
+            description=vacancy.get('description', ''),
+            key_skills=tuple(_intern(skill['name']) for skill in vacancy.get('key_skills') or ()),
+            url=vacancy.get('alternate_url'),
+            area=_name(vacancy, 'area'),
+            metro_stations=tuple(_intern(station) for station in _metro_stations(vacancy.get('address'))),
+            employment=_name(vacancy, 'employment'),
+        )
+
+    def __repr__(self) -> str:
+        return f'VacancyRecord(id={self.id!r}, name={self.name!r}, company={self.company!r})'
+
+
+def as_record(vacancy: Union[Dict, VacancyRecord]) -> VacancyRecord:
+    """Запись вакансии (ответ API проецируется, запись возвращается как есть)"""
+    if isinstance(vacancy, VacancyRecord):
+        return vacancy
+
+    return VacancyRecord.from_api(vacancy)
+
+
+def to_records(vacancies: List[Dict]) -> List[VacancyRecord]:
+    """Проекция списка ответов API"""
+    return [as_record(vacancy) for vacancy in vacancies]
+
+
+def _name(vacancy: Dict, field: str) -> Optional[str]:
+    """Название из справочного поля вида {'id': ..., 'name': ...}"""
+    value = vacancy.get(field)
+    return _intern(value.get('name')) if value else None
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _metro_stations(address: Optional[Dict]) -> List[str]:
+    """
+    Извлечение названий станций метро из адреса.
+
+    Args:
+        address: Словарь с информацией об адресе
+
+    Returns:
+        List[str]: Список названий станций метро
+    """
+    metro_stations = []
+
+    if not address or not address.get('metro'):
+        return metro_stations
+
+    metro = address.get('metro', {})
+
+    # Обработка различных форматов данных метро
+    if isinstance(metro, dict):
+        station_name = metro.get('station_name', '')
+        if station_name:
+            metro_stations.append(station_name)
+    elif isinstance(metro, list):
+        metro_stations = [
+            m.get('station_name', '')
+            for m in metro
+            if m.get('station_name')
+        ]
+
+    return metro_stations
@@ -5,9 +5,13 @@
 """
 
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
+from extractors.pattern_matcher import MultiPatternMatcher, TextMatches
+
 
 class ItemType(Enum):
     """Тип элемента."""
@@ -202,36 +206,49 @@ class VacancyItemClassifier:
         r'(?:будет\s+)?(?:преимуществом|плюсом)',
     ]
 
+    # Начала фраз, характерные для маркетинговых текстов
+    MARKETING_STARTS = (
+        'уникальн', 'отличн', 'прекрасн', 'превосходн',
+        'мы предлагаем', 'что мы', 'наша компания', 'наша цель',
+        'если вы', 'если тебе', 'ждем', 'будем рады',
+        'за 15 лет', 'за 10 лет', 'мы помогли',
+        'максимальное влияние', 'работа в постоянно',
+        'стабильная зарплата', 'адекватное',
+    )
+
+    # Информация о компании (проверяется по тексту в нижнем регистре)
+    COMPANY_INFO_PATTERNS = [
+        r'помогли\s+\d+\+?\s*компани',
+        r'внедрить\s+системное\s+управление',
+        r'компания\s+(?:работает|специализируется)',
+    ]
+
+    # Метки classify_batch по номеру решения
+    BATCH_LABELS = (
+        ItemType.UNKNOWN,
+        ItemType.NOISE,
+        ItemType.REQUIREMENT,
+        ItemType.RESPONSIBILITY,
+    )
+
     def __init__(self):
         """Инициализация классификатора."""
         self._compile_patterns()
 
     def _compile_patterns(self):
         """Компиляция регулярных выражений."""
-        self.noise_patterns = [
-            re.compile(p, re.IGNORECASE | re.UNICODE)
-            for p in self.NOISE_PATTERNS
-        ]
-
-        self.req_patterns = [
-            re.compile(p, re.IGNORECASE | re.UNICODE)
-            for p in self.REQUIREMENT_PATTERNS
-        ]
-
-        self.resp_patterns = [
-            re.compile(p, re.IGNORECASE | re.UNICODE)
-            for p in self.RESPONSIBILITY_PATTERNS
-        ]
-
-        self.req_stop_patterns = [
-            re.compile(p, re.IGNORECASE | re.UNICODE)
-            for p in self.REQUIREMENT_STOP_WORDS
-        ]
-
-        self.resp_stop_patterns = [
-            re.compile(p, re.IGNORECASE | re.UNICODE)
-            for p in self.RESPONSIBILITY_STOP_WORDS
-        ]
+        # Все семейства паттернов проверяются одним сопоставителем
+        self.matcher = MultiPatternMatcher({
+            'noise': self.NOISE_PATTERNS,
+            'requirement': self.REQUIREMENT_PATTERNS,
+            'responsibility': self.RESPONSIBILITY_PATTERNS,
+            'requirement_stop': self.REQUIREMENT_STOP_WORDS,
+            'responsibility_stop': self.RESPONSIBILITY_STOP_WORDS,
+        })
+
+        self.company_info_pattern = re.compile(
+            '|'.join(f'(?:{p})' for p in self.COMPANY_INFO_PATTERNS)
+        )
 
     def classify(self, text: str) -> ItemType:
         """
@@ -243,24 +260,21 @@ class VacancyItemClassifier:
         Returns:
             ItemType (REQUIREMENT, RESPONSIBILITY, NOISE или UNKNOWN)
         """
-        if not text or len(text.strip()) < 10:
-            return ItemType.UNKNOWN
+        is_valid, is_noise, req_score, resp_score, req_stop, resp_stop = self._score_item(text)
 
-        text_clean = text.strip()
+        if not is_valid:
+            return ItemType.UNKNOWN
 
         # ПРИОРИТЕТ 1: Проверка на шум
-        if self._is_noise(text_clean):
+        if is_noise:
             return ItemType.NOISE
 
         # ПРИОРИТЕТ 2: Классификация на требование/обязанность
-        req_score = self._calculate_score(text_clean, self.req_patterns)
-        resp_score = self._calculate_score(text_clean, self.resp_patterns)
-
-        # Проверка стоп-слов
-        if self._has_stop_words(text_clean, self.req_stop_patterns):
+        # с учетом стоп-слов
+        if req_stop:
             req_score = max(0, req_score - 2)
 
-        if self._has_stop_words(text_clean, self.resp_stop_patterns):
+        if resp_stop:
             resp_score = max(0, resp_score - 2)
 
         # Принятие решения
@@ -271,58 +285,110 @@ class VacancyItemClassifier:
         else:
             return ItemType.UNKNOWN
 
-    def _is_noise(self, text: str) -> bool:
+    def classify_batch(
+            self,
+            items: List[str],
+            folded: Optional[List[str]] = None
+    ) -> List[ItemType]:
+        """
+        Классификация списка элементов.
+
+        Оценки всех элементов собираются в матрицу, и решения
+        принимаются для всего списка сразу (результат совпадает
+        с поэлементным classify).
+
+        Args:
+            items: Список элементов
+            folded: Уже вычисленные формы fold элементов (None - вычисляются)
+
+        Returns:
+            Список ItemType в порядке элементов
+        """
+        if not items:
+            return []
+
+        if folded is None:
+            folded = [None] * len(items)
+
+        scores = np.array(
+            [self._score_item(item, form) for item, form in zip(items, folded)],
+            dtype=np.int64
+        )
+        is_valid, is_noise, req_score, resp_score, req_stop, resp_stop = scores.T
+
+        # Штраф за стоп-слова
+        req_score = np.where(req_stop > 0, np.maximum(0, req_score - 2), req_score)
+        resp_score = np.where(resp_stop > 0, np.maximum(0, resp_score - 2), resp_score)
+
+        decisions = np.select(
+            [
+                is_valid == 0,
+                is_noise > 0,
+                (req_score > resp_score) & (req_score > 0),
+                (resp_score > req_score) & (resp_score > 0),
+            ],
+            [0, 1, 2, 3],
+            default=0
+        )
+
+        return [self.BATCH_LABELS[decision] for decision in decisions.tolist()]
+
+    def _score_item(
+            self,
+            text: str,
+            folded: Optional[str] = None
+    ) -> Tuple[int, int, int, int, int, int]:
+        """
+        Оценки элемента по семействам паттернов.
+
+        Args:
+            text: Элемент
+            folded: Уже вычисленная форма fold(text) (None - вычисляется)
+
+        Returns:
+            Кортеж (элемент допустим, шум, совпадений требований,
+            совпадений обязанностей, есть стоп-слова требований,
+            есть стоп-слова обязанностей)
+        """
+        if not text or len(text.strip()) < 10:
+            return 0, 0, 0, 0, 0, 0
+
+        text_clean = text.strip()
+
+        # Один просмотр текста для всех семейств паттернов
+        matches = self.matcher.scan(text_clean, folded)
+
+        # Для шума остальные оценки не нужны
+        if self._is_noise(text_clean, matches):
+            return 1, 1, 0, 0, 0, 0
+
+        return (
+            1,
+            0,
+            matches.count('requirement'),
+            matches.count('responsibility'),
+            int(matches.any('requirement_stop')),
+            int(matches.any('responsibility_stop'))
+        )
+
+    def _is_noise(self, text: str, matches: TextMatches) -> bool:
         """Проверка, является ли текст шумом."""
-        for pattern in self.noise_patterns:
-            if pattern.search(text):
-                return True
+        if matches.any('noise'):
+            return True
 
         # Дополнительные эвристики
         # Слишком короткие или слишком длинные
         if len(text) < 15 or len(text) > 500:
             return True
 
-        # Начинается с маркетинговых слов
-        marketing_starts = [
-            'уникальн', 'отличн', 'прекрасн', 'превосходн',
-            'мы предлагаем', 'что мы', 'наша компания', 'наша цель',
-            'если вы', 'если тебе', 'ждем', 'будем рады',
-            'за 15 лет', 'за 10 лет', 'мы помогли',
-            'максимальное влияние', 'работа в постоянно',
-            'стабильная зарплата', 'адекватное',
-        ]
-
-        text_lower = text.lower()
-        for word in marketing_starts:
-            if text_lower.startswith(word):
-                return True
+        # Начинается с маркетинговых слов (форма текста без учета регистра)
+        if matches.folded.startswith(self.MARKETING_STARTS):
+            return True
 
         # Проверка на информацию о компании
-        company_info_patterns = [
-            r'помогли\s+\d+\+?\s*компани',
-            r'внедрить\s+системное\s+управление',
-            r'компания\s+(?:работает|специализируется)',
-        ]
-
-        for pattern in company_info_patterns:
-            if re.search(pattern, text_lower):
-                return True
-
-        return False
+        if self.company_info_pattern.search(matches.folded):
+            return True
 
-    def _calculate_score(self, text: str, patterns: List[re.Pattern]) -> int:
-        """Подсчет количества совпадений с паттернами."""
-        score = 0
-        for pattern in patterns:
-            matches = pattern.findall(text)
-            score += len(matches)
-        return score
-
-    def _has_stop_words(self, text: str, patterns: List[re.Pattern]) -> bool:
-        """Проверка наличия стоп-слов."""
-        for pattern in patterns:
-            if pattern.search(text):
-                return True
         return False
 
     def separate_mixed_items(
@@ -335,15 +401,30 @@ class VacancyItemClassifier:
         Args:
             items: Список элементов для разделения
 
+        Returns:
+            Кортеж (требования, обязанности)
+        """
+        return self.split_by_type(items, self.classify_batch(items))
+
+    @staticmethod
+    def split_by_type(
+            items: List[str],
+            item_types: List[ItemType]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Разделение элементов по результатам классификации.
+
+        Args:
+            items: Список элементов
+            item_types: Тип каждого элемента
+
         Returns:
             Кортеж (требования, обязанности)
         """
         requirements = []
         responsibilities = []
 
-        for item in items:
-            item_type = self.classify(item)
-
+        for item, item_type in zip(items, item_types):
             if item_type == ItemType.REQUIREMENT:
                 requirements.append(item)
             elif item_type == ItemType.RESPONSIBILITY:
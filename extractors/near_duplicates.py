@@ -0,0 +1,397 @@
+"""
+Модуль поиска почти-дубликатов среди извлеченных элементов.
+Заменяет попарное сравнение всех элементов через SequenceMatcher
+индексом по символьным биграммам: точное сравнение выполняется
+только для кандидатов, которые могут достичь порога схожести.
+Для всего корпуса формулировки группируются кластеризацией
+на основе MinHash/LSH.
+"""
+
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class NearDuplicateIndex:
+    """
+    Дедупликация с сохранением более длинной версии.
+
+    Повторяет прежнюю логику экстракторов: элемент с уже встречавшейся
+    нормализованной формой отбрасывается; иначе ищется первый
+    (в порядке добавления) сохраненный элемент со схожестью
+    SequenceMatcher >= similarity_threshold - если новый элемент длиннее,
+    он заменяет найденный (и встает в конец), иначе отбрасывается.
+
+    Отсев кандидатов не меняет результат, так как отбрасывает только
+    пары, схожесть которых заведомо ниже порога:
+    - по длинам: ratio <= 2 * min(a, b) / (a + b);
+    - по общим биграммам: если ratio >= t, строки отличаются не более
+      чем на k = (1 - t) * (a + b) вставок/удалений, а каждая правка
+      затрагивает не больше двух биграмм, поэтому общих биграмм
+      не меньше max(a, b) - 1 - 2 * k.
+    """
+
+    NGRAM_SIZE = 2
+    FLOAT_TOLERANCE = 1e-6
+
+    def __init__(
+            self,
+            similarity_threshold: float,
+            normalize: Callable[[str], str]
+    ):
+        """
+        Args:
+            similarity_threshold: Порог схожести (0.0 - 1.0)
+            normalize: Функция нормализации текста для сравнения
+        """
+        self.similarity_threshold = similarity_threshold
+        self.normalize = normalize
+
+        # Сохраненные элементы в порядке добавления: id -> (элемент, нормализованный текст)
+        self._items: Dict[int, Tuple[str, str]] = {}
+        self._matchers: Dict[int, SequenceMatcher] = {}
+        self._grams: Dict[int, Counter] = {}
+        self._ids_by_normalized: Dict[str, int] = {}
+
+        # Инвертированный индекс: биграмма -> {id: количество вхождений}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._next_id = 0
+
+    def add(self, item: str, normalized: Optional[str] = None) -> bool:
+        """
+        Добавление элемента.
+
+        Args:
+            item: Элемент (требование или обязанность)
+            normalized: Уже вычисленная нормализованная форма (None - через normalize)
+
+        Returns:
+            bool: True, если элемент сохранен
+        """
+        if normalized is None:
+            normalized = self.normalize(item)
+
+        if normalized in self._ids_by_normalized:
+            return False
+
+        similar_id = self._find_similar(normalized)
+
+        if similar_id is not None:
+            # Оставляем более длинную версию
+            if len(item) > len(self._items[similar_id][0]):
+                self._remove(similar_id)
+            else:
+                return False
+
+        self._insert(item, normalized)
+        return True
+
+    def items(self) -> List[str]:
+        """Сохраненные элементы в порядке добавления"""
+        return [item for item, _ in self._items.values()]
+
+    def _find_similar(self, normalized: str) -> Optional[int]:
+        """Первый сохраненный элемент со схожестью не ниже порога"""
+        threshold = self.similarity_threshold
+        length = len(normalized)
+        grams = _ngrams(normalized, self.NGRAM_SIZE)
+
+        if self._min_shared_grams(length, length) > 0:
+            # Строки без общих биграмм заведомо непохожи - кандидаты
+            # берутся из индекса вместе с количеством общих биграмм
+            shared: Dict[int, int] = {}
+            for gram, count in grams.items():
+                for item_id, other_count in self._postings.get(gram, {}).items():
+                    shared[item_id] = shared.get(item_id, 0) + min(count, other_count)
+            candidate_ids = sorted(shared)
+        else:
+            # Короткие строки или низкий порог: проверяются все элементы
+            shared = None
+            candidate_ids = list(self._items)
+
+        for item_id in candidate_ids:
+            other_length = len(self._items[item_id][1])
+            total = length + other_length
+
+            # Та же формула, что и в SequenceMatcher.ratio (2.0 * M / T)
+            if not total or 2.0 * min(length, other_length) / total < threshold:
+                continue
+
+            if shared is not None and shared[item_id] < self._min_shared_grams(length, other_length):
+                continue
+
+            matcher = self._matchers[item_id]
+            matcher.set_seq1(normalized)
+
+            if matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
+                return item_id
+
+        return None
+
+    def _min_shared_grams(self, length: int, other_length: int) -> float:
+        """Нижняя граница общих биграмм для пары, достигающей порога"""
+        max_edits = (1 - self.similarity_threshold) * (length + other_length)
+        bound = (
+            max(length, other_length) - (self.NGRAM_SIZE - 1)
+            - self.NGRAM_SIZE * max_edits
+        )
+        # Запас на погрешность вычислений с плавающей точкой
+        return bound - self.FLOAT_TOLERANCE
+
+    def _insert(self, item: str, normalized: str) -> None:
+        item_id = self._next_id
+        self._next_id += 1
+
+        self._items[item_id] = (item, normalized)
+        self._ids_by_normalized[normalized] = item_id
+
+        # Сравниваемый элемент - второй аргумент SequenceMatcher (как
+        # в прежнем коде); его индекс символов строится один раз
+        self._matchers[item_id] = SequenceMatcher(None, '', normalized)
+
+        grams = _ngrams(normalized, self.NGRAM_SIZE)
+        self._grams[item_id] = grams
+        for gram, count in grams.items():
+            self._postings.setdefault(gram, {})[item_id] = count
+
+    def _remove(self, item_id: int) -> None:
+        _, normalized = self._items.pop(item_id)
+        del self._ids_by_normalized[normalized]
+        del self._matchers[item_id]
+
+        for gram in self._grams.pop(item_id):
+            postings = self._postings[gram]
+            del postings[item_id]
+            if not postings:
+                del self._postings[gram]
+
+
+def deduplicate(
+        items: List[str],
+        similarity_threshold: float,
+        normalize: Callable[[str], str],
+        normalized: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Удаление почти-дубликатов с сохранением более длинных версий.
+
+    Args:
+        items: Список элементов
+        similarity_threshold: Порог схожести (0.0 - 1.0)
+        normalize: Функция нормализации текста для сравнения
+        normalized: Уже вычисленные нормализованные формы элементов
+            (None - вычисляются через normalize)
+
+    Returns:
+        Список уникальных элементов
+    """
+    index = NearDuplicateIndex(similarity_threshold, normalize)
+
+    if normalized is None:
+        normalized = [None] * len(items)
+
+    for item, form in zip(items, normalized):
+        index.add(item, form)
+
+    return index.items()
+
+
+def _ngrams(text: str, size: int) -> Counter:
+    return Counter(text[i:i + size] for i in range(len(text) - size + 1))
+
+
+@dataclass
+class PhraseCluster:
+    """Группа похожих формулировок"""
+    representative: str  # Самая частая формулировка
+    count: int  # Суммарная частота всех формулировок
+    variants: List[str]  # Все формулировки группы
+
+
+class PhraseClusterer:
+    """
+    Группировка похожих формулировок по всему корпусу.
+
+    1. Одинаковые после нормализации формулировки объединяются сразу.
+    2. Формулировки обходятся по убыванию частоты. Каждая сравнивается
+       с лидерами уже созданных групп и присоединяется к первому
+       похожему; если похожего нет - сама становится лидером новой группы.
+    3. Кандидаты в лидеры ищутся через MinHash-подписи по символьным
+       триграммам, разбитые на полосы (LSH): проверяются только лидеры,
+       совпавшие с формулировкой хотя бы в одной полосе (не более
+       MAX_CANDIDATES с наибольшим числом совпадений), той же мерой,
+       что и при дедупликации (SequenceMatcher).
+
+    Сравнение только с лидером не дает группам "расползаться" по
+    цепочкам похожих формулировок, а индекс содержит лишь лидеров,
+    поэтому время растет почти линейно с размером корпуса.
+    """
+
+    SHINGLE_SIZE = 3
+    MAX_CANDIDATES = 8
+    MAX_CACHED_MATCHERS = 20_000
+
+    # Простое число Мерсенна для универсального хэширования (a * x + b) mod p
+    _PRIME = (1 << 31) - 1
+
+    def __init__(
+            self,
+            similarity_threshold: float = 0.85,
+            num_perm: int = 64,
+            bands: int = 16,
+            batch_size: int = 2000,
+            seed: int = 1
+    ):
+        """
+        Args:
+            similarity_threshold: Порог схожести формулировок (0.0 - 1.0)
+            num_perm: Длина MinHash-подписи
+            bands: Количество полос LSH (num_perm должно делиться на bands)
+            batch_size: Количество формулировок в одной векторной операции
+            seed: Зерно генератора хэш-функций (для воспроизводимости)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm должно делиться на bands")
+
+        self.similarity_threshold = similarity_threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.batch_size = batch_size
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, self._PRIME, size=(num_perm, 1)).astype(np.int64)
+        self._b = rng.randint(0, self._PRIME, size=(num_perm, 1)).astype(np.int64)
+        self._band_weights = rng.randint(1, self._PRIME, size=self.rows).astype(np.int64)
+
+    def cluster(self, counts: Dict[str, int]) -> List[PhraseCluster]:
+        """
+        Кластеризация формулировок.
+
+        Args:
+            counts: Частота каждой формулировки
+
+        Returns:
+            List[PhraseCluster]: Группы по убыванию суммарной частоты
+        """
+        # Шаг 1: точные совпадения после нормализации
+        phrases_by_normalized: Dict[str, List[str]] = {}
+        for phrase in counts:
+            phrases_by_normalized.setdefault(normalize_phrase(phrase), []).append(phrase)
+
+        # Самые частые формулировки становятся лидерами групп
+        texts = sorted(
+            phrases_by_normalized,
+            key=lambda text: (-sum(counts[p] for p in phrases_by_normalized[text]), text)
+        )
+
+        # Шаги 2-3: присоединение к лидерам через индекс LSH
+        leader_of: List[int] = []
+        index: List[Dict[int, List[int]]] = [{} for _ in range(self.bands)]
+        matchers: Dict[int, SequenceMatcher] = {}
+
+        for start in range(0, len(texts), self.batch_size):
+            band_keys = self._band_keys(texts[start:start + self.batch_size])
+
+            for offset, keys in enumerate(band_keys.tolist()):
+                item_id = start + offset
+
+                hits = Counter()
+                for band, key in enumerate(keys):
+                    hits.update(index[band].get(key, ()))
+
+                leader = None
+                for candidate, _ in hits.most_common(self.MAX_CANDIDATES):
+                    if self._is_similar(texts[item_id], candidate, texts, matchers):
+                        leader = candidate
+                        break
+
+                if leader is None:
+                    leader = item_id
+                    for band, key in enumerate(keys):
+                        index[band].setdefault(key, []).append(item_id)
+
+                leader_of.append(leader)
+
+        # Сборка групп
+        groups: Dict[int, List[str]] = {}
+        for item_id, text in enumerate(texts):
+            groups.setdefault(leader_of[item_id], []).extend(phrases_by_normalized[text])
+
+        clusters = []
+        for variants in groups.values():
+            variants.sort(key=lambda phrase: (-counts[phrase], -len(phrase), phrase))
+            clusters.append(PhraseCluster(
+                representative=variants[0],
+                count=sum(counts[phrase] for phrase in variants),
+                variants=variants
+            ))
+
+        clusters.sort(key=lambda cluster: (-cluster.count, cluster.representative))
+
+        return clusters
+
+    def _is_similar(
+            self,
+            text: str,
+            leader: int,
+            texts: List[str],
+            matchers: Dict[int, SequenceMatcher]
+    ) -> bool:
+        """Проверка схожести с лидером группы"""
+        leader_text = texts[leader]
+        total = len(text) + len(leader_text)
+
+        if not total or 2.0 * min(len(text), len(leader_text)) / total < self.similarity_threshold:
+            return False
+
+        # Индекс символов лидера строится один раз (кэш ограничен по размеру)
+        matcher = matchers.get(leader)
+        if matcher is None:
+            if len(matchers) >= self.MAX_CACHED_MATCHERS:
+                matchers.clear()
+            matcher = matchers[leader] = SequenceMatcher(None, '', leader_text)
+
+        matcher.set_seq1(text)
+
+        return (
+            matcher.quick_ratio() >= self.similarity_threshold
+            and matcher.ratio() >= self.similarity_threshold
+        )
+
+    def _band_keys(self, texts: List[str]) -> np.ndarray:
+        """Ключи полос LSH для пачки формулировок (матрица len(texts) x bands)"""
+        signatures = self._signatures(texts).reshape(len(texts), self.bands, self.rows)
+
+        # Полоса сворачивается в одно число (переполнение int64 допустимо)
+        with np.errstate(over='ignore'):
+            return (signatures * self._band_weights).sum(axis=2)
+
+    def _signatures(self, texts: List[str]) -> np.ndarray:
+        """MinHash-подписи пачки формулировок (матрица len(texts) x num_perm)"""
+        shingle_hashes = []
+        offsets = []
+
+        for text in texts:
+            offsets.append(len(shingle_hashes))
+            shingles = {
+                text[i:i + self.SHINGLE_SIZE]
+                for i in range(max(1, len(text) - self.SHINGLE_SIZE + 1))
+            }
+            shingle_hashes.extend(
+                zlib.crc32(shingle.encode('utf-8')) % self._PRIME for shingle in shingles
+            )
+
+        hashes = np.array(shingle_hashes, dtype=np.int64)
+        permuted = (self._a * hashes + self._b) % self._PRIME
+
+        return np.minimum.reduceat(permuted, offsets, axis=1).T
+
+
+def normalize_phrase(text: str) -> str:
+    """Нормализация формулировки для группировки"""
+    return ' '.join(text.lower().rstrip('.;,').split())
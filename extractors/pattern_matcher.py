@@ -0,0 +1,258 @@
+"""
+Модуль сопоставления текста с семействами регулярных выражений.
+Вместо последовательного запуска каждого паттерна текст один раз
+проверяется на наличие обязательных подстрок (литералов, извлеченных
+из самих выражений), и запускаются только паттерны, которые могут
+совпасть.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+try:
+    import re._parser as sre_parse
+    from re._constants import (
+        LITERAL, SUBPATTERN, BRANCH, MAX_REPEAT, MIN_REPEAT
+    )
+except ImportError:  # Python < 3.11
+    import sre_parse
+    from sre_constants import (
+        LITERAL, SUBPATTERN, BRANCH, MAX_REPEAT, MIN_REPEAT
+    )
+
+
+class PatternFamily:
+    """Скомпилированное семейство паттернов"""
+
+    def __init__(self, patterns: List[str], flags: int):
+        """
+        Args:
+            patterns: Регулярные выражения семейства
+            flags: Флаги компиляции
+        """
+        self.compiled = [re.compile(p, flags) for p in patterns]
+
+        # Для каждого паттерна - набор литералов, один из которых обязан
+        # встретиться в тексте при совпадении (None - отсев невозможен)
+        self.anchors: List[Optional[FrozenSet[str]]] = [
+            required_literals(p, flags) for p in patterns
+        ]
+
+        # Литерал -> номера паттернов, которым он нужен
+        self._by_anchor: Dict[str, List[int]] = {}
+        self._always: List[int] = []
+
+        for index, anchors in enumerate(self.anchors):
+            if anchors is None:
+                self._always.append(index)
+                continue
+            for anchor in anchors:
+                self._by_anchor.setdefault(anchor, []).append(index)
+
+    def candidates(self, present: FrozenSet[str]) -> List[re.Pattern]:
+        """Паттерны, обязательные литералы которых есть в тексте"""
+        indexes = set(self._always)
+        for anchor in present:
+            indexes.update(self._by_anchor.get(anchor, ()))
+
+        return [self.compiled[index] for index in sorted(indexes)]
+
+
+class MultiPatternMatcher:
+    """
+    Сопоставление текста с несколькими семействами паттернов.
+
+    Текст просматривается один раз на наличие обязательных литералов
+    всех семейств; после этого запускаются только паттерны, которые
+    могут совпасть. Результаты не отличаются от последовательного
+    запуска всех паттернов: any - как pattern.search по каждому,
+    count - как сумма len(pattern.findall(text)).
+    """
+
+    def __init__(
+            self,
+            families: Dict[str, List[str]],
+            flags: int = re.IGNORECASE | re.UNICODE
+    ):
+        """
+        Args:
+            families: Название семейства -> список регулярных выражений
+            flags: Флаги компиляции
+        """
+        self.families = {
+            name: PatternFamily(patterns, flags)
+            for name, patterns in families.items()
+        }
+
+        self._all_anchors = sorted({
+            anchor
+            for family in self.families.values()
+            for anchors in family.anchors if anchors
+            for anchor in anchors
+        })
+
+    def scan(self, text: str, folded: Optional[str] = None) -> 'TextMatches':
+        """
+        Просмотр текста на наличие обязательных литералов.
+
+        Args:
+            text: Текст
+            folded: Уже вычисленная форма fold(text) (None - вычисляется)
+
+        Returns:
+            TextMatches: Результаты, по которым считаются совпадения семейств
+        """
+        if folded is None:
+            folded = fold(text)
+        present = frozenset(anchor for anchor in self._all_anchors if anchor in folded)
+
+        return TextMatches(self, text, folded, present)
+
+    def match_families(
+            self,
+            text: str,
+            families: Optional[Iterable[str]] = None
+    ) -> Dict[str, int]:
+        """
+        Количество совпадений по каждому семейству.
+
+        Args:
+            text: Текст
+            families: Семейства (None - все)
+
+        Returns:
+            Dict[str, int]: Название семейства -> количество совпадений
+        """
+        matches = self.scan(text)
+
+        return {
+            family: matches.count(family)
+            for family in (families if families is not None else self.families)
+        }
+
+
+class TextMatches:
+    """Совпадения одного текста с семействами паттернов"""
+
+    def __init__(
+            self,
+            matcher: MultiPatternMatcher,
+            text: str,
+            folded: str,
+            present: FrozenSet[str]
+    ):
+        self.matcher = matcher
+        self.text = text
+        self.folded = folded
+        self.present = present
+
+    def any(self, family: str) -> bool:
+        """Есть ли совпадение хотя бы с одним паттерном семейства"""
+        return any(
+            pattern.search(self.text)
+            for pattern in self.matcher.families[family].candidates(self.present)
+        )
+
+    def count(self, family: str) -> int:
+        """Сумма количеств непересекающихся совпадений по паттернам семейства"""
+        return sum(
+            len(pattern.findall(self.text))
+            for pattern in self.matcher.families[family].candidates(self.present)
+        )
+
+
+def fold(text: str) -> str:
+    """Нормализованная форма текста для сравнения без учета регистра"""
+    return text.strip().casefold()
+
+
+def fold_all(items: List[str], cache: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Нормализованные формы элементов.
+
+    Args:
+        items: Элементы
+        cache: Уже вычисленные формы по элементу (дополняется новыми)
+
+    Returns:
+        List[str]: Форма fold каждого элемента
+    """
+    if cache is None:
+        return [fold(item) for item in items]
+
+    forms = []
+    for item in items:
+        form = cache.get(item)
+        if form is None:
+            form = cache[item] = fold(item)
+        forms.append(form)
+
+    return forms
+
+
+def required_literals(pattern: str, flags: int = 0) -> Optional[FrozenSet[str]]:
+    """
+    Литералы, один из которых содержится в любом совпадении паттерна.
+
+    Литералы приводятся к casefold, поэтому проверка по тексту
+    в casefold верна и для паттернов с IGNORECASE.
+
+    Args:
+        pattern: Регулярное выражение
+        flags: Флаги компиляции
+
+    Returns:
+        Набор литералов или None, если его не удалось определить
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except (re.error, TypeError, ValueError):
+        return None
+
+    literals = _sequence_literals(list(parsed))
+    if not literals:
+        return None
+
+    return frozenset(literal.casefold() for literal in literals)
+
+
+def _sequence_literals(items: List[Tuple]) -> Optional[FrozenSet[str]]:
+    """Лучший набор обязательных литералов для последовательности узлов"""
+    best: Optional[FrozenSet[str]] = None
+    run: List[str] = []
+
+    def consider(candidate: Optional[FrozenSet[str]]) -> None:
+        nonlocal best
+        if candidate and (best is None or _literal_rank(candidate) > _literal_rank(best)):
+            best = candidate
+
+    for op, av in items:
+        if op is LITERAL:
+            run.append(chr(av))
+            continue
+
+        # Любой другой узел прерывает цепочку подряд идущих символов
+        if run:
+            consider(frozenset([''.join(run)]))
+            run = []
+
+        if op is SUBPATTERN:
+            consider(_sequence_literals(list(av[-1])))
+        elif op is BRANCH:
+            alternatives = [_sequence_literals(list(branch)) for branch in av[1]]
+            if all(alternatives):
+                consider(frozenset().union(*alternatives))
+        elif op in (MAX_REPEAT, MIN_REPEAT):
+            min_count, _, subpattern = av
+            if min_count >= 1:
+                consider(_sequence_literals(list(subpattern)))
+
+    if run:
+        consider(frozenset([''.join(run)]))
+
+    return best
+
+
+def _literal_rank(literals: FrozenSet[str]) -> Tuple[int, int]:
+    """Чем длиннее самый короткий литерал и чем меньше вариантов, тем лучше"""
+    return min(len(literal) for literal in literals), -len(literals)
@@ -4,9 +4,11 @@
 """
 
 import re
-from typing import List
-from difflib import SequenceMatcher
+from typing import Dict, List, Optional
 from core.interfaces import ITextSectionExtractor
+from extractors.section_segmenter import DescriptionLayout, SectionSegmenter, SectionType
+from extractors.near_duplicates import deduplicate
+from extractors.pattern_matcher import fold, fold_all
 
 
 class RequirementsExtractor(ITextSectionExtractor):
@@ -113,6 +115,24 @@ class RequirementsExtractor(ITextSectionExtractor):
         r'какие задачи:?',
     ]
 
+    # Заголовки (в начале строки перед ':'), завершающие секцию
+    SECTION_END_HEADERS = [
+        'обязанности',
+        'задачи',
+        'responsibilities',
+        'условия',
+        'мы предлагаем',
+        'what we offer',
+        'benefits',
+        'о компании',
+        'требования',
+        'requirements',
+        'вам предстоит',
+        'чем заниматься',
+        'чем предстоит',
+        'какие задачи',
+    ]
+
     # РАСШИРЕННЫЕ стоп-фразы для требований (это обязанности!)
     NOISE_PHRASES = [
         # Информация о компании
@@ -281,17 +301,21 @@ class RequirementsExtractor(ITextSectionExtractor):
             min_length: int = 15,
             max_length: int = 400,
             min_words: int = 3,
-            similarity_threshold: float = 0.85
+            similarity_threshold: float = 0.85,
+            segmenter: Optional[SectionSegmenter] = None
     ):
         """Инициализация экстрактора."""
         self.min_length = min_length
         self.max_length = max_length
         self.min_words = min_words
         self.similarity_threshold = similarity_threshold
+        # Разметка описания на секции (общая с другим экстрактором)
+        self.segmenter = segmenter or SectionSegmenter()
         self._compile_patterns()
 
     def _compile_patterns(self):
         """Компиляция регулярных выражений."""
+        self._section_end_headers = self.segmenter.end_headers(self.SECTION_END_HEADERS)
         self.header_pattern = re.compile(
             r'(?:^|\n)\s*(?:' + '|'.join(self.REQUIREMENT_HEADERS) + r')\s*(?:\n|$)',
             re.IGNORECASE | re.MULTILINE | re.UNICODE
@@ -313,39 +337,54 @@ class RequirementsExtractor(ITextSectionExtractor):
             re.IGNORECASE | re.UNICODE
         )
 
-    def extract(self, text: str) -> List[str]:
-        """Извлечение требований из текста."""
+    def extract(
+            self,
+            text: str,
+            layout: Optional[DescriptionLayout] = None,
+            folded: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """
+        Извлечение требований из текста.
+
+        Args:
+            text: Очищенный текст описания
+            layout: Разметка текста (None - размечается сегментатором)
+            folded: Формы fold элементов документа (дополняется)
+        """
         if not text:
             return []
 
+        if layout is None:
+            layout = self.segmenter.segment(text)
+
         requirements = []
 
         # Метод 1: Поиск по заголовкам секций (приоритетный)
-        section_requirements = self._extract_from_sections(text)
+        section_requirements = self._extract_from_sections(text, layout)
         requirements.extend(section_requirements)
 
         # Метод 2: Поиск по маркерам в тексте (только если мало результатов из секций)
         if len(section_requirements) < 3:
-            marker_requirements = self._extract_by_markers(text)
+            marker_requirements = self._extract_by_markers(layout)
             requirements.extend(marker_requirements)
 
         # Метод 3: Извлечение из списков (только если мало результатов)
         if len(requirements) < 5:
-            list_requirements = self._extract_from_lists(text)
+            list_requirements = self._extract_from_lists(layout)
             requirements.extend(list_requirements)
 
         # Улучшенная очистка и дедупликация
-        requirements = self._advanced_clean_and_deduplicate(requirements)
+        requirements = self._advanced_clean_and_deduplicate(requirements, folded)
 
         return requirements
 
-    def _extract_from_sections(self, text: str) -> List[str]:
+    def _extract_from_sections(self, text: str, layout: DescriptionLayout) -> List[str]:
         """Извлечение требований из размеченных секций."""
         requirements = []
 
         for match in self.header_pattern.finditer(text):
             section_start = match.end()
-            section_end = self._find_section_end(text, section_start)
+            section_end = layout.section_end(section_start, self._section_end_headers)
 
             if section_end is None:
                 section_end = len(text)
@@ -359,40 +398,10 @@ class RequirementsExtractor(ITextSectionExtractor):
 
         return requirements
 
-    def _find_section_end(self, text: str, start_pos: int) -> int:
-        """Поиск конца текущей секции."""
-        next_headers_pattern = re.compile(
-            r'\n\s*(?:'
-            r'обязанности|'
-            r'задачи|'
-            r'responsibilities|'
-            r'условия|'
-            r'мы предлагаем|'
-            r'what we offer|'
-            r'benefits|'
-            r'о компании|'
-            r'требования|'
-            r'requirements|'
-            r'вам предстоит|'
-            r'чем заниматься|'
-            r'чем предстоит|'
-            r'какие задачи'
-            r'):',
-            re.IGNORECASE | re.UNICODE
-        )
-
-        match = next_headers_pattern.search(text[start_pos:])
-
-        if match:
-            return start_pos + match.start()
-
-        # Ограничиваем секцию 1500 символами, если не нашли следующий заголовок
-        return min(start_pos + 1500, len(text))
-
-    def _extract_by_markers(self, text: str) -> List[str]:
+    def _extract_by_markers(self, layout: DescriptionLayout) -> List[str]:
         """Извлечение требований по ключевым маркерам."""
         requirements = []
-        sentences = re.split(r'[.;!?]\s+', text)
+        sentences = layout.sentences
 
         for sentence in sentences:
             # Пропускаем слишком длинные предложения (это может быть список задач)
@@ -407,38 +416,24 @@ class RequirementsExtractor(ITextSectionExtractor):
 
         return requirements
 
-    def _extract_from_lists(self, text: str) -> List[str]:
+    def _extract_from_lists(self, layout: DescriptionLayout) -> List[str]:
         """Извлечение из маркированных и нумерованных списков."""
         requirements = []
 
-        list_patterns = [
-            r'^[-•*]\s*(.+)$',
-            r'^\d+[\.)]\s*(.+)$',
-        ]
-
-        lines = text.split('\n')
-
         # Определяем контекст (в какой секции находимся)
         in_requirements_section = False
 
-        for line in lines:
+        for line in layout.lines:
             # Проверяем, не попали ли мы в секцию требований
-            if re.search(r'(?:требования|мы ожидаем|нам важно|что ждем):', line.lower()):
+            if SectionType.REQUIREMENTS in line.opens:
                 in_requirements_section = True
-            elif re.search(r'(?:обязанности|задачи|вам предстоит|чем заниматься):', line.lower()):
+            elif SectionType.RESPONSIBILITIES in line.opens:
                 in_requirements_section = False
 
             # Извлекаем элементы списка только из секции требований
-            if in_requirements_section:
-                for pattern in list_patterns:
-                    match = re.match(pattern, line.strip())
-
-                    if match:
-                        item = match.group(1).strip()
-
-                        if self._is_valid_requirement(item):
-                            requirements.append(item)
-                        break
+            if in_requirements_section and line.item is not None:
+                if self._is_valid_requirement(line.item):
+                    requirements.append(line.item)
 
         return requirements
 
@@ -562,50 +557,31 @@ class RequirementsExtractor(ITextSectionExtractor):
 
         return True
 
-    def _advanced_clean_and_deduplicate(self, requirements: List[str]) -> List[str]:
+    def _advanced_clean_and_deduplicate(
+            self,
+            requirements: List[str],
+            folded: Optional[Dict[str, str]] = None
+    ) -> List[str]:
         """Продвинутая очистка и дедупликация."""
         if not requirements:
             return []
 
-        # Фильтрация валидных требований
-        cleaned = [req for req in requirements if self._is_valid_requirement(req)]
-
-        unique_requirements = []
-        seen_normalized = set()
-
-        for req in cleaned:
-            # Нормализация для быстрой проверки
-            normalized = self._normalize_for_comparison(req)
-
-            if normalized in seen_normalized:
-                continue
-
-            # Проверка на похожесть с уже добавленными
-            is_duplicate = False
-
-            for existing in unique_requirements:
-                similarity = self._calculate_similarity(req, existing)
-
-                if similarity >= self.similarity_threshold:
-                    # Оставляем более длинную версию
-                    if len(req) > len(existing):
-                        unique_requirements.remove(existing)
-                        seen_normalized.discard(self._normalize_for_comparison(existing))
-                        break
-                    else:
-                        is_duplicate = True
-                        break
-
-            if not is_duplicate:
-                unique_requirements.append(req)
-                seen_normalized.add(normalized)
-
-        return unique_requirements
+        # Удаление похожих требований (остается более длинная версия);
+        # валидность элементов уже проверена при извлечении
+        return deduplicate(
+            requirements,
+            self.similarity_threshold,
+            self._normalize_for_comparison,
+            [
+                self._normalize_for_comparison(item, form)
+                for item, form in zip(requirements, fold_all(requirements, folded))
+            ]
+        )
 
-    def _normalize_for_comparison(self, text: str) -> str:
-        """Нормализация текста для сравнения."""
+    def _normalize_for_comparison(self, text: str, folded: Optional[str] = None) -> str:
+        """Нормализация текста для сравнения (folded - уже вычисленная форма fold)."""
         # Приведение к нижнему регистру
-        text = text.lower()
+        text = folded if folded is not None else fold(text)
 
         # Удаление знаков препинания в конце
         text = text.rstrip('.;,')
@@ -618,12 +594,6 @@ class RequirementsExtractor(ITextSectionExtractor):
 
         return text
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Вычисление схожести двух строк."""
-        norm1 = self._normalize_for_comparison(text1)
-        norm2 = self._normalize_for_comparison(text2)
-
-        return SequenceMatcher(None, norm1, norm2).ratio()
 
 
 class SkillsBasedRequirementsExtractor(RequirementsExtractor):
@@ -635,21 +605,25 @@ class SkillsBasedRequirementsExtractor(RequirementsExtractor):
             min_length: int = 15,
             max_length: int = 400,
             min_words: int = 3,
-            similarity_threshold: float = 0.85
+            similarity_threshold: float = 0.85,
+            segmenter: Optional[SectionSegmenter] = None
     ):
-        super().__init__(min_length, max_length, min_words, similarity_threshold)
+        super().__init__(min_length, max_length, min_words, similarity_threshold, segmenter)
         self.tech_keywords = [kw.lower() for kw in tech_keywords]
 
-    def extract(self, text: str) -> List[str]:
+    def extract(
+            self,
+            text: str,
+            layout: Optional[DescriptionLayout] = None,
+            folded: Optional[Dict[str, str]] = None
+    ) -> List[str]:
         """Извлечение с приоритетом технических требований."""
-        base_requirements = super().extract(text)
+        base_requirements = super().extract(text, layout, folded)
 
         tech_requirements = []
         other_requirements = []
 
-        for req in base_requirements:
-            req_lower = req.lower()
-
+        for req, req_lower in zip(base_requirements, fold_all(base_requirements, folded)):
             if any(kw in req_lower for kw in self.tech_keywords):
                 tech_requirements.append(req)
             else:
@@ -4,9 +4,11 @@
 """
 
 import re
-from typing import List
-from difflib import SequenceMatcher
+from typing import Dict, List, Optional
 from core.interfaces import ITextSectionExtractor
+from extractors.section_segmenter import DescriptionLayout, SectionSegmenter, SectionType
+from extractors.near_duplicates import deduplicate
+from extractors.pattern_matcher import fold, fold_all
 
 
 class ResponsibilitiesExtractor(ITextSectionExtractor):
@@ -96,6 +98,22 @@ class ResponsibilitiesExtractor(ITextSectionExtractor):
         r'что ждем:?',
     ]
 
+    # Заголовки (в начале строки перед ':'), завершающие секцию
+    SECTION_END_HEADERS = [
+        'требования',
+        'условия',
+        'мы предлагаем',
+        'what we offer',
+        'requirements',
+        'о компании',
+        'обязанности',
+        'задачи',
+        'нам важно',
+        'от кандидата',
+        'мы ожидаем',
+        'что ждем',
+    ]
+
     # РАСШИРЕННЫЕ стоп-фразы для обязанностей (это требования!)
     NOISE_PHRASES = [
         # Информация о компании
@@ -207,17 +225,21 @@ class ResponsibilitiesExtractor(ITextSectionExtractor):
             min_length: int = 20,
             max_length: int = 450,
             min_words: int = 4,
-            similarity_threshold: float = 0.85
+            similarity_threshold: float = 0.85,
+            segmenter: Optional[SectionSegmenter] = None
     ):
         """Инициализация экстрактора обязанностей."""
         self.min_length = min_length
         self.max_length = max_length
         self.min_words = min_words
         self.similarity_threshold = similarity_threshold
+        # Разметка описания на секции (общая с другим экстрактором)
+        self.segmenter = segmenter or SectionSegmenter()
         self._compile_patterns()
 
     def _compile_patterns(self):
         """Компиляция регулярных выражений."""
+        self._section_end_headers = self.segmenter.end_headers(self.SECTION_END_HEADERS)
         self.header_pattern = re.compile(
             r'(?:^|\n)\s*(?:' + '|'.join(self.RESPONSIBILITY_HEADERS) + r')\s*(?:\n|$)',
             re.IGNORECASE | re.MULTILINE | re.UNICODE
@@ -239,39 +261,54 @@ class ResponsibilitiesExtractor(ITextSectionExtractor):
             re.IGNORECASE | re.UNICODE
         )
 
-    def extract(self, text: str) -> List[str]:
-        """Извлечение обязанностей из текста."""
+    def extract(
+            self,
+            text: str,
+            layout: Optional[DescriptionLayout] = None,
+            folded: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        """
+        Извлечение обязанностей из текста.
+
+        Args:
+            text: Очищенный текст описания
+            layout: Разметка текста (None - размечается сегментатором)
+            folded: Формы fold элементов документа (дополняется)
+        """
         if not text:
             return []
 
+        if layout is None:
+            layout = self.segmenter.segment(text)
+
         responsibilities = []
 
         # Метод 1: Извлечение из секций (приоритетный)
-        section_resp = self._extract_from_sections(text)
+        section_resp = self._extract_from_sections(text, layout)
         responsibilities.extend(section_resp)
 
         # Метод 2: Поиск по маркерам (только если мало результатов из секций)
         if len(section_resp) < 3:
-            marker_resp = self._extract_by_markers(text)
+            marker_resp = self._extract_by_markers(layout)
             responsibilities.extend(marker_resp)
 
         # Метод 3: Извлечение из списков (только если мало результатов)
         if len(responsibilities) < 5:
-            list_resp = self._extract_from_lists(text)
+            list_resp = self._extract_from_lists(layout)
             responsibilities.extend(list_resp)
 
         # Продвинутая очистка и дедупликация
-        responsibilities = self._advanced_clean_and_deduplicate(responsibilities)
+        responsibilities = self._advanced_clean_and_deduplicate(responsibilities, folded)
 
         return responsibilities
 
-    def _extract_from_sections(self, text: str) -> List[str]:
+    def _extract_from_sections(self, text: str, layout: DescriptionLayout) -> List[str]:
         """Извлечение из секций."""
         responsibilities = []
 
         for match in self.header_pattern.finditer(text):
             section_start = match.end()
-            section_end = self._find_section_end(text, section_start)
+            section_end = layout.section_end(section_start, self._section_end_headers)
 
             if section_end is None:
                 section_end = len(text)
@@ -285,38 +322,10 @@ class ResponsibilitiesExtractor(ITextSectionExtractor):
 
         return responsibilities
 
-    def _find_section_end(self, text: str, start_pos: int) -> int:
-        """Поиск конца секции."""
-        next_headers_pattern = re.compile(
-            r'\n\s*(?:'
-            r'требования|'
-            r'условия|'
-            r'мы предлагаем|'
-            r'what we offer|'
-            r'requirements|'
-            r'о компании|'
-            r'обязанности|'
-            r'задачи|'
-            r'нам важно|'
-            r'от кандидата|'
-            r'мы ожидаем|'
-            r'что ждем'
-            r'):',
-            re.IGNORECASE | re.UNICODE
-        )
-
-        match = next_headers_pattern.search(text[start_pos:])
-
-        if match:
-            return start_pos + match.start()
-
-        # Ограничиваем секцию 1500 символами
-        return min(start_pos + 1500, len(text))
-
-    def _extract_by_markers(self, text: str) -> List[str]:
+    def _extract_by_markers(self, layout: DescriptionLayout) -> List[str]:
         """Извлечение по маркерам."""
         responsibilities = []
-        sentences = re.split(r'[.;!?]\s+', text)
+        sentences = layout.sentences
 
         for sentence in sentences:
             # Пропускаем слишком длинные предложения
@@ -331,38 +340,24 @@ class ResponsibilitiesExtractor(ITextSectionExtractor):
 
         return responsibilities
 
-    def _extract_from_lists(self, text: str) -> List[str]:
+    def _extract_from_lists(self, layout: DescriptionLayout) -> List[str]:
         """Извлечение из списков."""
         responsibilities = []
 
-        list_patterns = [
-            r'^[-•*]\s*(.+)$',
-            r'^\d+[\.)]\s*(.+)$',
-        ]
-
-        lines = text.split('\n')
-
         # Определяем контекст (в какой секции находимся)
         in_responsibilities_section = False
 
-        for line in lines:
+        for line in layout.lines:
             # Проверяем, не попали ли мы в секцию обязанностей
-            if re.search(r'(?:обязанности|задачи|вам предстоит|чем заниматься):', line.lower()):
+            if SectionType.RESPONSIBILITIES in line.opens:
                 in_responsibilities_section = True
-            elif re.search(r'(?:требования|мы ожидаем|нам важно|что ждем):', line.lower()):
+            elif SectionType.REQUIREMENTS in line.opens:
                 in_responsibilities_section = False
 
             # Извлекаем элементы списка только из секции обязанностей
-            if in_responsibilities_section:
-                for pattern in list_patterns:
-                    match = re.match(pattern, line.strip())
-
-                    if match:
-                        item = match.group(1).strip()
-
-                        if self._is_valid_responsibility(item):
-                            responsibilities.append(item)
-                        break
+            if in_responsibilities_section and line.item is not None:
+                if self._is_valid_responsibility(line.item):
+                    responsibilities.append(line.item)
 
         return responsibilities
 
@@ -466,50 +461,31 @@ class ResponsibilitiesExtractor(ITextSectionExtractor):
 
         return True
 
-    def _advanced_clean_and_deduplicate(self, responsibilities: List[str]) -> List[str]:
+    def _advanced_clean_and_deduplicate(
+            self,
+            responsibilities: List[str],
+            folded: Optional[Dict[str, str]] = None
+    ) -> List[str]:
         """Продвинутая дедупликация."""
         if not responsibilities:
             return []
 
-        # Фильтрация валидных обязанностей
-        cleaned = [r for r in responsibilities if self._is_valid_responsibility(r)]
-
-        unique_resp = []
-        seen_normalized = set()
-
-        for resp in cleaned:
-            # Нормализация для быстрой проверки
-            normalized = self._normalize_for_comparison(resp)
-
-            if normalized in seen_normalized:
-                continue
-
-            # Проверка на похожесть с уже добавленными
-            is_duplicate = False
-
-            for existing in unique_resp:
-                similarity = self._calculate_similarity(resp, existing)
-
-                if similarity >= self.similarity_threshold:
-                    # Оставляем более длинную версию
-                    if len(resp) > len(existing):
-                        unique_resp.remove(existing)
-                        seen_normalized.discard(self._normalize_for_comparison(existing))
-                        break
-                    else:
-                        is_duplicate = True
-                        break
-
-            if not is_duplicate:
-                unique_resp.append(resp)
-                seen_normalized.add(normalized)
-
-        return unique_resp
+        # Удаление похожих обязанностей (остается более длинная версия);
+        # валидность элементов уже проверена при извлечении
+        return deduplicate(
+            responsibilities,
+            self.similarity_threshold,
+            self._normalize_for_comparison,
+            [
+                self._normalize_for_comparison(item, form)
+                for item, form in zip(responsibilities, fold_all(responsibilities, folded))
+            ]
+        )
 
-    def _normalize_for_comparison(self, text: str) -> str:
-        """Нормализация текста для сравнения."""
+    def _normalize_for_comparison(self, text: str, folded: Optional[str] = None) -> str:
+        """Нормализация текста для сравнения (folded - уже вычисленная форма fold)."""
         # Приведение к нижнему регистру
-        text = text.lower()
+        text = folded if folded is not None else fold(text)
 
         # Удаление знаков препинания в конце
         text = text.rstrip('.;,')
@@ -518,10 +494,3 @@ class ResponsibilitiesExtractor(ITextSectionExtractor):
         text = ' '.join(text.split())
 
         return text
-
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Вычисление схожести."""
-        norm1 = self._normalize_for_comparison(text1)
-        norm2 = self._normalize_for_comparison(text2)
-
-        return SequenceMatcher(None, norm1, norm2).ratio()
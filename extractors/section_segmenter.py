@@ -0,0 +1,282 @@
+"""
+Модуль разметки описания вакансии на секции.
+Очищенный текст один раз размечается по заголовкам секций
+(требования, обязанности, условия, о компании) и строкам списков;
+разметка общая для экстракторов требований и обязанностей, поэтому
+каждое описание просматривается фиксированное число раз вместо
+поиска по хвосту текста после каждого найденного заголовка.
+"""
+
+import bisect
+import re
+import time
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+
+class SectionType(Enum):
+    """Тип секции описания."""
+    REQUIREMENTS = "requirements"
+    RESPONSIBILITIES = "responsibilities"
+    CONDITIONS = "conditions"
+    ABOUT = "about"
+
+
+@dataclass(frozen=True)
+class SectionBoundary:
+    """Заголовок секции в начале строки (вида '\\nзаголовок:')"""
+    start: int  # Позиция первого перевода строки перед заголовком
+    header_start: int  # Позиция самого заголовка
+    body_start: int  # Позиция после ':' заголовка
+    header: str  # Заголовок в нижнем регистре (как в BOUNDARY_HEADERS)
+    section_type: SectionType
+
+
+@dataclass(frozen=True)
+class ListLine:
+    """Строка описания с точки зрения извлечения из списков"""
+    opens: FrozenSet[SectionType]  # Секции, маркер начала которых есть в строке
+    item: Optional[str]  # Текст элемента списка (None - строка не элемент списка)
+
+
+class DescriptionLayout:
+    """
+    Разметка одного описания.
+
+    Текст размечается при первом обращении к разметке, поэтому
+    созданная заранее, но не понадобившаяся разметка (например, когда
+    результаты экстракторов взяты из кэша) ничего не стоит.
+    """
+
+    def __init__(self, segmenter: 'SectionSegmenter', text: str):
+        """
+        Args:
+            segmenter: Сегментатор с скомпилированными паттернами
+            text: Очищенный текст описания
+        """
+        self.segmenter = segmenter
+        self.text = text
+
+    @cached_property
+    def boundaries(self) -> List[SectionBoundary]:
+        """Заголовки секций в порядке появления"""
+        start = time.perf_counter()
+        segmenter = self.segmenter
+        boundaries = []
+
+        for match in segmenter.boundary_pattern.finditer(self.text):
+            header = segmenter.headers[int(match.lastgroup[1:])]
+            boundaries.append(SectionBoundary(
+                start=match.start(),
+                header_start=match.start(match.lastgroup),
+                body_start=match.end(),
+                header=header,
+                section_type=segmenter.BOUNDARY_HEADERS[header]
+            ))
+
+        segmenter.elapsed += time.perf_counter() - start
+
+        return boundaries
+
+    @cached_property
+    def _header_starts(self) -> List[int]:
+        return [boundary.header_start for boundary in self.boundaries]
+
+    def section_end(
+            self,
+            start_pos: int,
+            headers: FrozenSet[str],
+            max_length: int = 1500
+    ) -> int:
+        """
+        Конец секции, начинающейся с позиции start_pos.
+
+        Совпадает с поиском r'\\n\\s*(?:headers):' по text[start_pos:]:
+        секция заканчивается на переводе строки перед первым из заголовков
+        headers, иначе ограничивается max_length символами.
+
+        Args:
+            start_pos: Начало текста секции (конец ее заголовка)
+            headers: Заголовки, завершающие секцию
+            max_length: Длина секции, если завершающий заголовок не найден
+
+        Returns:
+            int: Позиция конца секции
+        """
+        index = bisect.bisect_right(self._header_starts, start_pos)
+
+        for boundary in self.boundaries[index:]:
+            if boundary.header not in headers:
+                continue
+
+            if boundary.start >= start_pos:
+                return boundary.start
+
+            # Начало секции попало в пробелы перед заголовком
+            newline = self.text.find('\n', start_pos, boundary.header_start)
+            if newline != -1:
+                return newline
+
+        return min(start_pos + max_length, len(self.text))
+
+    def sections(self, section_type: SectionType) -> List[str]:
+        """
+        Тексты секций заданного типа (от заголовка до следующего заголовка).
+
+        Args:
+            section_type: Тип секции
+
+        Returns:
+            List[str]: Тексты секций без заголовков
+        """
+        ends = [boundary.start for boundary in self.boundaries[1:]] + [len(self.text)]
+
+        return [
+            self.text[boundary.body_start:end]
+            for boundary, end in zip(self.boundaries, ends)
+            if boundary.section_type is section_type
+        ]
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Предложения описания (для поиска по маркерам)"""
+        return self.segmenter.sentence_split_pattern.split(self.text)
+
+    @cached_property
+    def lines(self) -> List[ListLine]:
+        """Строки описания с маркерами начала секций и элементами списков"""
+        # Маркеры ищутся по всему тексту сразу и раскладываются по строкам
+        # (lower не добавляет и не удаляет переводов строки)
+        lowered = self.text.lower()
+        lowered_lines = lowered.split('\n')
+
+        line_starts = []
+        position = 0
+        for line in lowered_lines:
+            line_starts.append(position)
+            position += len(line) + 1
+
+        opens: List[set] = [set() for _ in lowered_lines]
+
+        for section_type, pattern in self.segmenter.line_markers.items():
+            for match in pattern.finditer(lowered):
+                opens[bisect.bisect_right(line_starts, match.start()) - 1].add(section_type)
+
+        return [
+            ListLine(opens=frozenset(line_opens), item=self.segmenter.list_item(line))
+            for line, line_opens in zip(self.text.split('\n'), opens)
+        ]
+
+
+class SectionSegmenter:
+    """
+    Разметка описаний на секции.
+
+    Один экземпляр используется обоими экстракторами; разметка
+    описания создается один раз и передается экстракторам через
+    документ вакансии (VacancyDocument.layout).
+    """
+
+    # Заголовки секций, распознаваемые в начале строки (перед ':')
+    BOUNDARY_HEADERS: Dict[str, SectionType] = {
+        'требования': SectionType.REQUIREMENTS,
+        'requirements': SectionType.REQUIREMENTS,
+        'нам важно': SectionType.REQUIREMENTS,
+        'от кандидата': SectionType.REQUIREMENTS,
+        'мы ожидаем': SectionType.REQUIREMENTS,
+        'что ждем': SectionType.REQUIREMENTS,
+        'обязанности': SectionType.RESPONSIBILITIES,
+        'задачи': SectionType.RESPONSIBILITIES,
+        'responsibilities': SectionType.RESPONSIBILITIES,
+        'вам предстоит': SectionType.RESPONSIBILITIES,
+        'чем заниматься': SectionType.RESPONSIBILITIES,
+        'чем предстоит': SectionType.RESPONSIBILITIES,
+        'какие задачи': SectionType.RESPONSIBILITIES,
+        'условия': SectionType.CONDITIONS,
+        'мы предлагаем': SectionType.CONDITIONS,
+        'what we offer': SectionType.CONDITIONS,
+        'benefits': SectionType.CONDITIONS,
+        'о компании': SectionType.ABOUT,
+    }
+
+    # Маркеры начала секции в строке (для извлечения из списков)
+    LINE_MARKERS: Dict[SectionType, str] = {
+        SectionType.REQUIREMENTS: r'(?:требования|мы ожидаем|нам важно|что ждем):',
+        SectionType.RESPONSIBILITIES: r'(?:обязанности|задачи|вам предстоит|чем заниматься):',
+    }
+
+    # Граница предложений
+    SENTENCE_SPLIT_PATTERN = r'[.;!?]\s+'
+
+    # Элементы маркированных и нумерованных списков
+    LIST_ITEM_PATTERNS = [
+        r'^[-•*]\s*(.+)$',
+        r'^\d+[\.)]\s*(.+)$',
+    ]
+
+    def __init__(self):
+        # Группа на каждый заголовок: по имени совпавшей группы заголовок
+        # определяется без приведения найденного текста к нижнему регистру
+        self.headers = list(self.BOUNDARY_HEADERS)
+        self.boundary_pattern = re.compile(
+            r'\n\s*(?:' + '|'.join(
+                f'(?P<h{index}>{re.escape(header)})'
+                for index, header in enumerate(self.headers)
+            ) + r'):',
+            re.IGNORECASE | re.UNICODE
+        )
+        self.line_markers = {
+            section_type: re.compile(pattern, re.UNICODE)
+            for section_type, pattern in self.LINE_MARKERS.items()
+        }
+        self.sentence_split_pattern = re.compile(self.SENTENCE_SPLIT_PATTERN)
+        self.list_item_patterns = [re.compile(p) for p in self.LIST_ITEM_PATTERNS]
+
+        # Суммарное время разметки (для замера этапа 'segment')
+        self.elapsed = 0.0
+
+    def end_headers(self, headers: Iterable[str]) -> FrozenSet[str]:
+        """
+        Проверка и подготовка набора заголовков, завершающих секцию.
+
+        Args:
+            headers: Заголовки (ключи BOUNDARY_HEADERS)
+
+        Returns:
+            FrozenSet[str]: Набор заголовков для DescriptionLayout.section_end
+
+        Raises:
+            ValueError: Если заголовок не размечается сегментатором
+        """
+        headers = frozenset(header.lower() for header in headers)
+        unknown = headers - self.BOUNDARY_HEADERS.keys()
+
+        if unknown:
+            raise ValueError(f"Неизвестные заголовки секций: {sorted(unknown)}")
+
+        return headers
+
+    def segment(self, text: str) -> DescriptionLayout:
+        """
+        Разметка текста (выполняется при первом обращении к ней).
+
+        Args:
+            text: Очищенный текст описания
+
+        Returns:
+            DescriptionLayout: Разметка
+        """
+        return DescriptionLayout(self, text)
+
+    def list_item(self, line: str) -> Optional[str]:
+        """Текст элемента списка в строке (None - строка не элемент списка)"""
+        stripped = line.strip()
+
+        for pattern in self.list_item_patterns:
+            match = pattern.match(stripped)
+            if match:
+                return match.group(1).strip()
+
+        return None
@@ -3,28 +3,52 @@
 Реализует синхронный и асинхронный режимы (Single Responsibility).
 """
 
-import requests
 import aiohttp
 import asyncio
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, AsyncIterator
 from aiohttp import ClientSession, TCPConnector
-from core.interfaces import IVacancyDetailsFetcher
+from core.interfaces import IVacancyDetailsFetcher, IVacancyCache, CachedVacancy
 from core.retry_strategy import IRetryStrategy, RetryContext
+from core.rate_limiter import IRateLimiter, TokenBucketRateLimiter
+from core.concurrency_controller import AdaptiveConcurrencyController
 from core.error_tracker import ErrorTracker
+from fetchers.http_session import session_scope, SyncHttpClient
 
 
 class SyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
     """Синхронное получение детальной информации о вакансиях."""
 
-    def __init__(self):
-        """Инициализация fetcher'а."""
+    def __init__(
+            self,
+            retry_strategy: Optional[IRetryStrategy] = None,
+            cache: Optional[IVacancyCache] = None,
+            http_client: Optional[SyncHttpClient] = None,
+            rate_limiter: Optional[IRateLimiter] = None,
+            max_workers: int = 1
+    ):
+        """
+        Инициализация fetcher'а.
+
+        Args:
+            retry_strategy: Стратегия повторных попыток
+            cache: Постоянный кэш вакансий (None = без кэширования)
+            http_client: Общий HTTP-клиент с пулом соединений
+            rate_limiter: Ограничитель частоты запросов (может быть общим с поисковиком)
+            max_workers: Количество потоков загрузки (1 = последовательно)
+        """
         self.base_url = "https://api.hh.ru/vacancies"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/json'
         }
         self.retry_strategy = retry_strategy
+        self.cache = cache
+        self.http_client = http_client or SyncHttpClient(pool_size=max(10, max_workers))
+        # По умолчанию - прежний темп sync режима: запрос раз в 0.2 с
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(rate=5.0, burst=1)
+        self.max_workers = max(1, max_workers)
         self.error_tracker = ErrorTracker()
 
     def fetch_details(self, vacancy_ids: List[str]) -> List[Dict]:
@@ -38,53 +62,82 @@ class SyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
             Список вакансий с детальной информацией
         """
         # Поддержка как списка ID, так и списка словарей
-        if vacancy_ids and isinstance(vacancy_ids[0], dict):
-            ids = [v['id'] for v in vacancy_ids]
-        else:
-            ids = vacancy_ids
+        ids = _normalize_ids(vacancy_ids)
 
         print(f"\n📋 Получаем детальную информацию для {len(ids)} вакансий...")
 
-        detailed_vacancies = []
-        ids_to_process = ids.copy()
+        # Вакансии из кэша не запрашиваются повторно
+        cached = _load_from_cache(self.cache, ids)
+        ids_to_process = [vac_id for vac_id in ids if str(vac_id) not in cached]
+
+        # Устаревшие записи проверяются условным запросом
+        stale_entries = _load_stale_entries(self.cache, ids_to_process)
 
         # Основной проход
-        detailed_vacancies, failed_ids = self._fetch_batch(ids_to_process)
+        detailed_vacancies, failed_ids = self._fetch_batch(ids_to_process, stale_entries)
 
         # Повторные попытки для неудачных ID
         if failed_ids and self.retry_strategy:
             print(f"\n🔄 Повторная обработка {len(failed_ids)} неудачных вакансий...")
-            retry_results, still_failed = self._retry_failed_ids(failed_ids)
+            retry_results, still_failed = self._retry_failed_ids(failed_ids, stale_entries)
             detailed_vacancies.extend(retry_results)
 
+        detailed_vacancies = _merge_in_order(ids, cached, detailed_vacancies)
+
         # Вывод статистики
         self.error_tracker.print_summary()
 
         print(f"\n✅ Получено {len(detailed_vacancies)} из {len(ids)} вакансий")
         return detailed_vacancies
 
-    def _fetch_batch(self, ids: List[str]) -> tuple[List[Dict], List[str]]:
-        """Получает батч вакансий"""
+    def _fetch_batch(
+            self,
+            ids: List[str],
+            stale_entries: Optional[Dict[str, CachedVacancy]] = None
+    ) -> tuple[List[Dict], List[str]]:
+        """Получает батч вакансий (в пуле потоков при max_workers > 1)"""
         detailed_vacancies = []
         failed_ids = []
+        stale_entries = stale_entries or {}
 
-        for i, vacancy_id in enumerate(ids, 1):
-            details = self._fetch_single_with_retry(vacancy_id)
-            if details:
-                detailed_vacancies.append(details)
-                self.error_tracker.mark_successful(vacancy_id)
-            else:
-                failed_ids.append(vacancy_id)
+        def fetch(vacancy_id: str) -> Optional[Dict]:
+            return self._fetch_single_with_retry(
+                vacancy_id,
+                stale_entries.get(str(vacancy_id))
+            )
 
-            print(f"⏳ Обработано: {i}/{len(ids)} ({i / len(ids) * 100:.1f}%)")
-            time.sleep(0.2)
+        if self.max_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            # map сохраняет порядок ID; частота запросов ограничивается лимитером
+            results = executor.map(fetch, ids)
+        else:
+            executor = None
+            results = map(fetch, ids)
+
+        try:
+            for i, (vacancy_id, details) in enumerate(zip(ids, results), 1):
+                if details:
+                    detailed_vacancies.append(details)
+                    self.error_tracker.mark_successful(vacancy_id)
+                else:
+                    failed_ids.append(vacancy_id)
+
+                print(f"⏳ Обработано: {i}/{len(ids)} ({i / len(ids) * 100:.1f}%)")
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         print(f"\n✅ Получено {len(detailed_vacancies)} детальных вакансий")
         return detailed_vacancies, failed_ids
 
-    def _fetch_single_with_retry(self, vacancy_id: str) -> Optional[Dict]:
+    def _fetch_single_with_retry(
+            self,
+            vacancy_id: str,
+            cached_entry: Optional[CachedVacancy] = None
+    ) -> Optional[Dict]:
         """Получает одну вакансию с повторными попытками"""
         attempt = 0
+        headers = _conditional_headers(self.headers, cached_entry)
 
         while True:
             context = RetryContext(
@@ -92,12 +145,21 @@ class SyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
                 attempt=attempt
             )
 
+            self.rate_limiter.acquire_sync()
+
             try:
                 url = f"{self.base_url}/{vacancy_id}"
-                response = requests.get(url, headers=self.headers, timeout=30)
+                response = self.http_client.get(url, headers=headers, timeout=30)
+
+                # Вакансия не изменилась - используем данные из кэша
+                if response.status_code == 304 and cached_entry:
+                    self.cache.touch(vacancy_id)
+                    return cached_entry.data
 
                 if response.status_code == 200:
-                    return response.json()
+                    data = response.json()
+                    _store_in_cache(self.cache, vacancy_id, data, response.headers)
+                    return data
 
                 context.last_status_code = response.status_code
 
@@ -150,10 +212,14 @@ class SyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
                     )
                     return None
 
-    def _retry_failed_ids(self, failed_ids: List[str]) -> tuple[List[Dict], List[str]]:
+    def _retry_failed_ids(
+            self,
+            failed_ids: List[str],
+            stale_entries: Optional[Dict[str, CachedVacancy]] = None
+    ) -> tuple[List[Dict], List[str]]:
         """Повторно обрабатывает неудачные ID"""
         time.sleep(5)  # Пауза перед повторной обработкой
-        return self._fetch_batch(failed_ids)
+        return self._fetch_batch(failed_ids, stale_entries)
 
     def get_error_statistics(self) -> Dict:
         """Возвращает статистику по ошибкам"""
@@ -166,12 +232,23 @@ class AsyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
 
         Args:
             max_concurrent: Максимальное количество одновременных запросов
+            retry_strategy: Стратегия повторных попыток
+            cache: Постоянный кэш вакансий (None = без кэширования)
+            rate_limiter: Ограничитель частоты запросов (может быть общим с поисковиком)
+            concurrency_controller: Адаптивный контроллер параллельности
+                (None = фиксированный лимит max_concurrent)
         """
 
+    # Коды ответов, означающие перегрузку API
+    OVERLOAD_STATUS_CODES = (429, 502, 503, 504)
+
     def __init__(
             self,
             max_concurrent: int = 10,
-            retry_strategy: Optional[IRetryStrategy] = None
+            retry_strategy: Optional[IRetryStrategy] = None,
+            cache: Optional[IVacancyCache] = None,
+            rate_limiter: Optional[IRateLimiter] = None,
+            concurrency_controller: Optional[AdaptiveConcurrencyController] = None
     ):
         self.base_url = "https://api.hh.ru/vacancies"
         self.headers = {
@@ -180,7 +257,15 @@ class AsyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
             'HH-User-Agent': 'VacancyParser/1.0'
         }
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.concurrency_controller = concurrency_controller
+        self.concurrency = concurrency_controller or self.semaphore
+        self.max_connections = max(
+            max_concurrent,
+            concurrency_controller.max_limit if concurrency_controller else 0
+        )
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter()
         self.retry_strategy = retry_strategy
+        self.cache = cache
         self.error_tracker = ErrorTracker()
 
     def fetch_details(self, vacancy_ids: List[str]) -> List[Dict]:
@@ -209,90 +294,200 @@ class AsyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
     async def fetch_details_async(
             self,
             vacancy_ids: List[str],
-            batch_size: int = 20
+            batch_size: int = 20,
+            session: Optional[ClientSession] = None
     ) -> List[Dict]:
         """Асинхронное получение детальной информации."""
-        # Поддержка как списка ID, так и списка словарей
-        if vacancy_ids and isinstance(vacancy_ids[0], dict):
-            ids = [v['id'] for v in vacancy_ids]
-        else:
-            ids = vacancy_ids
+        ids = _normalize_ids(vacancy_ids)
+        details = [
+            vacancy async for vacancy in self.iter_details_async(ids, batch_size, session)
+        ]
+
+        # Результаты приходят в порядке готовности - восстанавливаем исходный
+        return _merge_in_order(ids, {}, details)
+
+    async def iter_details_async(
+            self,
+            vacancy_ids: List[str],
+            batch_size: int = 20,
+            session: Optional[ClientSession] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Отдает вакансии по мере получения (сначала из кэша, затем из API).
+
+        Args:
+            vacancy_ids: Список ID вакансий (или список словарей с 'id')
+            batch_size: Как часто (в количестве ответов) выводить прогресс
+            session: Общая HTTP-сессия (None = собственная сессия на время загрузки)
+
+        Yields:
+            Dict: Вакансия с детальной информацией
+        """
+        ids = _normalize_ids(vacancy_ids)
 
         print(f"\n📋 Асинхронное получение деталей для {len(ids)} вакансий...")
-        all_details = []
         total = len(ids)
+        received = 0
 
-        connector = TCPConnector(limit=30, limit_per_host=10, force_close=False)
-        timeout = aiohttp.ClientTimeout(total=300, connect=60)
+        # Вакансии из кэша не запрашиваются повторно
+        cached = _load_from_cache(self.cache, ids)
+        ids_to_fetch = [vac_id for vac_id in ids if str(vac_id) not in cached]
+
+        for vacancy in _merge_in_order(ids, cached, []):
+            received += 1
+            yield vacancy
 
-        async with ClientSession(connector=connector, timeout=timeout) as session:
+        # Устаревшие записи проверяются условным запросом
+        stale_entries = _load_stale_entries(self.cache, ids_to_fetch)
+
+        async with session_scope(session, self.create_session) as session:
             # Основной проход
-            all_details, failed_ids = await self._fetch_batch_async(
-                session, ids, batch_size, total
-            )
+            failed_ids = []
+            async for vacancy in self._fetch_batch_async(
+                    session, ids_to_fetch, batch_size, stale_entries, failed_ids
+            ):
+                received += 1
+                yield vacancy
 
             # Повторные попытки для неудачных ID
             if failed_ids and self.retry_strategy:
                 print(f"\n🔄 Повторная обработка {len(failed_ids)} неудачных вакансий...")
                 await asyncio.sleep(5)  # Пауза перед повторной обработкой
 
-                retry_results, still_failed = await self._fetch_batch_async(
-                    session, failed_ids, batch_size, len(failed_ids)
-                )
-                all_details.extend(retry_results)
+                async for vacancy in self._fetch_batch_async(
+                        session, failed_ids, batch_size, stale_entries, []
+                ):
+                    received += 1
+                    yield vacancy
 
         # Вывод статистики
         self.error_tracker.print_summary()
 
-        print(f"\n✅ Получено {len(all_details)} из {total} вакансий")
-        return all_details
+        limiter_stats = self.rate_limiter.get_statistics()
+        print(
+            f"⏱️  Запросов: {limiter_stats['total_acquired']}, "
+            f"среднее ожидание токена: {limiter_stats['avg_wait']}с"
+        )
+
+        if self.concurrency_controller:
+            controller_stats = self.concurrency_controller.get_statistics()
+            print(
+                f"🎚️  Параллельность: текущая {controller_stats['limit']}, "
+                f"пиковая {controller_stats['peak_limit']}"
+            )
+
+        print(f"\n✅ Получено {received} из {total} вакансий")
+
+    def create_session(self) -> ClientSession:
+        """
+        Создание HTTP-сессии с пулом соединений под лимит параллельности.
+
+        Сессию можно передать в fetch_details_async и поисковику,
+        чтобы несколько запросов использовали общий пул соединений.
+        """
+        connector = TCPConnector(
+            limit=max(30, self.max_connections),
+            limit_per_host=self.max_connections,
+            force_close=False
+        )
+        timeout = aiohttp.ClientTimeout(total=300, connect=60)
+        return ClientSession(connector=connector, timeout=timeout)
 
     async def _fetch_batch_async(
             self,
             session: ClientSession,
             ids: List[str],
             batch_size: int,
-            total: int
-    ) -> tuple[List[Dict], List[str]]:
-        """Асинхронно получает батч вакансий"""
-        all_details = []
-        failed_ids = []
+            stale_entries: Optional[Dict[str, CachedVacancy]],
+            failed_ids: List[str]
+    ) -> AsyncIterator[Dict]:
+        """
+        Асинхронно получает список вакансий и отдает успешные по мере готовности.
 
-        for i in range(0, len(ids), batch_size):
-            batch = ids[i:i + batch_size]
+        Неудачные ID добавляются в failed_ids, прогресс выводится
+        каждые batch_size ответов.
+        """
+        received = 0
+        processed = 0
+        total = len(ids)
 
-            tasks = [
-                self._fetch_single_async_with_retry(session, vac_id)
-                for vac_id in batch
-            ]
+        async for vac_id, result in self._iter_fetch_async(session, ids, stale_entries):
+            processed += 1
+            if processed % batch_size == 0 or processed == total:
+                percentage = processed / total * 100
+                print(f"⏳ Обработано: {processed}/{total} ({percentage:.1f}%)")
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if isinstance(result, dict):
+                received += 1
+                self.error_tracker.mark_successful(vac_id)
+                yield result
+            else:
+                failed_ids.append(vac_id)
 
-            for vac_id, result in zip(batch, results):
-                if isinstance(result, dict):
-                    all_details.append(result)
-                    self.error_tracker.mark_successful(vac_id)
-                else:
-                    failed_ids.append(vac_id)
+        print(f"\n✅ Получено {received} детальных вакансий")
 
-            processed = min(i + batch_size, len(ids))
-            percentage = processed / total * 100
-            print(f"⏳ Обработано: {processed}/{total} ({percentage:.1f}%)")
+    async def _iter_fetch_async(
+            self,
+            session: ClientSession,
+            ids: List[str],
+            stale_entries: Optional[Dict[str, CachedVacancy]] = None
+    ) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+        """
+        Получает вакансии пулом воркеров и отдает результаты по мере готовности.
+
+        Воркеры берут ID из общей очереди, поэтому медленный запрос занимает
+        только свой слот, а остальные сразу переходят к следующим ID.
+        Фактическую параллельность ограничивает self.concurrency.
+
+        Yields:
+            Tuple[str, Optional[Dict]]: ID вакансии и ее данные (None при ошибке)
+        """
+        stale_entries = stale_entries or {}
+        pending = asyncio.Queue()
+        results = asyncio.Queue()
+
+        for vac_id in ids:
+            pending.put_nowait(vac_id)
 
-            if i + batch_size < len(ids):
-                await asyncio.sleep(1.0)
+        async def worker() -> None:
+            while True:
+                try:
+                    vac_id = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    result = await self._fetch_single_async_with_retry(
+                        session, vac_id, stale_entries.get(str(vac_id))
+                    )
+                except Exception:
+                    result = None
 
-        print(f"\n✅ Получено {len(all_details)} детальных вакансий")
-        return all_details, failed_ids
+                await results.put((vac_id, result))
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_connections, len(ids)))
+        ]
+
+        try:
+            for _ in range(len(ids)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
     async def _fetch_single_async_with_retry(
             self,
             session: ClientSession,
-            vacancy_id: str
+            vacancy_id: str,
+            cached_entry: Optional[CachedVacancy] = None
     ) -> Optional[Dict]:
         """Асинхронно получает одну вакансию с повторными попытками"""
         url = f"{self.base_url}/{vacancy_id}"
         attempt = 0
+        headers = _conditional_headers(self.headers, cached_entry)
 
         while True:
             context = RetryContext(
@@ -300,26 +495,37 @@ class AsyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
                 attempt=attempt
             )
 
-            async with self.semaphore:
+            # Токен ожидается до занятия слота, чтобы ожидание лимита
+            # не удерживало слот; слот занимается только на время запроса
+            await self.rate_limiter.acquire()
+
+            async with self.concurrency:
                 try:
-                    async with session.get(url, headers=self.headers) as response:
+                    async with session.get(url, headers=headers) as response:
+                        # Вакансия не изменилась - используем данные из кэша
+                        if response.status == 304 and cached_entry:
+                            self._record_success()
+                            self.cache.touch(vacancy_id)
+                            return cached_entry.data
+
                         if response.status == 200:
                             data = await response.json()
-                            await asyncio.sleep(0.1)
+                            self._record_success()
+                            _store_in_cache(self.cache, vacancy_id, data, response.headers)
                             return data
 
                         context.last_status_code = response.status
 
+                        if response.status in self.OVERLOAD_STATUS_CODES:
+                            self._record_overload()
+
                         # Специальная обработка для 429
                         if response.status == 429:
-                            retry_after = int(response.headers.get('Retry-After', 60))
-                            print(f"⚠️ Rate limit для ID {vacancy_id}! Ждем {retry_after}с...")
-                            await asyncio.sleep(retry_after)
-                            attempt += 1
-                            continue
+                            delay = int(response.headers.get('Retry-After', 60))
+                            print(f"⚠️ Rate limit для ID {vacancy_id}! Ждем {delay}с...")
 
                         # Проверка на повторную попытку
-                        if self.retry_strategy and self.retry_strategy.should_retry(context):
+                        elif self.retry_strategy and self.retry_strategy.should_retry(context):
                             delay = self.retry_strategy.get_delay(attempt)
 
                             self.error_tracker.track_error(
@@ -328,10 +534,6 @@ class AsyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
                                 response.status,
                                 attempt
                             )
-
-                            await asyncio.sleep(delay)
-                            attempt += 1
-                            continue
                         else:
                             self.error_tracker.track_error(
                                 vacancy_id,
@@ -344,54 +546,132 @@ class AsyncVacancyDetailsFetcher(IVacancyDetailsFetcher):
                 except asyncio.TimeoutError as e:
                     context.last_error = e
 
-                    if self.retry_strategy and self.retry_strategy.should_retry(context):
-                        delay = self.retry_strategy.get_delay(attempt)
-
-                        self.error_tracker.track_error(
-                            vacancy_id,
-                            "Timeout",
-                            None,
-                            attempt
-                        )
-
-                        await asyncio.sleep(delay)
-                        attempt += 1
-                        continue
-                    else:
-                        self.error_tracker.track_error(
-                            vacancy_id,
-                            "Timeout",
-                            None,
-                            attempt
-                        )
+                    self.error_tracker.track_error(
+                        vacancy_id,
+                        "Timeout",
+                        None,
+                        attempt
+                    )
+
+                    if not (self.retry_strategy and self.retry_strategy.should_retry(context)):
                         return None
 
+                    delay = self.retry_strategy.get_delay(attempt)
+
                 except Exception as e:
                     context.last_error = e
 
-                    if self.retry_strategy and self.retry_strategy.should_retry(context):
-                        delay = self.retry_strategy.get_delay(attempt)
-
-                        self.error_tracker.track_error(
-                            vacancy_id,
-                            str(e),
-                            None,
-                            attempt
-                        )
-
-                        await asyncio.sleep(delay)
-                        attempt += 1
-                        continue
-                    else:
-                        self.error_tracker.track_error(
-                            vacancy_id,
-                            str(e),
-                            None,
-                            attempt
-                        )
+                    self.error_tracker.track_error(
+                        vacancy_id,
+                        str(e),
+                        None,
+                        attempt
+                    )
+
+                    if not (self.retry_strategy and self.retry_strategy.should_retry(context)):
                         print(f"⚠️  Ошибка получения вакансии {vacancy_id}: {e}")
                         return None
 
+                    delay = self.retry_strategy.get_delay(attempt)
+
+            # Ожидание перед повтором - вне слота, остальные запросы продолжают работу
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _record_success(self) -> None:
+        """Передает контроллеру параллельности сигнал об успешном ответе"""
+        if self.concurrency_controller:
+            self.concurrency_controller.record_success()
+
+    def _record_overload(self) -> None:
+        """Передает контроллеру параллельности сигнал о перегрузке API"""
+        if self.concurrency_controller:
+            self.concurrency_controller.record_overload()
+
     def get_error_statistics(self) -> Dict:
         """Возвращает статистику по ошибкам"""
         return self.error_tracker.get_statistics()
+
+
+def _load_from_cache(cache: Optional[IVacancyCache], ids: List[str]) -> Dict[str, Dict]:
+    """Загружает из кэша уже полученные вакансии"""
+    if not cache or not ids:
+        return {}
+
+    cached = cache.get_many(ids)
+
+    if cached:
+        print(f"💾 Из кэша: {len(cached)}, к загрузке: {len(ids) - len(cached)}")
+
+    return cached
+
+
+def _load_stale_entries(
+        cache: Optional[IVacancyCache],
+        ids: List[str]
+) -> Dict[str, CachedVacancy]:
+    """Загружает устаревшие записи кэша, которые можно проверить условным запросом"""
+    if not cache or not ids:
+        return {}
+
+    stale_entries = {
+        vacancy_id: entry
+        for vacancy_id, entry in cache.get_entries(ids).items()
+        if entry.can_revalidate
+    }
+
+    if stale_entries:
+        print(f"🔁 Проверка актуальности по ETag/Last-Modified: {len(stale_entries)}")
+
+    return stale_entries
+
+
+def _conditional_headers(headers: Dict, cached_entry: Optional[CachedVacancy]) -> Dict:
+    """Добавляет к заголовкам запроса валидаторы записи кэша"""
+    if not cached_entry:
+        return headers
+
+    conditional = dict(headers)
+    if cached_entry.etag:
+        conditional['If-None-Match'] = cached_entry.etag
+    if cached_entry.last_modified:
+        conditional['If-Modified-Since'] = cached_entry.last_modified
+
+    return conditional
+
+
+def _store_in_cache(
+        cache: Optional[IVacancyCache],
+        vacancy_id: str,
+        data: Dict,
+        response_headers
+) -> None:
+    """Сохраняет ответ API в кэш вместе с его ETag/Last-Modified"""
+    if not cache:
+        return
+
+    cache.set(
+        vacancy_id,
+        data,
+        etag=response_headers.get('ETag'),
+        last_modified=response_headers.get('Last-Modified')
+    )
+
+
+def _normalize_ids(vacancy_ids: List) -> List[str]:
+    """Поддержка как списка ID, так и списка словарей с 'id'"""
+    if vacancy_ids and isinstance(vacancy_ids[0], dict):
+        return [v['id'] for v in vacancy_ids]
+    return vacancy_ids
+
+
+def _merge_in_order(
+        ids: List[str],
+        cached: Dict[str, Dict],
+        fetched: List[Dict]
+) -> List[Dict]:
+    """Объединяет кэшированные и загруженные вакансии в исходном порядке ID"""
+    by_id = dict(cached)
+    by_id.update({str(vac['id']): vac for vac in fetched})
+
+    return [by_id[str(vac_id)] for vac_id in ids if str(vac_id) in by_id]
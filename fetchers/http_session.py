@@ -0,0 +1,115 @@
+"""
+Модуль управления HTTP-сессиями.
+Позволяет компонентам работать как с собственной сессией,
+так и с общей сессией, переданной извне (например, batch-планировщиком).
+Для синхронного режима предоставляет общий клиент с пулом соединений.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import requests
+from aiohttp import ClientSession
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    import h2  # noqa: F401 - нужен httpx для HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@asynccontextmanager
+async def session_scope(
+        session: Optional[ClientSession],
+        factory: Callable[[], ClientSession]
+) -> AsyncIterator[ClientSession]:
+    """
+    Контекст HTTP-сессии.
+
+    Переданная сессия используется как есть и не закрывается -
+    ею владеет вызывающий код. Если сессия не передана, создается
+    собственная и закрывается при выходе из контекста.
+
+    Args:
+        session: Общая сессия или None
+        factory: Функция создания собственной сессии
+    """
+    if session is not None:
+        yield session
+        return
+
+    async with factory() as own_session:
+        yield own_session
+
+
+class SyncHttpClient:
+    """
+    Общий HTTP-клиент синхронного режима.
+
+    Держит пул keep-alive соединений, поэтому запросы не открывают
+    новое TCP+TLS соединение каждый раз. Если установлены httpx и h2,
+    используется HTTP/2 (все запросы к хосту идут через одно соединение),
+    иначе - requests.Session с пулом соединений. Клиент потокобезопасен
+    и может разделяться поисковиком и fetcher'ом.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = 10,
+            timeout: float = 30.0,
+            http2: bool = True
+    ):
+        """
+        Args:
+            pool_size: Размер пула соединений (не меньше числа потоков)
+            timeout: Таймаут запроса по умолчанию (секунды)
+            http2: Использовать HTTP/2, если доступен httpx[http2]
+        """
+        self.timeout = timeout
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size
+                )
+            )
+        else:
+            self._client = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            self._client.mount('https://', adapter)
+            self._client.mount('http://', adapter)
+
+    def get(
+            self,
+            url: str,
+            params: Optional[Dict] = None,
+            headers: Optional[Dict] = None,
+            timeout: Optional[float] = None
+    ):
+        """
+        GET-запрос через пул соединений.
+
+        Returns:
+            Ответ с атрибутами status_code, headers и методами json(),
+            raise_for_status() (requests.Response или httpx.Response)
+        """
+        return self._client.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout or self.timeout
+        )
+
+    @property
+    def protocol(self) -> str:
+        return 'HTTP/2' if self.http2 else 'HTTP/1.1 keep-alive'
+
+    def close(self) -> None:
+        """Закрытие всех соединений пула"""
+        self._client.close()
@@ -3,32 +3,48 @@
 Реализует синхронный и асинхронный поиск (Single Responsibility).
 """
 
-import requests
 import aiohttp
 import asyncio
-import time
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from aiohttp import ClientSession, TCPConnector
 from core.interfaces import IVacancySearcher
+from core.rate_limiter import IRateLimiter, TokenBucketRateLimiter
+from core.retry_strategy import ExponentialBackoffRetry, IRetryStrategy, RetryContext
+from fetchers.http_session import session_scope, SyncHttpClient
 
 
 class SyncVacancySearcher(IVacancySearcher):
     """Синхронный поисковик вакансий."""
 
-    def __init__(self):
-        """Инициализация поисковика."""
+    def __init__(
+            self,
+            http_client: Optional[SyncHttpClient] = None,
+            rate_limiter: Optional[IRateLimiter] = None
+    ):
+        """
+        Инициализация поисковика.
+
+        Args:
+            http_client: Общий HTTP-клиент с пулом соединений
+            rate_limiter: Ограничитель частоты запросов (может быть общим с fetcher'ом)
+        """
         self.base_url = "https://api.hh.ru/vacancies"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/json'
         }
+        self.http_client = http_client or SyncHttpClient()
+        # По умолчанию - прежний темп sync режима: запрос раз в 0.2 с
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(rate=5.0, burst=1)
 
     def search(
             self,
             query: str,
             area: int = 1,
             max_pages: int = 20,
-            max_vacancies: Optional[int] = None
+            max_vacancies: Optional[int] = None,
+            date_from: Optional[str] = None
     ) -> List[Dict]:
         """
         Синхронный поиск вакансий.
@@ -38,10 +54,18 @@ class SyncVacancySearcher(IVacancySearcher):
             area: Код региона
             max_pages: Максимальное количество страниц
             max_vacancies: Максимальное количество вакансий (None = все)
+            date_from: Только вакансии, опубликованные не раньше (ISO 8601)
+
+        Инкрементальный поиск (date_from) собирает все новые вакансии:
+        выдача сортируется по дате публикации, лимиты страниц и вакансий
+        не применяются (иначе водяной знак сдвинулся бы за пропущенные вакансии).
         """
         print(f"🔍 Поиск вакансий: {query}")
         vacancies = []
 
+        if date_from:
+            max_pages, max_vacancies = AsyncVacancySearcher.API_MAX_PAGES, None
+
         for page in range(max_pages):
             params = {
                 'text': query,
@@ -50,8 +74,13 @@ class SyncVacancySearcher(IVacancySearcher):
                 'per_page': 100
             }
 
+            if date_from:
+                params.update(_incremental_params(date_from))
+
+            self.rate_limiter.acquire_sync()
+
             try:
-                response = requests.get(
+                response = self.http_client.get(
                     self.base_url,
                     params=params,
                     headers=self.headers
@@ -75,10 +104,11 @@ class SyncVacancySearcher(IVacancySearcher):
                     break
 
                 if page >= data['pages'] - 1:
+                    if date_from and total_found > len(vacancies):
+                        print(f"⚠️  Новых вакансий {total_found}, API отдает не больше "
+                              f"{len(vacancies)} - более ранние из них будут пропущены")
                     break
 
-                time.sleep(0.5)
-
             except Exception as e:
                 print(f"⚠️  Ошибка на странице {page}: {e}")
                 break
@@ -90,12 +120,31 @@ class SyncVacancySearcher(IVacancySearcher):
 class AsyncVacancySearcher(IVacancySearcher):
     """Асинхронный поисковик вакансий."""
 
-    def __init__(self, max_concurrent: int = 10):
+    # API отдает не больше 2000 результатов (20 страниц по 100) на запрос
+    API_MAX_PAGES = 20
+    API_RESULTS_LIMIT = 2000
+
+    # Минимальная ширина временного окна при разбиении (секунды)
+    MIN_SHARD_SECONDS = 60
+
+    def __init__(
+            self,
+            max_concurrent: int = 10,
+            rate_limiter: Optional[IRateLimiter] = None,
+            sharding: bool = True,
+            search_period_days: int = 30,
+            retry_strategy: Optional[IRetryStrategy] = None
+    ):
         """
         Инициализация асинхронного поисковика.
 
         Args:
             max_concurrent: Максимальное количество одновременных запросов
+            rate_limiter: Ограничитель частоты запросов (может быть общим с fetcher'ом)
+            sharding: Разбивать выдачу больше 2000 вакансий на окна по дате публикации
+            search_period_days: За сколько последних дней искать при разбиении
+            retry_strategy: Повторные попытки загрузки страниц
+                            (None = 3 попытки с экспоненциальной задержкой)
         """
         self.base_url = "https://api.hh.ru/vacancies"
         self.headers = {
@@ -104,13 +153,18 @@ class AsyncVacancySearcher(IVacancySearcher):
             'HH-User-Agent': 'VacancyParser/1.0'
         }
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter()
+        self.sharding = sharding
+        self.search_period_days = search_period_days
+        self.retry_strategy = retry_strategy or ExponentialBackoffRetry(max_attempts=3, initial_delay=2.0)
 
     def search(
             self,
             query: str,
             area: int = 1,
             max_pages: int = 20,
-            max_vacancies: Optional[int] = None
+            max_vacancies: Optional[int] = None,
+            date_from: Optional[str] = None
     ) -> List[Dict]:
         """
         Синхронная обертка для асинхронного поиска.
@@ -127,7 +181,7 @@ class AsyncVacancySearcher(IVacancySearcher):
             asyncio.set_event_loop(loop)
 
         return loop.run_until_complete(
-            self.search_async(query, area, max_pages, max_vacancies)
+            self.search_async(query, area, max_pages, max_vacancies, date_from)
         )
 
     async def search_async(
@@ -135,27 +189,60 @@ class AsyncVacancySearcher(IVacancySearcher):
             query: str,
             area: int = 1,
             max_pages: int = 20,
-            max_vacancies: Optional[int] = None
+            max_vacancies: Optional[int] = None,
+            date_from: Optional[str] = None,
+            session: Optional[ClientSession] = None
     ) -> List[Dict]:
-        """Асинхронный поиск вакансий."""
+        """
+        Асинхронный поиск вакансий.
+
+        Args:
+            query: Название должности
+            area: Код региона
+            max_pages: Максимальное количество страниц
+            max_vacancies: Максимальное количество вакансий (None = все)
+            date_from: Только вакансии, опубликованные не раньше (ISO 8601)
+            session: Общая HTTP-сессия (None = собственная сессия на время поиска)
+
+        Инкрементальный поиск (date_from) собирает все новые вакансии:
+        выдача сортируется по дате публикации, лимиты страниц и вакансий
+        не применяются (иначе водяной знак сдвинулся бы за пропущенные вакансии).
+        """
         print(f"🔍 Асинхронный поиск вакансий: {query}")
 
-        connector = TCPConnector(limit=30, limit_per_host=10, force_close=False)
-        timeout = aiohttp.ClientTimeout(total=300, connect=60)
+        search_params = None
+        if date_from:
+            search_params = _incremental_params(date_from)
+            max_pages, max_vacancies = self.API_MAX_PAGES, None
 
-        async with ClientSession(connector=connector, timeout=timeout) as session:
+        async with session_scope(session, self._create_session) as session:
             # Получение первой страницы
-            first_response = await self._fetch_page(session, query, area, 0)
+            first_response = await self._fetch_page_with_retry(session, query, area, 0, search_params)
 
-            if not first_response or 'items' not in first_response:
+            if not first_response:
                 print("❌ Не удалось получить вакансии")
                 return []
 
             all_vacancies = first_response['items']
             total_found = first_response.get('found', 0)
-            total_pages = min(first_response.get('pages', 1), max_pages, 20)
+            total_pages = min(first_response.get('pages', 1), max_pages, self.API_MAX_PAGES)
 
             print(f"📊 Найдено вакансий: {total_found}")
+
+            # Выдача обрезается API - собираем ее по временным окнам
+            if (
+                    self.sharding
+                    and total_found > self.API_RESULTS_LIMIT
+                    and (max_vacancies is None or max_vacancies > self.API_RESULTS_LIMIT)
+            ):
+                return await self._search_sharded(
+                    session, query, area, max_pages, max_vacancies, date_from
+                )
+
+            if date_from and total_found > self.API_RESULTS_LIMIT:
+                print(f"⚠️  Новых вакансий {total_found}, без разбиения по датам будет собрано "
+                      f"не больше {self.API_RESULTS_LIMIT}")
+
             print(f"📄 Доступно страниц: {first_response.get('pages', 1)}")
             print(f"📄 Будет обработано страниц: {total_pages}")
 
@@ -178,16 +265,18 @@ class AsyncVacancySearcher(IVacancySearcher):
 
                 # Создаем задачи ТОЛЬКО для текущего батча страниц
                 batch_tasks = [
-                    self._fetch_page(session, query, area, page)
+                    self._fetch_page_with_retry(session, query, area, page, search_params)
                     for page in range(page_batch_start, page_batch_end)
                 ]
 
                 # Выполняем только эти задачи
                 results = await asyncio.gather(*batch_tasks)
 
-                for result in results:
-                    if result and 'items' in result:
+                for page, result in zip(range(page_batch_start, page_batch_end), results):
+                    if result:
                         all_vacancies.extend(result['items'])
+                    else:
+                        print(f"❌ Страница {page} не загружена после повторных попыток")
 
                 print(f"📥 Загружено вакансий: {len(all_vacancies)}")
 
@@ -197,19 +286,167 @@ class AsyncVacancySearcher(IVacancySearcher):
                     print(f"✋ Достигнут лимит вакансий: {max_vacancies}")
                     break  # Теперь break безопасен - все созданные задачи уже awaited
 
-                # Задержка между батчами (кроме последнего)
-                if page_batch_end < total_pages:
-                    await asyncio.sleep(0.5)
-
             print(f"✅ Всего собрано вакансий: {len(all_vacancies)}")
             return all_vacancies
 
+    def _create_session(self) -> ClientSession:
+        """Создание собственной HTTP-сессии поиска"""
+        connector = TCPConnector(limit=30, limit_per_host=10, force_close=False)
+        timeout = aiohttp.ClientTimeout(total=300, connect=60)
+        return ClientSession(connector=connector, timeout=timeout)
+
+    async def _search_sharded(
+            self,
+            session: ClientSession,
+            query: str,
+            area: int,
+            max_pages: int,
+            max_vacancies: Optional[int],
+            since: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Сбор выдачи, превышающей лимит API, по окнам даты публикации.
+
+        Окно, в котором найдено больше 2000 вакансий, рекурсивно делится
+        пополам; окна обрабатываются параллельно, дубликаты на границах
+        окон удаляются по ID.
+
+        Raises:
+            RuntimeError: Если страницы каких-либо окон не загрузились
+                          после повторных попыток (выдача была бы неполной)
+        """
+        date_to = datetime.now(timezone.utc).replace(microsecond=0)
+        date_from = date_to - timedelta(days=self.search_period_days)
+
+        # Инкрементальный поиск: окно начинается с переданной даты
+        if since:
+            date_from = max(date_from, datetime.strptime(since, '%Y-%m-%dT%H:%M:%S%z'))
+
+        print(f"🧩 Выдача больше {self.API_RESULTS_LIMIT} - разбиение по датам публикации "
+              f"за {self.search_period_days} дн.")
+
+        lost_pages: List[str] = []
+        items = await self._collect_window(
+            session, query, area, max_pages, date_from, date_to, lost_pages
+        )
+
+        if lost_pages:
+            print(f"❌ Не загружено страниц окон: {len(lost_pages)}")
+            for lost in lost_pages:
+                print(f"   - {lost}")
+            raise RuntimeError(
+                f"Поиск '{query}' собран не полностью: не загружено страниц окон - {len(lost_pages)}"
+            )
+
+        # Удаление дубликатов (вакансия на границе окон попадает в оба)
+        all_vacancies = []
+        seen_ids = set()
+        for item in items:
+            if item['id'] not in seen_ids:
+                seen_ids.add(item['id'])
+                all_vacancies.append(item)
+
+        if max_vacancies and len(all_vacancies) > max_vacancies:
+            all_vacancies = all_vacancies[:max_vacancies]
+            print(f"✋ Достигнут лимит вакансий: {max_vacancies}")
+
+        print(f"✅ Всего собрано вакансий: {len(all_vacancies)}")
+        return all_vacancies
+
+    async def _collect_window(
+            self,
+            session: ClientSession,
+            query: str,
+            area: int,
+            max_pages: int,
+            date_from: datetime,
+            date_to: datetime,
+            lost_pages: List[str]
+    ) -> List[Dict]:
+        """
+        Сбор всех страниц одного временного окна (с разбиением при переполнении).
+
+        Страницы, не загруженные после повторных попыток, добавляются в lost_pages.
+        """
+        window_params = _date_window_params(date_from, date_to)
+        window = f"{window_params['date_from']} - {window_params['date_to']}"
+        first_response = await self._fetch_page_with_retry(session, query, area, 0, window_params)
+
+        if not first_response:
+            lost_pages.append(f"{window}, все страницы")
+            return []
+
+        found = first_response.get('found', 0)
+
+        if found > self.API_RESULTS_LIMIT:
+            if (date_to - date_from).total_seconds() > self.MIN_SHARD_SECONDS:
+                middle = date_from + (date_to - date_from) / 2
+                middle = middle.replace(microsecond=0)
+
+                # Более свежее окно первым - порядок как в обычной выдаче
+                newer, older = await asyncio.gather(
+                    self._collect_window(session, query, area, max_pages, middle, date_to, lost_pages),
+                    self._collect_window(session, query, area, max_pages, date_from, middle, lost_pages)
+                )
+                return newer + older
+
+            print(f"⚠️  Окно {window_params['date_from']} содержит {found} вакансий, "
+                  f"будет собрано не больше {self.API_RESULTS_LIMIT}")
+
+        total_pages = min(first_response.get('pages', 1), max_pages, self.API_MAX_PAGES)
+
+        results = await asyncio.gather(*[
+            self._fetch_page_with_retry(session, query, area, page, window_params)
+            for page in range(1, total_pages)
+        ])
+
+        items = list(first_response['items'])
+        for page, result in zip(range(1, total_pages), results):
+            if result:
+                items.extend(result['items'])
+            else:
+                lost_pages.append(f"{window}, страница {page}")
+
+        print(f"📥 Окно {window}: {len(items)} из {found}")
+        return items
+
+    async def _fetch_page_with_retry(
+            self,
+            session: ClientSession,
+            query: str,
+            area: int,
+            page: int,
+            extra_params: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Получение страницы с повторными попытками.
+
+        Returns:
+            Optional[Dict]: Ответ API или None, если попытки исчерпаны
+        """
+        attempt = 0
+
+        while True:
+            response = await self._fetch_page(session, query, area, page, extra_params)
+            if response and 'items' in response:
+                return response
+
+            context = RetryContext(vacancy_id=f"{query}, страница {page}", attempt=attempt)
+            if not self.retry_strategy.should_retry(context):
+                return None
+
+            delay = self.retry_strategy.get_delay(attempt)
+            print(f"🔄 Повтор страницы {page} через {delay:.1f} сек (попытка {attempt + 1})")
+            await asyncio.sleep(delay)
+            attempt += 1
+
     async def _fetch_page(
             self,
             session: ClientSession,
             query: str,
             area: int,
-            page: int
+            page: int,
+            extra_params: Optional[Dict] = None
     ) -> Optional[Dict]:
         """Получение одной страницы результатов."""
         params = {
@@ -219,7 +456,12 @@ class AsyncVacancySearcher(IVacancySearcher):
             'per_page': 100
         }
 
+        if extra_params:
+            params.update(extra_params)
+
         async with self.semaphore:
+            await self.rate_limiter.acquire()
+
             try:
                 async with session.get(
                         self.base_url,
@@ -233,10 +475,24 @@ class AsyncVacancySearcher(IVacancySearcher):
                         return None
 
                     response.raise_for_status()
-                    data = await response.json()
-                    await asyncio.sleep(0.1)
-                    return data
+                    return await response.json()
 
             except Exception as e:
                 print(f"⚠️  Ошибка на странице {page}: {e}")
                 return None
+
+
+def _date_window_params(date_from: datetime, date_to: datetime) -> Dict[str, str]:
+    """Параметры фильтра по дате публикации в формате ISO 8601"""
+    return {
+        'date_from': date_from.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'date_to': date_to.strftime('%Y-%m-%dT%H:%M:%S%z')
+    }
+
+
+def _incremental_params(date_from: str) -> Dict[str, str]:
+    """Параметры инкрементального поиска: новые вакансии, свежие первыми"""
+    return {
+        'date_from': date_from,
+        'order_by': 'publication_time'
+    }
@@ -7,6 +7,7 @@
 
 from config import Config
 from fetchers.searcher import SyncVacancySearcher, AsyncVacancySearcher
+from fetchers.http_session import SyncHttpClient
 from fetchers.details_fetcher import (
     SyncVacancyDetailsFetcher,
     AsyncVacancyDetailsFetcher
@@ -14,6 +15,13 @@ from fetchers.details_fetcher import (
 from analytics.analyzer import VacancyAnalyzer
 from visualization.visualizer import VacancyVisualizer
 from pipeline.vacancy_pipeline import VacancyPipeline
+from pipeline.batch_scheduler import BatchQueryScheduler
+from storage.vacancy_cache import SqliteVacancyCache
+from storage.watermark_store import WatermarkStore
+from storage.parquet_store import ParquetVacancyStore, PYARROW_AVAILABLE
+from core.interfaces import IVacancyCache
+from core.rate_limiter import TokenBucketRateLimiter
+from core.concurrency_controller import AdaptiveConcurrencyController
 from core.retry_strategy import (
     ExponentialBackoffRetry,
     LinearRetry,
@@ -27,12 +35,88 @@ from typing import Optional
 import sys
 
 
-def create_retry_strategy(config: Config) -> IRetryStrategy:
+def create_retry_strategy(config: Config) -> Optional[IRetryStrategy]:
     """
     Factory Method для создания стратегии повторных попыток
 
     Применяет Factory Pattern для гибкого создания объектов
     """
+    strategies = {
+        'exponential': ExponentialBackoffRetry,
+        'linear': LinearRetry,
+        'fibonacci': FibonacciBackoffRetry,
+        'exponential_jitter': ExponentialBackoffWithJitter,
+        'adaptive': AdaptiveRetry,
+        'circuit_breaker': CircuitBreakerRetry,
+    }
+
+    if not config.RETRY_STRATEGY:
+        return None
+
+    if config.RETRY_STRATEGY not in strategies:
+        raise ValueError(f"Неизвестная стратегия повторных попыток: {config.RETRY_STRATEGY}")
+
+    return strategies[config.RETRY_STRATEGY](max_attempts=config.RETRY_MAX_ATTEMPTS)
+
+
+def create_vacancy_cache(config: Config) -> Optional[IVacancyCache]:
+    """
+    Factory Method для создания постоянного кэша вакансий
+
+    Returns:
+        Кэш вакансий или None, если кэширование отключено
+    """
+    if not config.CACHE_ENABLED:
+        return None
+
+    return SqliteVacancyCache(
+        db_path=config.CACHE_PATH,
+        ttl_hours=config.CACHE_TTL_HOURS,
+        max_entries=config.CACHE_MAX_ENTRIES,
+        max_stale_hours=config.CACHE_MAX_STALE_HOURS
+    )
+
+
+def create_vacancy_store(config: Config) -> Optional[ParquetVacancyStore]:
+    """
+    Factory Method для создания хранилища набора данных Parquet
+
+    Returns:
+        Хранилище или None (raw.json и processed.csv)
+    """
+    if config.STORAGE_FORMAT != 'parquet':
+        return None
+
+    if not PYARROW_AVAILABLE:
+        print("⚠️  pyarrow не установлен - данные сохраняются в raw.json и processed.csv")
+        return None
+
+    return ParquetVacancyStore(root_dir=config.DATASET_DIR)
+
+
+def create_concurrency_controller(config: Config) -> Optional[AdaptiveConcurrencyController]:
+    """
+    Фабрика адаптивного контроллера параллельности.
+
+    Args:
+        config: Объект конфигурации приложения
+
+    Returns:
+        Optional[AdaptiveConcurrencyController]: Контроллер или None (фиксированный лимит)
+    """
+    if not config.ADAPTIVE_CONCURRENCY:
+        return None
+
+    return AdaptiveConcurrencyController(
+        initial_limit=config.MAX_CONCURRENT,
+        min_limit=config.MIN_CONCURRENT,
+        max_limit=config.MAX_CONCURRENT_CEILING
+    )
+
+
+def create_pipeline(config: Config) -> VacancyPipeline:
+    """
+    Фабрика для создания pipeline с нужными компонентами.
 
     Реализует Dependency Injection - все зависимости передаются извне.
     Следует принципу Open/Closed - легко добавить новые режимы работы.
@@ -43,17 +127,62 @@ def create_retry_strategy(config: Config) -> IRetryStrategy:
     Returns:
         VacancyPipeline: Настроенный pipeline для обработки вакансий
     """
+    retry_strategy = create_retry_strategy(config)
+    cache = create_vacancy_cache(config)
+
+    batch_scheduler = None
+
     # Выбор компонентов в зависимости от режима парсинга
     if config.PARSING_MODE == 'async':
-        searcher = AsyncVacancySearcher(max_concurrent=config.MAX_CONCURRENT)
-        details_fetcher = AsyncVacancyDetailsFetcher(
+        # Общий ограничитель: поиск и загрузка деталей делят один лимит API
+        rate_limiter = TokenBucketRateLimiter(
+            rate=config.RATE_LIMIT_PER_SECOND,
+            burst=config.RATE_LIMIT_BURST
+        )
+
+        searcher = AsyncVacancySearcher(
             max_concurrent=config.MAX_CONCURRENT,
+            rate_limiter=rate_limiter,
+            sharding=config.SEARCH_SHARDING,
+            search_period_days=config.SEARCH_PERIOD_DAYS,
             retry_strategy=retry_strategy
         )
+        details_fetcher = AsyncVacancyDetailsFetcher(
+            max_concurrent=config.MAX_CONCURRENT,
+            retry_strategy=retry_strategy,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            concurrency_controller=create_concurrency_controller(config)
+        )
+
+        # Параллельные batch-запросы через общую сессию и ограничитель
+        if config.BATCH_CONCURRENCY > 1:
+            batch_scheduler = BatchQueryScheduler(
+                searcher=searcher,
+                details_fetcher=details_fetcher,
+                max_concurrent_queries=config.BATCH_CONCURRENCY
+            )
     else:
-        searcher = SyncVacancySearcher()
+        # Общий пул keep-alive соединений для поиска и загрузки деталей
+        http_client = SyncHttpClient(
+            pool_size=max(10, config.SYNC_MAX_WORKERS),
+            http2=config.HTTP2_ENABLED
+        )
+        # Равномерный темп без burst, общий для поиска и загрузки деталей
+        rate_limiter = TokenBucketRateLimiter(
+            rate=config.SYNC_RATE_LIMIT_PER_SECOND,
+            burst=1
+        )
+        searcher = SyncVacancySearcher(
+            http_client=http_client,
+            rate_limiter=rate_limiter
+        )
         details_fetcher = SyncVacancyDetailsFetcher(
-            retry_strategy=retry_strategy
+            retry_strategy=retry_strategy,
+            cache=cache,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            max_workers=config.SYNC_MAX_WORKERS
         )
 
     # Создание компонента визуализации
@@ -65,7 +194,12 @@ def create_retry_strategy(config: Config) -> IRetryStrategy:
         details_fetcher=details_fetcher,
         analyzer_class=VacancyAnalyzer,
         visualizer=visualizer,
-        output_dir=config.OUTPUT_DIR
+        output_dir=config.OUTPUT_DIR,
+        streaming=config.STREAMING_MODE,
+        watermark_store=WatermarkStore(config.WATERMARKS_PATH) if config.INCREMENTAL_MODE else None,
+        batch_scheduler=batch_scheduler,
+        vacancy_store=create_vacancy_store(config),
+        compact_records=config.COMPACT_RECORDS
     )
 
     return pipeline
@@ -118,6 +252,17 @@ def main():
             max_vacancies=max_vacancies,
             max_pages=Config.MAX_PAGES_LIMIT,
             show_plots=Config.SHOW_PLOTS,
+            tech_keywords=Config.TECH_KEYWORDS,
+            resumable=Config.RESUMABLE_RUNS,
+            checkpoint_chunk_size=Config.CHECKPOINT_CHUNK_SIZE,
+            journal_max_age_hours=Config.JOURNAL_MAX_AGE_HOURS
+        )
+
+    elif Config.MODE == 'reprocess':
+        # Режим повторного анализа сохраненных данных (после изменения параметров)
+        pipeline.reprocess_all(
+            queries=Config.REPROCESS_QUERIES,
+            show_plots=Config.SHOW_PLOTS,
             tech_keywords=Config.TECH_KEYWORDS
         )
 
@@ -134,8 +279,8 @@ def print_footer(success: bool = True) -> None:
 💡 Проверьте директорию './result' для просмотра результатов
 
 📊 Доступные файлы:
-   • raw.json                          - Исходные данные вакансий
-   • processed.csv                     - Обработанные данные
+   • dataset/                          - Исходные и обработанные данные (Parquet)
+   • raw.json, processed.csv           - То же при STORAGE_FORMAT = 'json'
    • skills.csv                        - Анализ навыков
    • requirements.csv                  - Анализ требований
    • companies.csv                     - Топ компаний
@@ -150,7 +295,7 @@ def print_footer(success: bool = True) -> None:
     else:
         # Неизвестный режим
         print(f"❌ Неизвестный режим: {Config.MODE}")
-        print("   Используйте 'single' или 'batch'")
+        print("   Используйте 'single', 'batch' или 'reprocess'")
 
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@
 
 import re
 from html import unescape
-from typing import Optional
+from html.parser import HTMLParser
+from typing import List, Optional
 from bs4 import BeautifulSoup
 from core.interfaces import ITextCleaner
 
@@ -84,6 +85,167 @@ class HtmlTextCleaner(ITextCleaner):
         return '\n'.join(lines)
 
 
+class FastHtmlTextCleaner(HtmlTextCleaner):
+    """
+    Быстрая очистка HTML на потоковом парсере html.parser.
+
+    Дает тот же результат, что и HtmlTextCleaner, но не строит дерево
+    документа: текст блочных элементов собирается по событиям парсера.
+    Повторяет семантику BeautifulSoup:
+    - внешний блочный элемент превращается в '\n' + весь его текст + '\n'
+      (текст вложенных тегов склеивается без разделителя);
+    - текстовые узлы вне блочных элементов соединяются пробелом;
+    - содержимое script/style/template и комментарии в текст не попадают.
+    """
+
+    def clean(self, raw_text: str) -> str:
+        """
+        Очистка текста от HTML-разметки.
+
+        Args:
+            raw_text: Сырой HTML-текст
+
+        Returns:
+            Очищенный текст без HTML-тегов
+        """
+        if not raw_text:
+            return ""
+
+        parser = _TextCollectingParser(self.preserve_structure)
+        parser.feed(unescape(raw_text))
+        parser.close()
+
+        clean_text = ' '.join(parser.strings)
+        clean_text = self._normalize_whitespace(clean_text)
+
+        return clean_text.strip()
+
+
+class _TextCollectingParser(HTMLParser):
+    """Сбор текстовых узлов документа в порядке следования"""
+
+    BLOCK_TAGS = frozenset(['br', 'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+    # Элементы без содержимого - не открываются в стеке тегов
+    VOID_TAGS = frozenset([
+        'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed',
+        'frame', 'hr', 'image', 'img', 'input', 'isindex', 'keygen', 'link',
+        'menuitem', 'meta', 'nextid', 'param', 'source', 'spacer', 'track', 'wbr'
+    ])
+
+    # Элементы, содержимое которых не считается текстом
+    SKIP_TAGS = frozenset(['script', 'style', 'template'])
+
+    def __init__(self, preserve_structure: bool = True):
+        # Ссылки на символы разбираются вручную - так же, как в BeautifulSoup
+        super().__init__(convert_charrefs=False)
+        self.block_tags = self.BLOCK_TAGS if preserve_structure else frozenset()
+
+        self.strings: List[str] = []  # Текстовые узлы верхнего уровня
+        self._open_tags: List[str] = []
+        self._closed_void_tags: List[str] = []  # <br> без '/', ждущие </br>
+        self._pending: List[str] = []  # Текст текущего узла вне блоков
+        self._block_text: List[str] = []  # Текст внешнего блочного элемента
+        self._block_depth = 0
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        self._open_tag(tag)
+
+        if tag in self.VOID_TAGS:
+            self._closed_void_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._open_tag(tag)
+
+        if tag not in self.VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # Парный закрывающий тег пустого элемента (<br>...</br>) пропускается
+        if tag in self._closed_void_tags:
+            self._closed_void_tags.remove(tag)
+            return
+
+        self._flush()
+
+        # Закрывающий тег без открывающего игнорируется
+        if tag not in self._open_tags:
+            return
+
+        while self._open_tags:
+            if self._close_tag(self._open_tags.pop()) == tag:
+                break
+
+    def _open_tag(self, tag: str) -> None:
+        self._flush()
+
+        if tag in self.VOID_TAGS:
+            if tag in self.block_tags and not self._block_depth:
+                self.strings.append('\n\n')
+            return
+
+        self._open_tags.append(tag)
+
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        if tag in self.block_tags:
+            self._block_depth += 1
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+
+        if self._block_depth:
+            self._block_text.append(data)
+        else:
+            self._pending.append(data)
+
+    def handle_entityref(self, name):
+        # Неизвестная сущность остается текстом без ';' (как в BeautifulSoup)
+        character = unescape(f'&{name};')
+        self.handle_data(character if character != f'&{name};' else f'&{name}')
+
+    def handle_charref(self, name):
+        self.handle_data(unescape(f'&#{name};'))
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def close(self):
+        super().close()
+        self._flush()
+
+        # Незакрытые теги закрываются в конце документа
+        while self._open_tags:
+            self._close_tag(self._open_tags.pop())
+
+    def _close_tag(self, tag: str) -> str:
+        if tag in self.SKIP_TAGS:
+            self._skip_depth -= 1
+
+        if tag in self.block_tags:
+            self._block_depth -= 1
+
+            if not self._block_depth:
+                self.strings.append('\n' + ''.join(self._block_text) + '\n')
+                self._block_text = []
+
+        return tag
+
+    def _flush(self) -> None:
+        """Завершение текущего текстового узла верхнего уровня"""
+        if self._pending:
+            self.strings.append(''.join(self._pending))
+            self._pending = []
+
+
 class SimpleTextCleaner(ITextCleaner):
     """
     Упрощенная очистка текста без использования BeautifulSoup.
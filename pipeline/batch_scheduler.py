@@ -0,0 +1,236 @@
+"""
+Модуль параллельного выполнения batch-запросов.
+Ищет вакансии по нескольким запросам одновременно через общую
+HTTP-сессию и общий ограничитель частоты, загружает детали
+пересекающихся вакансий один раз и раздает их по запросам.
+"""
+
+import asyncio
+from typing import Any, Callable, List, Dict, Optional, Tuple
+
+from fetchers.searcher import AsyncVacancySearcher
+from fetchers.details_fetcher import AsyncVacancyDetailsFetcher
+
+
+class BatchQueryScheduler:
+    """
+    Планировщик batch-запросов.
+
+    Ограничение частоты и параллельности обеспечивают сами поисковик
+    и fetcher (их ограничители общие для всех запросов), планировщик
+    лишь задает, сколько поисков выполняется одновременно.
+    """
+
+    def __init__(
+            self,
+            searcher: AsyncVacancySearcher,
+            details_fetcher: AsyncVacancyDetailsFetcher,
+            max_concurrent_queries: int = 3
+    ):
+        """
+        Args:
+            searcher: Асинхронный поисковик
+            details_fetcher: Асинхронный fetcher деталей
+            max_concurrent_queries: Сколько запросов искать одновременно
+        """
+        self.searcher = searcher
+        self.details_fetcher = details_fetcher
+        self.max_concurrent_queries = max(1, max_concurrent_queries)
+
+    def collect(
+            self,
+            queries: List[str],
+            area: int = 1,
+            max_pages: int = 20,
+            max_vacancies: Optional[int] = None,
+            date_from_by_query: Optional[Dict[str, str]] = None,
+            searched: Optional[Dict[str, List[Dict]]] = None,
+            fetched: Optional[Dict[str, Dict]] = None,
+            on_search: Optional[Callable[[str, List[Dict]], None]] = None,
+            on_details: Optional[Callable[[List[Dict]], None]] = None,
+            on_query_complete: Optional[Callable[[str, List[Dict], List[Dict]], Any]] = None,
+            checkpoint_chunk_size: int = 200
+    ) -> Dict[str, Tuple[List[Dict], Any]]:
+        """
+        Синхронная обертка для collect_async.
+
+        Returns:
+            Dict: Для каждого запроса - результаты поиска и детали вакансий
+        """
+        try:
+            loop = asyncio.get_event_loop()
+            if loop.is_closed():
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+
+        return loop.run_until_complete(
+            self.collect_async(
+                queries,
+                area,
+                max_pages,
+                max_vacancies,
+                date_from_by_query,
+                searched=searched,
+                fetched=fetched,
+                on_search=on_search,
+                on_details=on_details,
+                on_query_complete=on_query_complete,
+                checkpoint_chunk_size=checkpoint_chunk_size
+            )
+        )
+
+    async def collect_async(
+            self,
+            queries: List[str],
+            area: int = 1,
+            max_pages: int = 20,
+            max_vacancies: Optional[int] = None,
+            date_from_by_query: Optional[Dict[str, str]] = None,
+            searched: Optional[Dict[str, List[Dict]]] = None,
+            fetched: Optional[Dict[str, Dict]] = None,
+            on_search: Optional[Callable[[str, List[Dict]], None]] = None,
+            on_details: Optional[Callable[[List[Dict]], None]] = None,
+            on_query_complete: Optional[Callable[[str, List[Dict], List[Dict]], Any]] = None,
+            checkpoint_chunk_size: int = 200
+    ) -> Dict[str, Tuple[List[Dict], Any]]:
+        """
+        Поиск по всем запросам и загрузка деталей уникальных вакансий.
+
+        Args:
+            queries: Список запросов
+            area: Код региона
+            max_pages: Максимальное количество страниц на запрос
+            max_vacancies: Максимальное количество вакансий на запрос
+            date_from_by_query: Водяные знаки инкрементального режима по запросам
+            searched: Уже известные результаты поиска (запросы не ищутся повторно)
+            fetched: Уже полученные детали по ID (не загружаются повторно;
+                словарь используется как хранилище деталей и освобождается
+                по мере завершения запросов)
+            on_search: Вызывается с результатами каждого завершенного поиска
+            on_details: Вызывается с каждой порцией полученных деталей
+            on_query_complete: Вызывается с результатами поиска и деталями запроса,
+                как только получены все его детали; возвращаемое значение
+                заменяет детали в результате (например, компактные записи),
+                а сырые ответы API запроса сразу освобождаются
+            checkpoint_chunk_size: Размер порции деталей для on_details
+
+        Returns:
+            Dict: Для каждого запроса - результаты поиска и детали вакансий
+                  (в порядке выдачи поиска) или результат on_query_complete
+        """
+        date_from_by_query = date_from_by_query or {}
+        searched = searched or {}
+        details_by_id = fetched if fetched is not None else {}
+        checkpoint_chunk_size = max(1, checkpoint_chunk_size)
+        search_slots = asyncio.Semaphore(self.max_concurrent_queries)
+
+        print(f"\n🚦 Параллельный сбор: {len(queries)} запросов, "
+              f"одновременно до {self.max_concurrent_queries}")
+
+        async with self.details_fetcher.create_session() as session:
+
+            async def search(query: str) -> List[Dict]:
+                if query in searched:
+                    return searched[query]
+
+                async with search_slots:
+                    vacancies = await self.searcher.search_async(
+                        query,
+                        area,
+                        max_pages,
+                        max_vacancies,
+                        date_from_by_query.get(query),
+                        session=session
+                    )
+
+                if on_search:
+                    on_search(query, vacancies)
+
+                return vacancies
+
+            search_results = await asyncio.gather(*[search(query) for query in queries])
+
+            # Вакансии, найденные по нескольким запросам, загружаются один раз
+            unique_ids = []
+            # Сколько незавершенных запросов ждут деталь вакансии
+            waiting = {}
+            for vacancies in search_results:
+                for vac_id in dict.fromkeys(str(vacancy['id']) for vacancy in vacancies):
+                    if vac_id not in waiting:
+                        waiting[vac_id] = 0
+                        unique_ids.append(vac_id)
+                    waiting[vac_id] += 1
+
+            total = sum(len(vacancies) for vacancies in search_results)
+            print(f"\n🔗 Уникальных вакансий: {len(unique_ids)} из {total} "
+                  f"(пересечений между запросами: {total - len(unique_ids)})")
+
+            missing_ids = [vac_id for vac_id in unique_ids if vac_id not in details_by_id]
+            if len(missing_ids) < len(unique_ids):
+                print(f"♻️  Деталей уже получено: {len(unique_ids) - len(missing_ids)}, "
+                      f"осталось получить: {len(missing_ids)}")
+
+            results: Dict[str, Tuple[List[Dict], Any]] = {}
+            missing = set(missing_ids)
+            pending = {
+                query: {str(vacancy['id']) for vacancy in vacancies} & missing
+                for query, vacancies in zip(queries, search_results)
+            }
+            search_by_query = dict(zip(queries, search_results))
+
+            def complete(query: str) -> None:
+                # Детали завершенного запроса отдаются, сырые ответы,
+                # не нужные другим запросам, освобождаются
+                vacancies = search_by_query[query]
+                details = [
+                    details_by_id[str(vacancy['id'])] for vacancy in vacancies
+                    if str(vacancy['id']) in details_by_id
+                ]
+                del pending[query]
+
+                for vac_id in {str(vacancy['id']) for vacancy in vacancies}:
+                    waiting[vac_id] -= 1
+                    if not waiting[vac_id]:
+                        details_by_id.pop(vac_id, None)
+
+                results[query] = (
+                    vacancies,
+                    on_query_complete(query, vacancies, details) if on_query_complete else details
+                )
+
+            def complete_ready(chunk_ids: List[str]) -> None:
+                for query in list(pending):
+                    pending[query].difference_update(chunk_ids)
+                    if not pending[query]:
+                        complete(query)
+
+            # Запросы, все детали которых уже известны
+            complete_ready([])
+
+            # Детали отдаются порциями по мере получения (контрольные точки);
+            # после записи порции завершаются запросы, получившие все детали
+            chunk = []
+            async for vacancy in self.details_fetcher.iter_details_async(
+                    missing_ids,
+                    session=session
+            ):
+                details_by_id[str(vacancy['id'])] = vacancy
+                chunk.append(vacancy)
+
+                if len(chunk) >= checkpoint_chunk_size:
+                    if on_details:
+                        on_details(chunk)
+                    complete_ready([str(item['id']) for item in chunk])
+                    chunk = []
+
+            if chunk and on_details:
+                on_details(chunk)
+
+            # Оставшиеся запросы (часть деталей не удалось получить)
+            for query in list(pending):
+                complete(query)
+
+        return {query: results[query] for query in queries}
@@ -0,0 +1,181 @@
+"""
+Модуль журнала batch-запуска.
+Сохраняет контрольные точки по каждому запросу (результаты поиска,
+полученные детали, завершенные этапы), чтобы перезапуск после сбоя
+продолжал работу с последней сохраненной точки.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional
+
+
+class RunJournal:
+    """
+    Журнал batch-запуска.
+
+    Идентификатор запуска вычисляется по параметрам batch-а, поэтому
+    повторный запуск с теми же параметрами продолжает незавершенный.
+    После успешного завершения журнал удаляется; устаревший журнал
+    (результаты поиска в нем уже не актуальны) удаляется при открытии.
+    """
+
+    def __init__(
+            self,
+            base_dir: Path,
+            run_params: Dict,
+            chunk_size: int = 200,
+            max_age_hours: Optional[float] = 24.0
+    ):
+        """
+        Args:
+            base_dir: Директория, в которой хранятся журналы запусков
+            run_params: Параметры запуска (запросы, регион, лимиты)
+            chunk_size: Размер порции деталей между контрольными точками
+            max_age_hours: Через сколько часов после начала запуска журнал
+                           устаревает и запуск начинается заново (None = не устаревает)
+        """
+        fingerprint = json.dumps(run_params, ensure_ascii=False, sort_keys=True)
+        run_id = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:12]
+
+        self.run_dir = Path(base_dir) / run_id
+        self.chunk_size = max(1, chunk_size)
+        self._lock = threading.Lock()
+
+        if self.run_dir.exists() and _is_expired(self.run_dir / 'params.json', max_age_hours):
+            print(f"🗑️  Журнал прерванного запуска старше {max_age_hours} ч - запуск начнется заново")
+            shutil.rmtree(self.run_dir, ignore_errors=True)
+
+        self.resumed = self.run_dir.exists()
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+
+        self._state_path = self.run_dir / 'state.json'
+        self._state: Dict[str, Dict] = _read_json(self._state_path) or {}
+
+        if not self.resumed:
+            _write_json_atomic(self.run_dir / 'params.json', run_params)
+
+    def for_query(self, query: str) -> 'QueryJournal':
+        """Журнал отдельного запроса"""
+        return QueryJournal(self, query)
+
+    def get_stage(self, query: str, stage: str) -> Optional[Dict]:
+        with self._lock:
+            return self._state.get(query, {}).get(stage)
+
+    def mark_stage(self, query: str, stage: str, data: Optional[Dict] = None) -> None:
+        with self._lock:
+            self._state.setdefault(query, {})[stage] = data if data is not None else {}
+            _write_json_atomic(self._state_path, self._state)
+
+    def finish(self) -> None:
+        """Удаление журнала после успешного завершения запуска"""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+
+class QueryJournal:
+    """Контрольные точки одного запроса внутри журнала запуска"""
+
+    def __init__(self, run_journal: RunJournal, query: str):
+        self.run_journal = run_journal
+        self.query = query
+        self.chunk_size = run_journal.chunk_size
+
+        safe_query = query.replace(' ', '_').replace('/', '_').lower()
+        self._search_path = run_journal.run_dir / f'{safe_query}.search.json'
+        self._details_path = run_journal.run_dir / f'{safe_query}.details.jsonl'
+
+    def load_search(self) -> Optional[List[Dict]]:
+        """Результаты поиска из журнала (None, если поиск не завершен)"""
+        if not self.is_done('search'):
+            return None
+        return _read_json(self._search_path)
+
+    def save_search(self, vacancies: List[Dict]) -> None:
+        _write_json_atomic(self._search_path, vacancies)
+        self.mark('search')
+
+    def load_details(self) -> List[Dict]:
+        """Уже полученные детали (неполная последняя строка отбрасывается)"""
+        if not self._details_path.exists():
+            return []
+
+        details = []
+        valid_size = 0
+
+        with open(self._details_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    details.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+                valid_size += len(line)
+
+        # Обрезаем строку, оборванную сбоем, чтобы дописывать после целых
+        if valid_size < self._details_path.stat().st_size:
+            with open(self._details_path, 'r+b') as f:
+                f.truncate(valid_size)
+
+        return details
+
+    def append_details(self, vacancies: List[Dict]) -> None:
+        """Дописывает порцию деталей и сбрасывает ее на диск"""
+        with open(self._details_path, 'a', encoding='utf-8') as f:
+            for vacancy in vacancies:
+                f.write(json.dumps(vacancy, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def is_done(self, stage: str) -> bool:
+        return self.run_journal.get_stage(self.query, stage) is not None
+
+    def get(self, stage: str) -> Optional[Dict]:
+        return self.run_journal.get_stage(self.query, stage)
+
+    def mark(self, stage: str, data: Optional[Dict] = None) -> None:
+        self.run_journal.mark_stage(self.query, stage, data)
+
+
+def _is_expired(params_path: Path, max_age_hours: Optional[float]) -> bool:
+    """Журнал устарел (время начала запуска - время записи params.json)"""
+    if max_age_hours is None:
+        return False
+
+    if not params_path.exists():
+        return True
+
+    return time.time() - params_path.stat().st_mtime > max_age_hours * 3600
+
+
+def _read_json(path: Path):
+    if not path.exists():
+        return None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Запись через временный файл: после сбоя остается старая или новая версия"""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, default=_to_builtin)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def _to_builtin(value):
+    """Преобразование скаляров numpy/pandas (например, в сводке) для JSON"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
@@ -3,9 +3,12 @@
 Объединяет все компоненты системы (Facade pattern).
 """
 
+import asyncio
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
 import pandas as pd
 
 from config import Config  # ← ПЕРЕНЕСЕН В НАЧАЛО
@@ -17,13 +20,27 @@ from core.interfaces import (
     IDescriptionProcessor
 )
 from storage.savers import JsonSaver, CsvSaver
-from parsers.text_cleaner import HtmlTextCleaner
+from storage.watermark_store import WatermarkStore
+from storage.parquet_store import ParquetVacancyStore
+from storage.raw_reader import iter_json_array
+from core.vacancy_record import VacancyRecord, to_records
+from pipeline.run_journal import RunJournal, QueryJournal
+from pipeline.batch_scheduler import BatchQueryScheduler
+from parsers.text_cleaner import HtmlTextCleaner, FastHtmlTextCleaner
 from extractors.requirements_extractor import (
     RequirementsExtractor,
     SkillsBasedRequirementsExtractor
 )
 from extractors.responsibilities_extractor import ResponsibilitiesExtractor
+from extractors.section_segmenter import SectionSegmenter
 from processors.description_processor import VacancyDescriptionProcessor
+from extractors.near_duplicates import PhraseClusterer
+from processors.memoization import (
+    MemoStore,
+    CachedTextCleaner,
+    CachedSectionExtractor,
+    CachedItemClassifier
+)
 
 
 class VacancyPipeline:
@@ -41,7 +58,12 @@ class VacancyPipeline:
             details_fetcher: IVacancyDetailsFetcher,
             analyzer_class: type,
             visualizer: IVacancyVisualizer,
-            output_dir: str = "./result"
+            output_dir: str = "./result",
+            streaming: bool = False,
+            watermark_store: Optional[WatermarkStore] = None,
+            batch_scheduler: Optional[BatchQueryScheduler] = None,
+            vacancy_store: Optional[ParquetVacancyStore] = None,
+            compact_records: bool = False
     ):
         """
         Инициализация pipeline.
@@ -52,16 +74,31 @@ class VacancyPipeline:
             analyzer_class: Класс анализатора (будет создан для каждого запроса)
             visualizer: Компонент для визуализации
             output_dir: Базовая директория для результатов
+            streaming: Обрабатывать описания по мере получения вакансий
+            watermark_store: Хранилище водяных знаков (None = полный сбор при каждом запуске)
+            batch_scheduler: Планировщик параллельного batch-сбора (None = запросы по очереди)
+            vacancy_store: Набор данных Parquet для сырых и обработанных данных
+                (None = raw.json и processed.csv в директории запроса)
+            compact_records: После сохранения сырых данных хранить вакансии
+                компактными записями VacancyRecord (только поля для анализа)
         """
         self.searcher = searcher
         self.details_fetcher = details_fetcher
         self.analyzer_class = analyzer_class
         self.visualizer = visualizer
         self.output_dir = Path(output_dir)
+        self.streaming = streaming
+        self.watermark_store = watermark_store
+        self.batch_scheduler = batch_scheduler
+        self.vacancy_store = vacancy_store
+        self.compact_records = compact_records
 
         self.json_saver = JsonSaver()
         self.csv_saver = CsvSaver()
 
+        # Создается при первой обработке описаний
+        self._memo_store: Optional[MemoStore] = None
+
     def process_single_query(
             self,
             query: str,
@@ -70,7 +107,9 @@ class VacancyPipeline:
             max_pages: int = 20,
             show_plots: bool = False,
             tech_keywords: Optional[List[str]] = None,
-            process_descriptions: bool = True
+            process_descriptions: bool = True,
+            journal: Optional[QueryJournal] = None,
+            prefetched: Optional[Tuple[List[Dict], List[Union[Dict, VacancyRecord]]]] = None
     ) -> Dict:
         """
         Обработка одного запроса.
@@ -83,50 +122,156 @@ class VacancyPipeline:
             show_plots: Показывать ли графики
             tech_keywords: Ключевые слова для анализа требований
             process_descriptions: Обрабатывать ли описания для извлечения требований/задач
+            journal: Журнал контрольных точек запроса (None = без возобновления)
+            prefetched: Результаты поиска и вакансии, уже сохраненные во время
+                batch-сбора (_collect_batch)
 
         Returns:
             Словарь со статистикой анализа
         """
-        safe_query = query.replace(' ', '_').replace('/', '_').lower()
-        output_dir = self.output_dir / safe_query
+        output_dir = self._query_output_dir(query)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         print(f"\n{'=' * 60}")
         print(f"📊 Анализ: {query}")
         print(f"{'=' * 60}")
 
+        if prefetched is None:
+            # Инкрементальный режим: ищем только вакансии новее водяного знака
+            watermark, previous_vacancies = self._load_incremental_state(query, area, output_dir)
+        else:
+            # Сырые данные уже объединены с набором и сохранены во время сбора
+            watermark, previous_vacancies = self._incremental_watermark(query, area), []
+
         # 1. Поиск вакансий
-        vacancies_list = self.searcher.search(
-            query,
-            area,
-            max_pages=max_pages,
-            max_vacancies=max_vacancies
-        )
+        vacancies_list = journal.load_search() if journal else None
+
+        if prefetched is not None:
+            # Поиск и детали уже записаны в журнал во время сбора (_collect_batch)
+            vacancies_list = prefetched[0]
+        elif vacancies_list is not None:
+            print(f"♻️  Результаты поиска восстановлены из журнала: {len(vacancies_list)}")
+        else:
+            vacancies_list = self.searcher.search(
+                query,
+                area,
+                max_pages=max_pages,
+                max_vacancies=max_vacancies,
+                date_from=watermark
+            )
+
+            if journal:
+                journal.save_search(vacancies_list)
 
         if not vacancies_list:
-            print(f"❌ Вакансии не найдены для: {query}")
+            if watermark:
+                print(f"🆕 Новых вакансий нет, данные актуальны: {query}")
+            else:
+                print(f"❌ Вакансии не найдены для: {query}")
             return {}
 
         # 2. Получение детальной информации
-        detailed_vacancies = self.details_fetcher.fetch_details(vacancies_list)
+        description_processor = None
+        descriptions_df = None
+
+        if prefetched is not None:
+            # Детали сохранены и преобразованы при завершении сбора запроса
+            detailed_vacancies = prefetched[1]
+
+        elif journal:
+            # Детали сохраняются порциями - при сбое загрузка продолжится.
+            # В потоковом режиме порции сразу передаются процессору описаний
+            # (если описания еще не обработаны по журналу)
+            if (self.streaming and not previous_vacancies and process_descriptions
+                    and not journal.is_done('descriptions')):
+                description_processor = self._create_description_processor(tech_keywords)
+
+            detailed_vacancies, descriptions_df = self._fetch_details_checkpointed(
+                vacancies_list,
+                journal,
+                description_processor
+            )
+
+        # При дозагрузке описания обрабатываются по объединенному набору
+        elif self.streaming and not previous_vacancies:
+            # Описания обрабатываются параллельно с загрузкой
+            if process_descriptions:
+                description_processor = self._create_description_processor(tech_keywords)
+
+            detailed_vacancies, descriptions_df = self._fetch_details_streaming(
+                vacancies_list,
+                description_processor
+            )
+        else:
+            detailed_vacancies = self.details_fetcher.fetch_details(vacancies_list)
 
         if not detailed_vacancies:
             print(f"❌ Не удалось получить детали для: {query}")
             return {}
 
-        # 3. Сохранение сырых данных
-        self.json_saver.save(
+        # 3. Сохранение сырых данных (при batch-сборе - уже выполнено)
+        if prefetched is None:
+            detailed_vacancies = self._store_raw_vacancies(
+                query,
+                area,
+                output_dir,
+                detailed_vacancies,
+                previous_vacancies
+            )
+
+        return self._analyze_vacancies(
+            query,
+            output_dir,
             detailed_vacancies,
-            str(output_dir / 'raw.json')
+            show_plots=show_plots,
+            tech_keywords=tech_keywords,
+            process_descriptions=process_descriptions,
+            journal=journal,
+            description_processor=description_processor,
+            descriptions_df=descriptions_df
         )
 
+    def _analyze_vacancies(
+            self,
+            query: str,
+            output_dir: Path,
+            vacancies: Iterable[Dict],
+            show_plots: bool = False,
+            tech_keywords: Optional[List[str]] = None,
+            process_descriptions: bool = True,
+            journal: Optional[QueryJournal] = None,
+            description_processor: Optional[VacancyDescriptionProcessor] = None,
+            descriptions_df: Optional[pd.DataFrame] = None
+    ) -> Dict:
+        """
+        Анализ собранных вакансий и сохранение всех результатов запроса.
+
+        Args:
+            query: Название должности
+            output_dir: Директория результатов запроса
+            vacancies: Вакансии с детальной информацией (или однократный
+                итератор, если описания обрабатываются во время чтения)
+            show_plots: Показывать ли графики
+            tech_keywords: Ключевые слова для анализа требований
+            process_descriptions: Обрабатывать ли описания для извлечения требований/задач
+            journal: Журнал контрольных точек запроса (None = без возобновления)
+            description_processor: Процессор, уже получивший все вакансии
+            descriptions_df: Результат процессора (None - процессор еще не завершен)
+
+        Returns:
+            Словарь со статистикой анализа
+        """
+
         # 4. Анализ данных
         print(f"\n📊 Анализ данных...")
-        analyzer = self.analyzer_class(detailed_vacancies)
+        analyzer = self.analyzer_class(vacancies)
         df = analyzer.extract_data()
 
         # 5. Сохранение обработанных данных
-        self.csv_saver.save(df, str(output_dir / 'processed.csv'))
+        if self.vacancy_store:
+            self.vacancy_store.save_processed(output_dir.name, df)
+        else:
+            self.csv_saver.save(df, str(output_dir / 'processed.csv'))
 
         # 6. Анализ навыков
         skills_df = analyzer.analyze_skills()
@@ -165,15 +310,33 @@ class VacancyPipeline:
 
         # ========== ОБРАБОТКА ОПИСАНИЙ ==========
 
-        description_processor = None
+        desc_stats = journal.get('descriptions') if journal else None
 
-        if process_descriptions:
+        if desc_stats is not None:
+            print(f"\n♻️  Описания уже обработаны (журнал), этап пропущен")
+        elif description_processor:
+            if descriptions_df is None:
+                # Вакансии переданы процессору во время их чтения анализатором
+                descriptions_df = description_processor.finalize()
+
+            self._save_description_results(
+                description_processor,
+                descriptions_df,
+                output_dir
+            )
+        elif process_descriptions:
             description_processor = self._process_vacancy_descriptions(
-                detailed_vacancies,
+                vacancies,
                 output_dir,
                 tech_keywords
             )
 
+        if description_processor:
+            desc_stats = description_processor.get_statistics()
+
+            if journal:
+                journal.mark('descriptions', desc_stats)
+
         # =========================================
 
         # 12. Визуализация
@@ -201,18 +364,199 @@ class VacancyPipeline:
         }
 
         # Добавление статистики по описаниям
-        if description_processor:
-            desc_stats = description_processor.get_statistics()
+        if desc_stats is not None:
             summary.update({
                 'Извлечено требований': desc_stats.get('total_requirements_extracted', 0),
                 'Извлечено обязанностей': desc_stats.get('total_responsibilities_extracted', 0),
             })
 
+        if journal:
+            journal.mark('done', summary)
+
         print(f"\n✅ Анализ завершен для: {query}")
         print(f"📁 Результаты в папке: {output_dir}")
 
         return summary
 
+    def _fetch_details_checkpointed(
+            self,
+            vacancies_list: List[Dict],
+            journal: QueryJournal,
+            processor: Optional[VacancyDescriptionProcessor] = None
+    ) -> Tuple[List[Dict], Optional[pd.DataFrame]]:
+        """
+        Получение деталей порциями с сохранением каждой порции в журнал.
+
+        Если передан процессор (потоковый режим), каждая порция сразу
+        передается ему и обрабатывается в рабочем потоке, пока загружается
+        следующая; восстановленные из журнала детали обрабатываются первыми.
+
+        Args:
+            vacancies_list: Результаты поиска
+            journal: Журнал контрольных точек запроса
+            processor: Процессор описаний (None = без обработки описаний)
+
+        Returns:
+            Вакансии с детальной информацией в порядке поиска
+            и DataFrame процессора (None, если процессор не передан)
+        """
+        detailed_vacancies = journal.load_details()
+        done_ids = {str(vacancy['id']) for vacancy in detailed_vacancies}
+        remaining = [v for v in vacancies_list if str(v['id']) not in done_ids]
+
+        if detailed_vacancies:
+            print(f"♻️  Деталей восстановлено из журнала: {len(detailed_vacancies)}, "
+                  f"осталось получить: {len(remaining)}")
+
+        if processor:
+            print(f"\n📝 Потоковая обработка описаний вакансий...")
+            processor.reset()
+
+        # Один рабочий поток: состояние процессора изменяется последовательно
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = []
+
+            if processor and detailed_vacancies:
+                pending.append(executor.submit(processor.add_vacancies, list(detailed_vacancies)))
+
+            for i in range(0, len(remaining), journal.chunk_size):
+                chunk = remaining[i:i + journal.chunk_size]
+                details = self.details_fetcher.fetch_details(chunk)
+
+                journal.append_details(details)
+                detailed_vacancies.extend(details)
+
+                if processor:
+                    pending.append(executor.submit(processor.add_vacancies, details))
+
+            for future in pending:
+                future.result()
+
+        position = {str(v['id']): i for i, v in enumerate(vacancies_list)}
+        detailed_vacancies.sort(key=lambda vac: position.get(str(vac['id']), len(position)))
+
+        df = processor.finalize([str(v['id']) for v in vacancies_list]) if processor else None
+
+        return detailed_vacancies, df
+
+    def _query_output_dir(self, query: str) -> Path:
+        """Директория результатов запроса"""
+        safe_query = query.replace(' ', '_').replace('/', '_').lower()
+        return self.output_dir / safe_query
+
+    def _incremental_watermark(self, query: str, area: int) -> Optional[str]:
+        """Водяной знак запроса (None = полный сбор)"""
+        if not self.watermark_store:
+            return None
+
+        # Без сохраненного набора дозагрузка невозможна - полный сбор
+        if not self._has_raw_vacancies(self._query_output_dir(query)):
+            return None
+
+        return self.watermark_store.get(query, area)
+
+    def _load_incremental_state(
+            self,
+            query: str,
+            area: int,
+            output_dir: Path
+    ) -> Tuple[Optional[str], List[Dict]]:
+        """
+        Загрузка водяного знака и ранее собранных вакансий.
+
+        Args:
+            query: Название должности
+            area: Код региона
+            output_dir: Директория результатов запроса
+
+        Returns:
+            Водяной знак (None = полный сбор) и ранее собранные вакансии
+        """
+        watermark = self._incremental_watermark(query, area)
+
+        if not watermark:
+            return None, []
+
+        previous_vacancies = self._load_raw_vacancies(output_dir)
+
+        print(f"🔁 Инкрементальный режим: вакансии, опубликованные после {watermark} "
+              f"(в наборе {len(previous_vacancies)})")
+
+        return watermark, previous_vacancies
+
+    def _store_raw_vacancies(
+            self,
+            query: str,
+            area: int,
+            output_dir: Path,
+            detailed_vacancies: List[Dict],
+            previous_vacancies: List[Dict]
+    ) -> List[Union[Dict, VacancyRecord]]:
+        """
+        Объединение с ранее собранным набором, сохранение и сдвиг водяного знака.
+
+        Args:
+            query: Название должности
+            area: Код региона
+            output_dir: Директория результатов запроса
+            detailed_vacancies: Новые вакансии с детальной информацией
+            previous_vacancies: Ранее собранные вакансии (инкрементальный режим)
+
+        Returns:
+            Сохраненный набор (компактными записями, если включено compact_records)
+        """
+        if previous_vacancies:
+            new_count = len(detailed_vacancies)
+            detailed_vacancies = _merge_vacancies(detailed_vacancies, previous_vacancies)
+            print(f"🔗 Новых и обновленных вакансий: {new_count}, "
+                  f"всего в наборе: {len(detailed_vacancies)}")
+
+        self._save_raw_vacancies(detailed_vacancies, output_dir)
+
+        # Водяной знак сдвигается только после сохранения данных
+        if self.watermark_store:
+            self.watermark_store.update(query, area, detailed_vacancies)
+
+        # Полные ответы API больше не нужны - дальше только поля для анализа
+        if self.compact_records:
+            return to_records(detailed_vacancies)
+
+        return detailed_vacancies
+
+    def _save_raw_vacancies(self, vacancies: List[Dict], output_dir: Path) -> None:
+        """Сохранение сырых вакансий (набор Parquet или raw.json)"""
+        if self.vacancy_store:
+            self.vacancy_store.save_vacancies(output_dir.name, vacancies)
+        else:
+            self.json_saver.save(vacancies, str(output_dir / 'raw.json'))
+
+    def _has_raw_vacancies(self, output_dir: Path) -> bool:
+        """Есть ли сохраненные сырые вакансии запроса"""
+        if self.vacancy_store and self.vacancy_store.has_vacancies(output_dir.name):
+            return True
+
+        return (output_dir / 'raw.json').exists()
+
+    def _load_raw_vacancies(self, output_dir: Path) -> List[Dict]:
+        """
+        Сырые вакансии последнего запуска запроса.
+
+        Набор Parquet имеет приоритет; raw.json читается, если запрос
+        еще не сохранялся в набор (например, до смены STORAGE_FORMAT).
+        """
+        if self.vacancy_store and self.vacancy_store.has_vacancies(output_dir.name):
+            return self.vacancy_store.load_latest_vacancies(output_dir.name)
+
+        with open(output_dir / 'raw.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _iter_raw_vacancies(self, output_dir: Path) -> Iterator[Dict]:
+        """Потоковое чтение сырых вакансий последнего запуска (приоритет как у загрузки)"""
+        if self.vacancy_store and self.vacancy_store.has_vacancies(output_dir.name):
+            return self.vacancy_store.iter_latest_vacancies(output_dir.name)
+
+        return iter_json_array(output_dir / 'raw.json')
+
     def _process_vacancy_descriptions(
             self,
             detailed_vacancies: List[Dict],
@@ -232,8 +576,106 @@ class VacancyPipeline:
         """
         print(f"\n📝 Обработка описаний вакансий...")
 
+        processor = self._create_description_processor(tech_keywords)
+
+        # Обработка вакансий
+        df = processor.process_vacancies(detailed_vacancies)
+
+        self._save_description_results(processor, df, output_dir)
+
+        return processor
+
+    def _fetch_details_streaming(
+            self,
+            vacancies_list: List[Dict],
+            processor: Optional[VacancyDescriptionProcessor] = None
+    ) -> Tuple[List[Dict], Optional[pd.DataFrame]]:
+        """
+        Потоковое получение деталей с одновременной обработкой описаний.
+
+        Args:
+            vacancies_list: Результаты поиска (список словарей с 'id')
+            processor: Процессор описаний (None = без обработки описаний)
+
+        Returns:
+            Вакансии с детальной информацией в порядке поиска
+            и DataFrame процессора (None, если процессор не передан)
+        """
+        return _run_until_complete(
+            self._stream_details(vacancies_list, processor)
+        )
+
+    async def _stream_details(
+            self,
+            vacancies_list: List[Dict],
+            processor: Optional[VacancyDescriptionProcessor]
+    ) -> Tuple[List[Dict], Optional[pd.DataFrame]]:
+        """Получает вакансии через асинхронный итератор и обрабатывает их на лету"""
+        loop = asyncio.get_running_loop()
+        ids = [str(v['id']) if isinstance(v, dict) else str(v) for v in vacancies_list]
+
+        detailed_vacancies = []
+        pending = []
+
+        if processor:
+            print(f"\n📝 Потоковая обработка описаний вакансий...")
+            processor.reset()
+
+        # Один рабочий поток: CPU-обработка идет параллельно с сетью,
+        # а состояние процессора изменяется последовательно. Вакансии
+        # передаются порциями, чтобы процессор мог распределить их по процессам
+        chunk_size = processor.PARALLEL_MIN_VACANCIES if processor else 0
+        buffer = []
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            async for vacancy in self.details_fetcher.iter_details_async(vacancies_list):
+                detailed_vacancies.append(vacancy)
+
+                if processor:
+                    buffer.append(vacancy)
+
+                    if len(buffer) >= chunk_size:
+                        pending.append(
+                            loop.run_in_executor(executor, processor.add_vacancies, buffer)
+                        )
+                        buffer = []
+
+            if buffer:
+                pending.append(
+                    loop.run_in_executor(executor, processor.add_vacancies, buffer)
+                )
+
+            await asyncio.gather(*pending)
+
+        # Вакансии приходят в порядке готовности - восстанавливаем порядок поиска
+        position = {vac_id: i for i, vac_id in enumerate(ids)}
+        detailed_vacancies.sort(key=lambda vac: position.get(str(vac.get('id')), len(position)))
+
+        df = processor.finalize(ids) if processor else None
+
+        return detailed_vacancies, df
+
+    def _create_description_processor(
+            self,
+            tech_keywords: Optional[List[str]] = None
+    ) -> VacancyDescriptionProcessor:
+        """
+        Создание процессора описаний с экстракторами из Config.
+
+        Args:
+            tech_keywords: Ключевые слова для анализа требований
+
+        Returns:
+            Процессор описаний вакансий
+        """
         # Создание компонентов
-        text_cleaner = HtmlTextCleaner(preserve_structure=True)
+        if Config.HTML_CLEANER == 'bs4':
+            text_cleaner = HtmlTextCleaner(preserve_structure=True)
+        else:
+            text_cleaner = FastHtmlTextCleaner(preserve_structure=True)
+
+        # Разметка описаний на секции - общая для обоих экстракторов
+        segmenter = SectionSegmenter()
 
         # Выбор экстрактора требований
         if tech_keywords:
@@ -242,14 +684,16 @@ class VacancyPipeline:
                 min_length=Config.REQ_MIN_LENGTH,
                 max_length=Config.REQ_MAX_LENGTH,
                 min_words=Config.REQ_MIN_WORDS,
-                similarity_threshold=Config.SIMILARITY_THRESHOLD
+                similarity_threshold=Config.SIMILARITY_THRESHOLD,
+                segmenter=segmenter
             )
         else:
             requirements_extractor = RequirementsExtractor(
                 min_length=Config.REQ_MIN_LENGTH,
                 max_length=Config.REQ_MAX_LENGTH,
                 min_words=Config.REQ_MIN_WORDS,
-                similarity_threshold=Config.SIMILARITY_THRESHOLD
+                similarity_threshold=Config.SIMILARITY_THRESHOLD,
+                segmenter=segmenter
             )
 
         # ========== ИСПРАВЛЕНО: используем параметры из Config ==========
@@ -257,21 +701,61 @@ class VacancyPipeline:
             min_length=Config.RESP_MIN_LENGTH,
             max_length=Config.RESP_MAX_LENGTH,
             min_words=Config.RESP_MIN_WORDS,
-            similarity_threshold=Config.SIMILARITY_THRESHOLD
+            similarity_threshold=Config.SIMILARITY_THRESHOLD,
+            segmenter=segmenter
         )
         # ================================================================
 
+        # Кэширование результатов по хэшу текста
+        classifier = None
+        if Config.MEMO_ENABLED:
+            store = self._get_memo_store()
+            text_cleaner = CachedTextCleaner(text_cleaner, store)
+            requirements_extractor = CachedSectionExtractor(requirements_extractor, store)
+            responsibilities_extractor = CachedSectionExtractor(responsibilities_extractor, store)
+            classifier = CachedItemClassifier(store)
+
         # Создание процессора с классификатором
         processor = VacancyDescriptionProcessor(
             text_cleaner=text_cleaner,
             requirements_extractor=requirements_extractor,
             responsibilities_extractor=responsibilities_extractor,
-            use_classifier=Config.USE_CLASSIFIER
+            use_classifier=Config.USE_CLASSIFIER,
+            n_workers=Config.DESCRIPTION_WORKERS or os.cpu_count() or 1,
+            classifier=classifier,
+            phrase_clusterer=(
+                PhraseClusterer(Config.CLUSTER_SIMILARITY_THRESHOLD)
+                if Config.CLUSTER_FREQUENCIES else None
+            ),
+            segmenter=segmenter
         )
 
-        # Обработка вакансий
-        df = processor.process_vacancies(detailed_vacancies)
+        return processor
+
+    def _get_memo_store(self) -> MemoStore:
+        """Хранилище мемоизации (одно на весь запуск, общее для запросов)"""
+        if self._memo_store is None:
+            self._memo_store = MemoStore(
+                db_path=Config.MEMO_PATH,
+                max_entries=Config.MEMO_MAX_ENTRIES,
+                max_disk_entries=Config.MEMO_MAX_DISK_ENTRIES
+            )
+        return self._memo_store
 
+    def _save_description_results(
+            self,
+            processor: IDescriptionProcessor,
+            df: pd.DataFrame,
+            output_dir: Path
+    ) -> None:
+        """
+        Сохранение результатов обработки описаний.
+
+        Args:
+            processor: Процессор описаний с накопленными результатами
+            df: DataFrame с извлеченными требованиями и обязанностями
+            output_dir: Директория для сохранения результатов
+        """
         # Сохранение результатов
         if len(df) > 0:
             self.csv_saver.save(
@@ -325,8 +809,6 @@ class VacancyPipeline:
         print(f"   Требований извлечено: {stats.get('total_requirements_extracted', 0)}")
         print(f"   Обязанностей извлечено: {stats.get('total_responsibilities_extracted', 0)}")
 
-        return processor
-
     def process_batch_queries(
             self,
             queries: List[str],
@@ -335,7 +817,10 @@ class VacancyPipeline:
             max_pages: int = 20,
             show_plots: bool = False,
             tech_keywords: Optional[List[str]] = None,
-            process_descriptions: bool = True
+            process_descriptions: bool = True,
+            resumable: bool = False,
+            checkpoint_chunk_size: int = 200,
+            journal_max_age_hours: Optional[float] = 24.0
     ) -> pd.DataFrame:
         """
         Обработка нескольких запросов.
@@ -348,6 +833,10 @@ class VacancyPipeline:
             show_plots: Показывать ли графики
             tech_keywords: Ключевые слова для анализа требований
             process_descriptions: Обрабатывать ли описания для извлечения требований/задач
+            resumable: Вести журнал контрольных точек и продолжать прерванный запуск
+            checkpoint_chunk_size: Размер порции деталей между контрольными точками
+            journal_max_age_hours: Срок годности журнала прерванного запуска
+                                   (None = продолжать запуск любой давности)
 
         Returns:
             DataFrame со сводной статистикой по всем запросам
@@ -356,16 +845,253 @@ class VacancyPipeline:
         print(f"🔄 Batch-анализ: {len(queries)} запросов")
         print(f"{'=' * 60}")
 
+        run_journal = None
+        if resumable:
+            run_journal = RunJournal(
+                self.output_dir / '.journal',
+                run_params={
+                    'queries': queries,
+                    'area': area,
+                    'max_vacancies': max_vacancies,
+                    'max_pages': max_pages,
+                    'process_descriptions': process_descriptions
+                },
+                chunk_size=checkpoint_chunk_size,
+                max_age_hours=journal_max_age_hours
+            )
+            if run_journal.resumed:
+                print(f"♻️  Продолжение прерванного запуска: {run_journal.run_dir}")
+
+        # Параллельный сбор: поиск и загрузка деталей для всех запросов сразу
+        prefetched = {}
+        if self.batch_scheduler:
+            pending_queries = [
+                query for query in queries
+                if not (run_journal and run_journal.for_query(query).is_done('done'))
+            ]
+            prefetched = self._collect_batch(
+                pending_queries,
+                run_journal,
+                area=area,
+                max_pages=max_pages,
+                max_vacancies=max_vacancies
+            )
+
+        summaries = []
+
+        for i, query in enumerate(queries, 1):
+            print(f"\n[{i}/{len(queries)}] Обработка: {query}")
+
+            journal = run_journal.for_query(query) if run_journal else None
+
+            if journal and journal.is_done('done'):
+                print(f"♻️  Запрос уже обработан (журнал): {query}")
+                summary = journal.get('done')
+            else:
+                summary = self.process_single_query(
+                    query=query,
+                    area=area,
+                    max_vacancies=max_vacancies,
+                    max_pages=max_pages,
+                    show_plots=show_plots,
+                    tech_keywords=tech_keywords,
+                    process_descriptions=process_descriptions,
+                    journal=journal,
+                    # Собранные данные запроса освобождаются после его обработки
+                    prefetched=prefetched.pop(query, None)
+                )
+
+            if summary:
+                summaries.append(summary)
+
+        # Все запросы пройдены - журнал больше не нужен
+        if run_journal:
+            run_journal.finish()
+
+        # Создание сводного отчета
+        return self._save_summary(summaries, len(queries), 'batch_summary.csv', 'Batch-анализ')
+
+    def _collect_batch(
+            self,
+            queries: List[str],
+            run_journal: Optional[RunJournal],
+            area: int,
+            max_pages: int,
+            max_vacancies: Optional[int]
+    ) -> Dict[str, Tuple[List[Dict], List[Union[Dict, VacancyRecord]]]]:
+        """
+        Параллельный сбор через планировщик с контрольными точками в журнале.
+
+        Поиски и детали, уже сохраненные в журнале, повторно не запрашиваются;
+        новые результаты поиска и порции деталей записываются в журналы
+        запросов по мере получения, поэтому сбой во время сбора не приводит
+        к повторной загрузке полученного. Как только получены все детали
+        запроса, его сырые данные сохраняются (с дозагрузкой и сдвигом
+        водяного знака), а в памяти до анализа остаются только записи,
+        возвращаемые _store_raw_vacancies.
+
+        Args:
+            queries: Запросы, которые еще не обработаны
+            run_journal: Журнал запуска (None = без контрольных точек)
+            area: Код региона
+            max_pages: Максимальное количество страниц для парсинга
+            max_vacancies: Максимальное количество вакансий (None = все)
+
+        Returns:
+            Для каждого запроса - результаты поиска и сохраненные вакансии
+        """
+        journals = {query: run_journal.for_query(query) for query in queries} if run_journal else {}
+
+        searched: Dict[str, List[Dict]] = {}
+        fetched: Dict[str, Dict] = {}
+        ids_by_query: Dict[str, set] = {}
+
+        for query, journal in journals.items():
+            vacancies = journal.load_search()
+            if vacancies is None:
+                continue
+
+            searched[query] = vacancies
+            ids_by_query[query] = {str(vacancy['id']) for vacancy in vacancies}
+            for vacancy in journal.load_details():
+                fetched[str(vacancy['id'])] = vacancy
+
+        if searched:
+            print(f"♻️  Результаты поиска восстановлены из журнала: {len(searched)} запросов, "
+                  f"деталей: {len(fetched)}")
+
+        def on_search(query: str, vacancies: List[Dict]) -> None:
+            journals[query].save_search(vacancies)
+            ids_by_query[query] = {str(vacancy['id']) for vacancy in vacancies}
+
+            # Детали, восстановленные из журналов других запросов
+            known = [fetched[vac_id] for vac_id in ids_by_query[query] if vac_id in fetched]
+            if known:
+                journals[query].append_details(known)
+
+        def on_details(details: List[Dict]) -> None:
+            # Деталь общей для нескольких запросов вакансии пишется в журнал каждого
+            for query, journal in journals.items():
+                query_ids = ids_by_query.get(query, ())
+                chunk = [vacancy for vacancy in details if str(vacancy['id']) in query_ids]
+                if chunk:
+                    journal.append_details(chunk)
+
+        def on_query_complete(query: str, vacancies: List[Dict], details: List[Dict]) -> List:
+            if not details:
+                return []
+
+            print(f"💾 Сбор завершен, сырые данные сохраняются: {query}")
+
+            output_dir = self._query_output_dir(query)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            _, previous_vacancies = self._load_incremental_state(query, area, output_dir)
+            return self._store_raw_vacancies(query, area, output_dir, details, previous_vacancies)
+
+        return self.batch_scheduler.collect(
+            queries,
+            area=area,
+            max_pages=max_pages,
+            max_vacancies=max_vacancies,
+            date_from_by_query={
+                query: self._incremental_watermark(query, area)
+                for query in queries
+            },
+            searched=searched,
+            fetched=fetched,
+            on_search=on_search if journals else None,
+            on_details=on_details if journals else None,
+            on_query_complete=on_query_complete,
+            checkpoint_chunk_size=run_journal.chunk_size if run_journal else 200
+        )
+
+    def reprocess_query(
+            self,
+            query: str,
+            show_plots: bool = False,
+            tech_keywords: Optional[List[str]] = None,
+            process_descriptions: bool = True
+    ) -> Dict:
+        """
+        Повторный анализ запроса по сохраненным сырым данным без обращения к API.
+
+        Вакансии читаются потоково (набор Parquet порциями, raw.json -
+        по одному элементу массива) и сразу передаются анализатору
+        и процессору описаний, поэтому сырые данные целиком в памяти
+        не держатся. Все результаты запроса создаются заново с текущими
+        параметрами Config; сырые данные не перезаписываются.
+
+        Args:
+            query: Название должности (или имя директории результатов)
+            show_plots: Показывать ли графики
+            tech_keywords: Ключевые слова для анализа требований
+            process_descriptions: Обрабатывать ли описания для извлечения требований/задач
+
+        Returns:
+            Словарь со статистикой анализа
+        """
+        output_dir = self._query_output_dir(query)
+
+        print(f"\n{'=' * 60}")
+        print(f"♻️  Повторный анализ: {query}")
+        print(f"{'=' * 60}")
+
+        if not self._has_raw_vacancies(output_dir):
+            print(f"❌ Нет сохраненных данных для: {query}")
+            return {}
+
+        vacancies = self._iter_raw_vacancies(output_dir)
+
+        description_processor = None
+        if process_descriptions:
+            print(f"\n📝 Потоковая обработка описаний вакансий...")
+            description_processor = self._create_description_processor(tech_keywords)
+            description_processor.reset()
+            vacancies = _feed_processor(vacancies, description_processor)
+
+        return self._analyze_vacancies(
+            query,
+            output_dir,
+            vacancies,
+            show_plots=show_plots,
+            tech_keywords=tech_keywords,
+            process_descriptions=process_descriptions,
+            description_processor=description_processor
+        )
+
+    def reprocess_all(
+            self,
+            queries: Optional[List[str]] = None,
+            show_plots: bool = False,
+            tech_keywords: Optional[List[str]] = None,
+            process_descriptions: bool = True
+    ) -> pd.DataFrame:
+        """
+        Повторный анализ нескольких запросов по сохраненным сырым данным.
+
+        Args:
+            queries: Запросы (None - все запросы с сохраненными данными)
+            show_plots: Показывать ли графики
+            tech_keywords: Ключевые слова для анализа требований
+            process_descriptions: Обрабатывать ли описания для извлечения требований/задач
+
+        Returns:
+            DataFrame со сводной статистикой по всем запросам
+        """
+        if queries is None:
+            queries = self._stored_queries()
+
+        print(f"\n{'=' * 60}")
+        print(f"♻️  Повторный анализ: {len(queries)} запросов")
+        print(f"{'=' * 60}")
+
         summaries = []
 
         for i, query in enumerate(queries, 1):
             print(f"\n[{i}/{len(queries)}] Обработка: {query}")
 
-            summary = self.process_single_query(
+            summary = self.reprocess_query(
                 query=query,
-                area=area,
-                max_vacancies=max_vacancies,
-                max_pages=max_pages,
                 show_plots=show_plots,
                 tech_keywords=tech_keywords,
                 process_descriptions=process_descriptions
@@ -374,15 +1100,48 @@ class VacancyPipeline:
             if summary:
                 summaries.append(summary)
 
-        # Создание сводного отчета
+        return self._save_summary(
+            summaries, len(queries), 'reprocess_summary.csv', 'Повторный анализ'
+        )
+
+    def _stored_queries(self) -> List[str]:
+        """Запросы (имена директорий результатов) с сохраненными сырыми данными"""
+        queries = {
+            path.parent.name for path in self.output_dir.glob('*/raw.json')
+        }
+
+        if self.vacancy_store:
+            queries.update(self.vacancy_store.queries())
+
+        return sorted(queries)
+
+    def _save_summary(
+            self,
+            summaries: List[Dict],
+            total: int,
+            filename: str,
+            title: str
+    ) -> pd.DataFrame:
+        """
+        Сохранение сводного отчета по нескольким запросам.
+
+        Args:
+            summaries: Сводки обработанных запросов
+            total: Количество запросов
+            filename: Имя файла отчета в базовой директории
+            title: Название режима для вывода
+
+        Returns:
+            DataFrame со сводной статистикой
+        """
         if summaries:
             summary_df = pd.DataFrame(summaries)
-            summary_path = self.output_dir / 'batch_summary.csv'
+            summary_path = self.output_dir / filename
             self.csv_saver.save(summary_df, str(summary_path))
 
             print(f"\n{'=' * 60}")
-            print(f"✅ Batch-анализ завершен")
-            print(f"📊 Обработано запросов: {len(summaries)}/{len(queries)}")
+            print(f"✅ {title} завершен")
+            print(f"📊 Обработано запросов: {len(summaries)}/{total}")
             print(f"📁 Сводный отчет: {summary_path}")
             print(f"{'=' * 60}\n")
 
@@ -390,3 +1149,52 @@ class VacancyPipeline:
         else:
             print(f"\n❌ Не удалось обработать ни один запрос")
             return pd.DataFrame()
+
+
+def _feed_processor(
+        vacancies: Iterable[Dict],
+        processor: VacancyDescriptionProcessor
+) -> Iterator[Dict]:
+    """
+    Передает вакансии дальше, по пути отдавая их процессору описаний порциями.
+
+    Процессор получает последнюю порцию, когда итератор исчерпан;
+    результаты забираются через processor.finalize().
+    """
+    buffer = []
+
+    for vacancy in vacancies:
+        buffer.append(vacancy)
+
+        if len(buffer) >= processor.PARALLEL_MIN_VACANCIES:
+            processor.add_vacancies(buffer)
+            buffer = []
+
+        yield vacancy
+
+    if buffer:
+        processor.add_vacancies(buffer)
+
+
+def _merge_vacancies(new_vacancies: List[Dict], previous_vacancies: List[Dict]) -> List[Dict]:
+    """Объединяет наборы по ID: новые версии вакансий заменяют сохраненные"""
+    new_ids = {str(vacancy['id']) for vacancy in new_vacancies}
+
+    return new_vacancies + [
+        vacancy for vacancy in previous_vacancies
+        if str(vacancy['id']) not in new_ids
+    ]
+
+
+def _run_until_complete(coro):
+    """Выполняет корутину в текущем цикле событий (как fetcher'ы - один цикл на процесс)"""
+    try:
+        loop = asyncio.get_event_loop()
+        if loop.is_closed():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(coro)
@@ -4,8 +4,10 @@
 Следует принципам Single Responsibility и Dependency Inversion.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Iterator, Tuple
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import math
 import pandas as pd
 
 from core.interfaces import (
@@ -14,6 +16,10 @@ from core.interfaces import (
     IDescriptionProcessor
 )
 from extractors.item_classifier import VacancyItemClassifier
+from extractors.near_duplicates import PhraseClusterer
+from extractors.pattern_matcher import fold_all
+from extractors.section_segmenter import SectionSegmenter
+from processors.vacancy_document import VacancyDocument, STAGES
 
 
 class VacancyDescriptionProcessor(IDescriptionProcessor):
@@ -26,12 +32,28 @@ class VacancyDescriptionProcessor(IDescriptionProcessor):
     Реализует паттерн Facade - предоставляет простой интерфейс к сложной системе.
     """
 
+    # Меньше этого количества вакансий пул процессов не окупается
+    PARALLEL_MIN_VACANCIES = 50
+
+    # Названия этапов обработки для вывода
+    STAGE_LABELS = {
+        'clean': 'очистка HTML',
+        'segment': 'разметка секций',
+        'requirements': 'требования',
+        'responsibilities': 'обязанности',
+        'classify': 'классификация',
+    }
+
     def __init__(
             self,
             text_cleaner: ITextCleaner,
             requirements_extractor: ITextSectionExtractor,
             responsibilities_extractor: ITextSectionExtractor,
-            use_classifier: bool = True  # НОВЫЙ ПАРАМЕТР
+            use_classifier: bool = True,  # НОВЫЙ ПАРАМЕТР
+            n_workers: int = 1,
+            classifier: Optional[VacancyItemClassifier] = None,
+            phrase_clusterer: Optional[PhraseClusterer] = None,
+            segmenter: Optional[SectionSegmenter] = None
     ):
         """
         Инициализация процессора.
@@ -41,20 +63,36 @@ class VacancyDescriptionProcessor(IDescriptionProcessor):
             requirements_extractor: Экстрактор требований
             responsibilities_extractor: Экстрактор обязанностей
             use_classifier: Использовать ли классификатор для разделения
+            n_workers: Количество процессов обработки (1 = в текущем процессе)
+            classifier: Классификатор (None - стандартный VacancyItemClassifier)
+            phrase_clusterer: Группировка похожих формулировок в частотном
+                анализе (None - подсчет точных совпадений)
+            segmenter: Разметка описаний на секции, общая с экстракторами
+                (разметка выполняется один раз и переиспользуется ими)
         """
         self.text_cleaner = text_cleaner
         self.requirements_extractor = requirements_extractor
         self.responsibilities_extractor = responsibilities_extractor
         self.use_classifier = use_classifier
+        self.n_workers = max(1, n_workers)
+        self.phrase_clusterer = phrase_clusterer
+        self.segmenter = segmenter
+        self._pool: Optional[ProcessPoolExecutor] = None
 
         # Классификатор для разделения смешанных данных
-        self.classifier = VacancyItemClassifier() if use_classifier else None
+        if use_classifier:
+            self.classifier = classifier or VacancyItemClassifier()
+        else:
+            self.classifier = None
 
         # Хранение результатов обработки
         self.processed_data: List[Dict] = []
         self.all_requirements: List[str] = []
         self.all_responsibilities: List[str] = []
 
+        # Суммарное время этапов обработки (сек)
+        self.stage_timings: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+
     def process_vacancies(self, vacancies: List[Dict]) -> pd.DataFrame:
         """
         Обработка описаний всех вакансий.
@@ -67,30 +105,168 @@ class VacancyDescriptionProcessor(IDescriptionProcessor):
         """
         print(f"\n🔍 Обработка описаний {len(vacancies)} вакансий...")
 
-        # Сброс данных
-        self.processed_data = []
-        self.all_requirements = []
-        self.all_responsibilities = []
+        self.reset()
+
+        if self._use_pool(len(vacancies)):
+            print(f"   Параллельная обработка: {self.n_workers} процессов")
 
         # Обработка каждой вакансии
-        for idx, vacancy in enumerate(vacancies, 1):
+        for idx, result in enumerate(self._process_many(vacancies), 1):
             if idx % 50 == 0 or idx == len(vacancies):
                 print(f"   Обработано: {idx}/{len(vacancies)}")
 
-            result = self._process_single_vacancy(vacancy)
+            self._collect(result)
+
+        return self.finalize()
 
-            if result:
-                self.processed_data.append(result)
-                self.all_requirements.extend(result['requirements'])
-                self.all_responsibilities.extend(result['responsibilities'])
+    def reset(self) -> None:
+        """Сброс накопленных результатов перед новой обработкой"""
+        self.processed_data = []
+        self.all_requirements = []
+        self.all_responsibilities = []
+        self.stage_timings = dict.fromkeys(STAGES, 0.0)
+
+    def add_vacancy(self, vacancy: Dict) -> Optional[Dict]:
+        """
+        Инкрементальная обработка одной вакансии (для потокового режима).
+
+        Args:
+            vacancy: Словарь с данными вакансии
+
+        Returns:
+            Результат обработки или None, если описание пустое
+        """
+        result = self._process_single_vacancy(vacancy)
+        self._collect(result)
+
+        return result
+
+    def add_vacancies(self, vacancies: List[Dict]) -> None:
+        """
+        Инкрементальная обработка порции вакансий (при n_workers > 1 - в пуле процессов).
+
+        Args:
+            vacancies: Список вакансий с полем description
+        """
+        for result in self._process_many(vacancies):
+            self._collect(result)
+
+    def _collect(self, result: Optional[Dict]) -> None:
+        """Добавление результата обработки вакансии к накопленным"""
+        if result:
+            self.processed_data.append(result)
+            self.all_requirements.extend(result['requirements'])
+            self.all_responsibilities.extend(result['responsibilities'])
+
+    def _use_pool(self, count: int) -> bool:
+        return self.n_workers > 1 and count >= self.PARALLEL_MIN_VACANCIES
+
+    def _process_many(self, vacancies: List[Dict]) -> Iterator[Optional[Dict]]:
+        """
+        Обработка списка вакансий с сохранением порядка.
+
+        В пуле процессов вакансии делятся на порции; executor.map отдает
+        результаты порций в исходном порядке, поэтому итог не зависит
+        от того, какой процесс закончил раньше.
+        """
+        if not self._use_pool(len(vacancies)):
+            for vacancy in vacancies:
+                yield self._process_single_vacancy(vacancy)
+            return
+
+        chunk_size = math.ceil(len(vacancies) / (self.n_workers * 4))
+        chunks = [
+            vacancies[i:i + chunk_size]
+            for i in range(0, len(vacancies), chunk_size)
+        ]
+
+        for chunk_results, timings in self._get_pool().map(_process_chunk_in_worker, chunks):
+            self._add_timings(timings)
+            yield from chunk_results
+
+    def _add_timings(self, timings: Dict[str, float]) -> None:
+        """Добавление времени этапов одной вакансии (или порции) к общему"""
+        for stage, seconds in timings.items():
+            self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + seconds
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Пул процессов; компоненты передаются каждому процессу один раз"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_worker,
+                initargs=({
+                    'text_cleaner': self.text_cleaner,
+                    'requirements_extractor': self.requirements_extractor,
+                    'responsibilities_extractor': self.responsibilities_extractor,
+                    'use_classifier': self.use_classifier,
+                    'classifier': self.classifier,
+                    'segmenter': self.segmenter
+                },)
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Остановка пула процессов"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def finalize(self, vacancy_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Завершение обработки и формирование итогового DataFrame.
+
+        Args:
+            vacancy_ids: Исходный порядок ID вакансий; если передан, результаты,
+                добавленные в порядке поступления, упорядочиваются по нему
+
+        Returns:
+            DataFrame с извлеченными требованиями и обязанностями
+        """
+        if vacancy_ids is not None:
+            position = {str(vac_id): i for i, vac_id in enumerate(vacancy_ids)}
+            self.processed_data.sort(
+                key=lambda item: position.get(str(item['vacancy_id']), len(position))
+            )
+
+            self.all_requirements = [
+                req for item in self.processed_data for req in item['requirements']
+            ]
+            self.all_responsibilities = [
+                resp for item in self.processed_data for resp in item['responsibilities']
+            ]
+
+        self.close()
 
         print(f"✅ Обработка завершена")
         print(f"   Извлечено уникальных требований: {len(set(self.all_requirements))}")
         print(f"   Извлечено уникальных обязанностей: {len(set(self.all_responsibilities))}")
+        self._print_stage_timings()
 
         return self._create_dataframe()
 
-    def _process_single_vacancy(self, vacancy: Dict) -> Dict:
+    def _print_stage_timings(self) -> None:
+        """Вывод времени этапов обработки"""
+        total = sum(self.stage_timings.values())
+        if not total:
+            return
+
+        print(f"   ⏱️  Время этапов:")
+        for stage, seconds in self.stage_timings.items():
+            if seconds:
+                label = self.STAGE_LABELS.get(stage, stage)
+                print(f"      {label}: {seconds:.2f} сек ({seconds / total * 100:.0f}%)")
+
+    def get_stage_timings(self) -> Dict[str, float]:
+        """
+        Суммарное время этапов обработки.
+
+        Returns:
+            Словарь {этап: секунды}
+        """
+        return dict(self.stage_timings)
+
+    def _process_single_vacancy(self, vacancy: Dict) -> Optional[Dict]:
         """
         Обработка одной вакансии.
 
@@ -100,55 +276,106 @@ class VacancyDescriptionProcessor(IDescriptionProcessor):
         Returns:
             Словарь с результатами обработки или None
         """
-        raw_description = vacancy.get('description', '')
+        document = self.build_document(vacancy)
+        if document is None:
+            return None
+
+        return document.to_result()
+
+    def build_document(self, vacancy: Dict) -> Optional[VacancyDocument]:
+        """
+        Обработка одной вакансии по этапам.
 
-        if not raw_description:
+        Документ создается один раз: очищенный текст размечается на секции,
+        разметку используют оба экстрактора, а классификатор получает
+        уникальные элементы обоих списков. Время этапов добавляется
+        к stage_timings.
+
+        Args:
+            vacancy: Словарь с данными вакансии
+
+        Returns:
+            VacancyDocument с результатами или None, если описание пустое
+        """
+        document = VacancyDocument.from_vacancy(vacancy)
+
+        if not document.raw_description:
             return None
 
+        try:
+            return self._run_stages(document)
+        finally:
+            self._add_timings(document.timings)
+
+    def _run_stages(self, document: VacancyDocument) -> Optional[VacancyDocument]:
+        """Выполнение этапов обработки документа"""
         # Шаг 1: Очистка текста от HTML
-        clean_text = self.text_cleaner.clean(raw_description)
+        with document.stage('clean'):
+            document.clean_text = self.text_cleaner.clean(document.raw_description)
 
-        if not clean_text or len(clean_text) < 50:
+        if not document.clean_text or len(document.clean_text) < 50:
             return None
 
-        # Шаг 2: Извлечение требований
-        requirements = self.requirements_extractor.extract(clean_text)
+        # Шаги 2-4: Извлечение требований и обязанностей. Разметка документа
+        # общая для экстракторов и строится при первом обращении к ней, поэтому
+        # при попадании обоих экстракторов в кэш текст не размечается вовсе
+        if self.segmenter:
+            document.layout = self.segmenter.segment(document.clean_text)
+
+        requirements = self._extract(document, 'requirements', self.requirements_extractor)
+        responsibilities = self._extract(document, 'responsibilities', self.responsibilities_extractor)
 
-        # Шаг 3: Извлечение обязанностей
-        responsibilities = self.responsibilities_extractor.extract(clean_text)
+        document.requirements = requirements
+        document.responsibilities = responsibilities
 
         # ========== НОВАЯ ЛОГИКА: КЛАССИФИКАЦИЯ СМЕШАННЫХ ДАННЫХ ==========
 
         if self.use_classifier and self.classifier:
-            # Разделение требований (могут содержать обязанности)
-            req_filtered, req_misclassified = self.classifier.separate_mixed_items(
-                requirements
-            )
+            with document.stage('classify'):
+                # Каждый уникальный элемент обоих списков классифицируется один раз
+                items = document.items
+                document.item_types = dict(zip(
+                    items,
+                    self.classifier.classify_batch(items, fold_all(items, document.folded))
+                ))
+
+                # Разделение требований (могут содержать обязанности)
+                req_filtered, req_misclassified = self.classifier.split_by_type(
+                    requirements, [document.item_types[item] for item in requirements]
+                )
+
+                # Разделение обязанностей (могут содержать требования)
+                resp_misclassified, resp_filtered = self.classifier.split_by_type(
+                    responsibilities, [document.item_types[item] for item in responsibilities]
+                )
+
+                # Объединение с учетом переклассификации (без дубликатов, порядок
+                # стабилен и не зависит от хэширования строк в процессе)
+                document.requirements = list(dict.fromkeys(req_filtered + resp_misclassified))
+                document.responsibilities = list(dict.fromkeys(resp_filtered + req_misclassified))
 
-            # Разделение обязанностей (могут содержать требования)
-            resp_misclassified, resp_filtered = self.classifier.separate_mixed_items(
-                responsibilities
-            )
+        # ===================================================================
 
-            # Объединение с учетом переклассификации
-            final_requirements = list(set(req_filtered + resp_misclassified))
-            final_responsibilities = list(set(resp_filtered + req_misclassified))
-        else:
-            final_requirements = requirements
-            final_responsibilities = responsibilities
+        return document
 
-        # ===================================================================
+    def _extract(
+            self,
+            document: VacancyDocument,
+            stage: str,
+            extractor: ITextSectionExtractor
+    ) -> List[str]:
+        """Извлечение с замером этапа (время разметки относится к этапу 'segment')"""
+        segmented = self.segmenter.elapsed if self.segmenter else 0.0
 
-        return {
-            'vacancy_id': vacancy.get('id'),
-            'vacancy_name': vacancy.get('name'),
-            'company': vacancy.get('employer', {}).get('name') if vacancy.get('employer') else None,
-            'clean_description': clean_text,
-            'requirements': final_requirements,
-            'responsibilities': final_responsibilities,
-            'requirements_count': len(final_requirements),
-            'responsibilities_count': len(final_responsibilities),
-        }
+        with document.stage(stage):
+            items = extractor.extract(document.clean_text, document.layout, document.folded)
+
+        if self.segmenter:
+            spent = self.segmenter.elapsed - segmented
+            document.timings[stage] -= spent
+            document.timings['segment'] = document.timings.get('segment', 0.0) + spent
+
+        return items
 
     def _create_dataframe(self) -> pd.DataFrame:
         """
@@ -183,22 +410,7 @@ class VacancyDescriptionProcessor(IDescriptionProcessor):
         Returns:
             DataFrame с частотой встречаемости требований
         """
-        if not self.all_requirements:
-            return pd.DataFrame(columns=['Требование', 'Частота', 'Процент'])
-
-        # Подсчет частоты встречаемости
-        counter = Counter(self.all_requirements)
-        total_vacancies = len(self.processed_data)
-
-        freq_data = []
-        for requirement, count in counter.most_common(100):  # Увеличено до 100
-            freq_data.append({
-                'Требование': requirement,
-                'Частота': count,
-                'Процент': round(count / total_vacancies * 100, 2)
-            })
-
-        return pd.DataFrame(freq_data)
+        return self._frequency_table(self.all_requirements, 'Требование')
 
     def get_responsibilities_frequency(self) -> pd.DataFrame:
         """
@@ -207,22 +419,55 @@ class VacancyDescriptionProcessor(IDescriptionProcessor):
         Returns:
             DataFrame с частотой встречаемости обязанностей
         """
-        if not self.all_responsibilities:
-            return pd.DataFrame(columns=['Обязанность', 'Частота', 'Процент'])
+        return self._frequency_table(self.all_responsibilities, 'Обязанность')
+
+    def _frequency_table(self, items: List[str], column: str, top_n: int = 100) -> pd.DataFrame:
+        """
+        Таблица самых частых элементов.
+
+        При заданном phrase_clusterer похожие формулировки считаются
+        вместе под самой частой из них (колонка 'Вариантов' - сколько
+        формулировок объединено).
+
+        Args:
+            items: Все извлеченные элементы
+            column: Название колонки с элементом
+            top_n: Количество строк
+
+        Returns:
+            DataFrame с частотой встречаемости
+        """
+        columns = [column, 'Частота', 'Процент']
+        if self.phrase_clusterer:
+            columns.append('Вариантов')
+
+        if not items:
+            return pd.DataFrame(columns=columns)
 
         # Подсчет частоты встречаемости
-        counter = Counter(self.all_responsibilities)
+        counter = Counter(items)
         total_vacancies = len(self.processed_data)
 
+        if self.phrase_clusterer:
+            rows = [
+                (cluster.representative, cluster.count, len(cluster.variants))
+                for cluster in self.phrase_clusterer.cluster(counter)[:top_n]
+            ]
+        else:
+            rows = [(item, count, 1) for item, count in counter.most_common(top_n)]
+
         freq_data = []
-        for responsibility, count in counter.most_common(100):  # Увеличено до 100
-            freq_data.append({
-                'Обязанность': responsibility,
+        for item, count, variants in rows:
+            row = {
+                column: item,
                 'Частота': count,
                 'Процент': round(count / total_vacancies * 100, 2)
-            })
+            }
+            if self.phrase_clusterer:
+                row['Вариантов'] = variants
+            freq_data.append(row)
 
-        return pd.DataFrame(freq_data)
+        return pd.DataFrame(freq_data, columns=columns)
 
     def get_detailed_vacancy_data(self) -> List[Dict]:
         """
@@ -259,5 +504,26 @@ class VacancyDescriptionProcessor(IDescriptionProcessor):
             'unique_responsibilities': unique_responsibilities,
             'avg_requirements_per_vacancy': round(avg_req_per_vacancy, 2),
             'avg_responsibilities_per_vacancy': round(avg_resp_per_vacancy, 2),
-            'classifier_used': self.use_classifier
+            'classifier_used': self.use_classifier,
+            'stage_timings': {stage: round(seconds, 3) for stage, seconds in self.stage_timings.items()}
         }
+
+
+# ==================== ПУЛ ПРОЦЕССОВ ====================
+
+# Процессор, создаваемый один раз в каждом рабочем процессе
+_worker_processor: Optional[VacancyDescriptionProcessor] = None
+
+
+def _init_worker(components: Dict) -> None:
+    """Инициализация рабочего процесса: сборка процессора из компонентов"""
+    global _worker_processor
+    _worker_processor = VacancyDescriptionProcessor(**components)
+
+
+def _process_chunk_in_worker(vacancies: List[Dict]) -> Tuple[List[Optional[Dict]], Dict[str, float]]:
+    """Обработка порции вакансий в рабочем процессе (результаты и время этапов)"""
+    _worker_processor.reset()
+    results = [_worker_processor._process_single_vacancy(vacancy) for vacancy in vacancies]
+
+    return results, _worker_processor.get_stage_timings()
@@ -0,0 +1,420 @@
+"""
+Модуль мемоизации обработки текста описаний.
+Кэширует результаты очистки HTML, извлечения требований/обязанностей
+и классификации элементов по хэшу входного текста, чтобы повторно
+опубликованные вакансии и повторные запуски не обрабатывались заново.
+Следует принципу Open/Closed - компоненты оборачиваются без изменений.
+"""
+
+import hashlib
+import inspect
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Optional, Any
+
+from core.interfaces import ITextCleaner, ITextSectionExtractor
+from extractors.item_classifier import VacancyItemClassifier, ItemType
+
+
+class MemoStore:
+    """
+    Хранилище результатов обработки текста.
+
+    Два уровня: LRU-словарь в памяти и (опционально) таблица SQLite
+    на диске, общая для всех запусков. Ключ записи - хэш от отпечатка
+    компонента и входного текста. Отпечаток включает исходный код
+    модулей проекта, от которых зависит компонент (вместе со списками
+    паттернов), и параметры компонента и вложенных в него компонентов
+    (пороги из Config), поэтому при их изменении старые записи просто
+    перестают находиться и со временем вытесняются.
+    """
+
+    def __init__(
+            self,
+            db_path: Optional[str] = None,
+            max_entries: int = 50_000,
+            max_disk_entries: Optional[int] = 1_000_000
+    ):
+        """
+        Args:
+            db_path: Путь к файлу SQLite (None - только в памяти)
+            max_entries: Максимальное количество записей в памяти
+            max_disk_entries: Максимальное количество записей на диске
+                (лишние вытесняются начиная с самых старых, None - без ограничений)
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max_disk_entries
+
+        self._init_state()
+
+        if self.db_path:
+            self._evict_disk()
+
+    def _init_state(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> Dict:
+        # В процессы пула передаются только настройки: соединение
+        # открывается заново, память у каждого процесса своя
+        return {
+            'db_path': self.db_path,
+            'max_entries': self.max_entries,
+            'max_disk_entries': self.max_disk_entries
+        }
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._init_state()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Соединение с базой (открывается при первом обращении)"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.db_path),
+                check_same_thread=False,
+                isolation_level=None,
+                timeout=30.0
+            )
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS memo ('
+                ' key TEXT PRIMARY KEY,'
+                ' value TEXT NOT NULL,'
+                ' created_at REAL NOT NULL'
+                ')'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_memo_created_at ON memo (created_at)'
+            )
+        return self._conn
+
+    def _evict_disk(self) -> None:
+        """Вытеснение самых старых записей сверх max_disk_entries"""
+        if self.max_disk_entries is None:
+            return
+
+        with self._lock:
+            conn = self._get_conn()
+            count = conn.execute('SELECT COUNT(*) FROM memo').fetchone()[0]
+            overflow = count - self.max_disk_entries
+
+            if overflow > 0:
+                conn.execute(
+                    'DELETE FROM memo WHERE key IN ('
+                    ' SELECT key FROM memo ORDER BY created_at LIMIT ?'
+                    ')',
+                    (overflow,)
+                )
+
+    @staticmethod
+    def namespace(component: Any) -> str:
+        """
+        Отпечаток компонента: исходный код модулей и параметры экземпляра.
+
+        Учитываются модули классов компонента и модули проекта, из которых
+        они импортируют функции и классы (например, сегментатор и поиск
+        почти-дубликатов для экстракторов), а также параметры вложенных
+        компонентов (атрибутов-объектов классов проекта).
+
+        Args:
+            component: Компонент обработки текста
+
+        Returns:
+            str: Хэш отпечатка
+        """
+        parts: List[str] = []
+        modules: Dict[str, None] = {}
+
+        _fingerprint(component, parts, modules, set())
+
+        for name in modules:
+            try:
+                parts.append(inspect.getsource(sys.modules[name]))
+            except (OSError, TypeError):
+                parts.append(name)
+
+        return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def make_key(namespace: str, text: str) -> str:
+        return hashlib.sha1(
+            namespace.encode('ascii') + b'\0' + text.encode('utf-8', 'surrogatepass')
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Получение результата (None, если записи нет)"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            value = None
+            if self.db_path:
+                row = self._get_conn().execute(
+                    'SELECT value FROM memo WHERE key = ?', (key,)
+                ).fetchone()
+                if row:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Сохранение результата в памяти и на диске"""
+        with self._lock:
+            self._remember(key, value)
+
+            if self.db_path:
+                self._get_conn().execute(
+                    'INSERT OR REPLACE INTO memo (key, value, created_at) VALUES (?, ?, ?)',
+                    (key, json.dumps(value, ensure_ascii=False), time.time())
+                )
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_statistics(self) -> Dict:
+        """Возвращает статистику попаданий (в текущем процессе)"""
+        total = self.hits + self.misses
+
+        return {
+            'memory_entries': len(self._memory),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total * 100, 2) if total else 0.0
+        }
+
+    def close(self) -> None:
+        """Закрытие соединения с базой данных"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CachedTextCleaner(ITextCleaner):
+    """Очистка текста с кэшированием по хэшу HTML описания"""
+
+    def __init__(self, text_cleaner: ITextCleaner, store: MemoStore):
+        """
+        Args:
+            text_cleaner: Исходный компонент очистки
+            store: Хранилище результатов
+        """
+        self.text_cleaner = text_cleaner
+        self.store = store
+        self._namespace = store.namespace(text_cleaner)
+
+    def clean(self, raw_text: str) -> str:
+        if not raw_text:
+            return self.text_cleaner.clean(raw_text)
+
+        key = self.store.make_key(self._namespace, raw_text)
+        result = self.store.get(key)
+
+        if result is None:
+            result = self.text_cleaner.clean(raw_text)
+            self.store.set(key, result)
+
+        return result
+
+
+class CachedSectionExtractor(ITextSectionExtractor):
+    """Извлечение секций с кэшированием по хэшу очищенного текста"""
+
+    def __init__(self, extractor: ITextSectionExtractor, store: MemoStore):
+        """
+        Args:
+            extractor: Исходный экстрактор (требований или обязанностей)
+            store: Хранилище результатов
+        """
+        self.extractor = extractor
+        self.store = store
+        self._namespace = store.namespace(extractor)
+
+    def extract(
+            self,
+            text: str,
+            layout: Optional[Any] = None,
+            folded: Optional[Dict[str, str]] = None
+    ) -> List[str]:
+        if not text:
+            return self.extractor.extract(text, layout, folded)
+
+        key = self.store.make_key(self._namespace, text)
+        result = self.store.get(key)
+
+        if result is None:
+            # Разметка строится только при промахе кэша
+            result = self.extractor.extract(text, layout, folded)
+            self.store.set(key, result)
+
+        return list(result)
+
+
+class CachedItemClassifier(VacancyItemClassifier):
+    """
+    Классификатор с кэшированием по хэшу элемента.
+
+    separate_mixed_items наследуется и вызывает кэширующий classify_batch.
+    """
+
+    def __init__(self, store: MemoStore):
+        """
+        Args:
+            store: Хранилище результатов
+        """
+        super().__init__()
+        self.store = store
+        self._namespace = store.namespace(self)
+
+    def classify(self, text: str) -> ItemType:
+        if not text:
+            return super().classify(text)
+
+        key = self.store.make_key(self._namespace, text)
+        result = self.store.get(key)
+
+        if result is None:
+            item_type = super().classify(text)
+            self.store.set(key, item_type.value)
+            return item_type
+
+        return ItemType(result)
+
+    def classify_batch(
+            self,
+            items: List[str],
+            folded: Optional[List[str]] = None
+    ) -> List[ItemType]:
+        results: List[Optional[ItemType]] = [None] * len(items)
+        keys: Dict[int, str] = {}
+        missing = []
+
+        for i, text in enumerate(items):
+            if text:
+                keys[i] = self.store.make_key(self._namespace, text)
+                cached = self.store.get(keys[i])
+                if cached is not None:
+                    results[i] = ItemType(cached)
+                    continue
+            missing.append(i)
+
+        # Непросчитанные элементы классифицируются одним пакетом
+        computed = super().classify_batch(
+            [items[i] for i in missing],
+            [folded[i] for i in missing] if folded is not None else None
+        )
+
+        for i, item_type in zip(missing, computed):
+            results[i] = item_type
+            if i in keys:
+                self.store.set(keys[i], item_type.value)
+
+        return results
+
+
+# Корень проекта: модули из него входят в отпечатки компонентов
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _fingerprint(component: Any, parts: List[str], modules: Dict[str, None], seen: set) -> None:
+    """
+    Сбор параметров компонента и вложенных компонентов.
+
+    Args:
+        component: Компонент обработки текста
+        parts: Части отпечатка (дополняются)
+        modules: Модули проекта, исходный код которых входит в отпечаток (дополняются)
+        seen: ID уже обработанных объектов (защита от циклов)
+    """
+    if id(component) in seen:
+        return
+    seen.add(id(component))
+
+    parts.append(f'{type(component).__module__}.{type(component).__qualname__}')
+
+    for cls in type(component).__mro__:
+        if _is_project_module(cls.__module__):
+            _collect_modules(cls.__module__, modules)
+
+    # Списки паттернов и константы (в том числе измененные во время работы)
+    for name in sorted(dir(component)):
+        if name.isupper():
+            value = _plain_value(getattr(component, name))
+            if value is not None:
+                parts.append(f'{name}={value!r}')
+
+    attributes = vars(component) if hasattr(component, '__dict__') else {}
+
+    parts.append(repr(sorted(
+        (name, _plain_value(value))
+        for name, value in attributes.items()
+        if _plain_value(value) is not None
+    )))
+
+    # Вложенные компоненты (сегментатор, сопоставитель паттернов и т.п.)
+    for name, value in sorted(attributes.items()):
+        if isinstance(value, MemoStore) or not _is_project_module(type(value).__module__):
+            continue
+        parts.append(f'[{name}]')
+        _fingerprint(value, parts, modules, seen)
+
+
+def _collect_modules(name: str, modules: Dict[str, None]) -> None:
+    """Модуль и модули проекта, из которых он импортирует функции и классы"""
+    if name in modules:
+        return
+    modules[name] = None
+
+    for value in vars(sys.modules[name]).values():
+        module_name = getattr(value, '__module__', None)
+        if (inspect.isfunction(value) or inspect.isclass(value)) and _is_project_module(module_name):
+            _collect_modules(module_name, modules)
+
+
+def _is_project_module(name: Optional[str]) -> bool:
+    """Модуль принадлежит проекту (а не стандартной библиотеке или зависимостям)"""
+    module = sys.modules.get(name) if name else None
+    filepath = getattr(module, '__file__', None)
+
+    if not filepath or 'site-packages' in filepath:
+        return False
+
+    return _PROJECT_ROOT in Path(filepath).resolve().parents
+
+
+def _plain_value(value: Any) -> Optional[Any]:
+    """Значение параметра для отпечатка (None - не входит в отпечаток)"""
+    if isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        if all(isinstance(item, (bool, int, float, str)) for item in value):
+            items = list(value)
+            return sorted(items) if isinstance(value, (set, frozenset)) else items
+
+    return None
@@ -0,0 +1,98 @@
+"""
+Модуль промежуточной модели описания вакансии.
+Документ создается один раз на вакансию и проходит все этапы
+обработки: очистку, разметку на секции, извлечение требований
+и обязанностей, классификацию. Время каждого этапа записывается
+в документ, поэтому этапы можно замерять по отдельности.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Union
+
+from core.vacancy_record import VacancyRecord
+from extractors.item_classifier import ItemType
+from extractors.section_segmenter import DescriptionLayout
+
+
+# Этапы обработки в порядке выполнения
+STAGES = ('clean', 'segment', 'requirements', 'responsibilities', 'classify')
+
+
+@dataclass
+class VacancyDocument:
+    """Описание вакансии и результаты его обработки по этапам"""
+    vacancy_id: Optional[str]
+    vacancy_name: Optional[str]
+    company: Optional[str]
+    raw_description: str
+    clean_text: str = ''
+    # Разметка на секции, общая для экстракторов (строится при первом обращении)
+    layout: Optional[DescriptionLayout] = None
+    # Форма fold каждого элемента: вычисляется один раз для дедупликации
+    # в экстракторах и для классификации
+    folded: Dict[str, str] = field(default_factory=dict)
+    requirements: List[str] = field(default_factory=list)
+    responsibilities: List[str] = field(default_factory=list)
+    # Тип каждого уникального элемента (заполняется классификатором)
+    item_types: Dict[str, ItemType] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_vacancy(cls, vacancy: Union[Dict, VacancyRecord]) -> 'VacancyDocument':
+        """
+        Создание документа из вакансии.
+
+        Args:
+            vacancy: Словарь с данными вакансии или запись VacancyRecord
+
+        Returns:
+            VacancyDocument: Документ до обработки
+        """
+        if isinstance(vacancy, VacancyRecord):
+            return cls(
+                vacancy_id=vacancy.id,
+                vacancy_name=vacancy.name,
+                company=vacancy.company,
+                raw_description=vacancy.description or ''
+            )
+
+        return cls(
+            vacancy_id=vacancy.get('id'),
+            vacancy_name=vacancy.get('name'),
+            company=vacancy.get('employer', {}).get('name') if vacancy.get('employer') else None,
+            raw_description=vacancy.get('description', '') or ''
+        )
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Замер времени этапа обработки"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def items(self) -> List[str]:
+        """Уникальные элементы обоих списков (в порядке появления)"""
+        return list(dict.fromkeys(self.requirements + self.responsibilities))
+
+    def to_result(self) -> Dict:
+        """
+        Результат обработки в формате процессора описаний.
+
+        Returns:
+            Словарь с результатами обработки вакансии
+        """
+        return {
+            'vacancy_id': self.vacancy_id,
+            'vacancy_name': self.vacancy_name,
+            'company': self.company,
+            'clean_description': self.clean_text,
+            'requirements': self.requirements,
+            'responsibilities': self.responsibilities,
+            'requirements_count': len(self.requirements),
+            'responsibilities_count': len(self.responsibilities),
+        }
@@ -0,0 +1,319 @@
+"""
+Модуль колоночного хранения вакансий в формате Parquet.
+Заменяет raw.json и processed.csv: данные пишутся со сжатием zstd
+в набор, разбитый по запросу и дате запуска
+(<root>/<таблица>/query=<запрос>/run_date=<ГГГГ-ММ-ДД>/part-*.parquet),
+и загружаются обратно без разбора всего файла целиком.
+Требует pyarrow (необязательная зависимость).
+"""
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from core.interfaces import IDataSaver
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class ParquetSaver(IDataSaver):
+    """
+    Сохранение данных в формате Parquet.
+
+    DataFrame сохраняется как есть (списки - колонками-списками),
+    список словарей вакансий - как таблица (id, published_at, raw),
+    где raw - исходный ответ API без потерь.
+    """
+
+    def __init__(self, compression: str = 'zstd'):
+        """
+        Args:
+            compression: Алгоритм сжатия Parquet
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Для хранения в Parquet требуется pyarrow: pip install pyarrow")
+
+        self.compression = compression
+
+    def save(self, data: Any, filepath: str) -> None:
+        """
+        Сохранение данных в Parquet файл.
+
+        Args:
+            data: DataFrame или список словарей вакансий
+            filepath: Путь к файлу
+        """
+        filepath_obj = Path(filepath)
+        filepath_obj.parent.mkdir(parents=True, exist_ok=True)
+
+        if isinstance(data, pd.DataFrame):
+            table = _normalize_table(pa.Table.from_pandas(data, preserve_index=False))
+        else:
+            table = self.vacancies_to_table(data)
+
+        pq.write_table(table, str(filepath_obj), compression=self.compression)
+
+    @staticmethod
+    def vacancies_to_table(vacancies: List[Dict]) -> 'pa.Table':
+        """Таблица сырых вакансий (ответ API в колонке raw)"""
+        return pa.table({
+            'id': pa.array([_to_str(vac.get('id')) for vac in vacancies], pa.string()),
+            'published_at': pa.array([vac.get('published_at') for vac in vacancies], pa.string()),
+            'raw': pa.array(
+                [json.dumps(vac, ensure_ascii=False, separators=(',', ':')) for vac in vacancies],
+                pa.large_string()
+            ),
+        })
+
+
+class ParquetVacancyStore:
+    """
+    Набор данных вакансий в Parquet, разбитый по запросу и дате запуска.
+
+    Две таблицы: vacancies (сырые ответы API, замена raw.json)
+    и processed (результат VacancyAnalyzer.extract_data, замена
+    processed.csv). Каждый запуск пишет отдельный файл в раздел
+    своей даты, поэтому история запусков сохраняется и загружается
+    с фильтром по запросу и диапазону дат.
+    """
+
+    VACANCIES_TABLE = 'vacancies'
+    PROCESSED_TABLE = 'processed'
+
+    def __init__(self, root_dir: str = './result/dataset', compression: str = 'zstd'):
+        """
+        Args:
+            root_dir: Корневая директория набора данных
+            compression: Алгоритм сжатия Parquet
+        """
+        self.root_dir = Path(root_dir)
+        self.saver = ParquetSaver(compression)
+
+        self._partitioning = ds.partitioning(
+            pa.schema([('query', pa.string()), ('run_date', pa.string())]),
+            flavor='hive'
+        )
+
+    # ==================== СОХРАНЕНИЕ ====================
+
+    def save_vacancies(
+            self,
+            query: str,
+            vacancies: List[Dict],
+            run_date: Optional[date] = None
+    ) -> Path:
+        """
+        Сохранение сырых вакансий запуска.
+
+        Args:
+            query: Ключ запроса (имя директории результатов)
+            vacancies: Детальная информация о вакансиях
+            run_date: Дата запуска (None - сегодня)
+
+        Returns:
+            Path: Путь к записанному файлу
+        """
+        filepath = self._new_part_path(self.VACANCIES_TABLE, query, run_date)
+        self.saver.save(vacancies, str(filepath))
+        return filepath
+
+    def save_processed(
+            self,
+            query: str,
+            df: pd.DataFrame,
+            run_date: Optional[date] = None
+    ) -> Path:
+        """
+        Сохранение обработанных данных запуска.
+
+        Args:
+            query: Ключ запроса (имя директории результатов)
+            df: DataFrame из VacancyAnalyzer.extract_data
+            run_date: Дата запуска (None - сегодня)
+
+        Returns:
+            Path: Путь к записанному файлу
+        """
+        filepath = self._new_part_path(self.PROCESSED_TABLE, query, run_date)
+        self.saver.save(df, str(filepath))
+        return filepath
+
+    def _new_part_path(self, table: str, query: str, run_date: Optional[date]) -> Path:
+        run_date = run_date or date.today()
+        stamp = datetime.now().strftime('%Y%m%dT%H%M%S%f')
+
+        return (
+            self.root_dir / table / f'query={query}' / f'run_date={run_date.isoformat()}'
+            / f'part-{stamp}.parquet'
+        )
+
+    # ==================== ЗАГРУЗКА ====================
+
+    def queries(self) -> List[str]:
+        """Ключи запросов, для которых сохранены сырые вакансии"""
+        return sorted(
+            path.name[len('query='):]
+            for path in (self.root_dir / self.VACANCIES_TABLE).glob('query=*')
+            if path.is_dir()
+        )
+
+    def has_vacancies(self, query: str) -> bool:
+        """Есть ли сохраненные вакансии запроса"""
+        return self._latest_part(self.VACANCIES_TABLE, query) is not None
+
+    def load_latest_vacancies(self, query: str) -> List[Dict]:
+        """
+        Вакансии последнего запуска по запросу (аналог чтения raw.json).
+
+        Args:
+            query: Ключ запроса
+
+        Returns:
+            List[Dict]: Сырые вакансии (пустой список, если данных нет)
+        """
+        return list(self.iter_latest_vacancies(query))
+
+    def iter_latest_vacancies(self, query: str, batch_size: int = 1000) -> Iterator[Dict]:
+        """
+        Потоковое чтение вакансий последнего запуска по запросу.
+
+        Args:
+            query: Ключ запроса
+            batch_size: Количество строк, читаемых за раз
+
+        Yields:
+            Dict: Сырая вакансия
+        """
+        part = self._latest_part(self.VACANCIES_TABLE, query)
+        if part is None:
+            return
+
+        parquet_file = pq.ParquetFile(str(part))
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=['raw']):
+            for raw in batch.column(0).to_pylist():
+                yield json.loads(raw)
+
+    def load_vacancies(
+            self,
+            query: Optional[str] = None,
+            date_from: Optional[str] = None,
+            date_to: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Сырые вакансии всех запусков за период.
+
+        Args:
+            query: Ключ запроса (None - все запросы)
+            date_from: Начальная дата запуска включительно (ГГГГ-ММ-ДД)
+            date_to: Конечная дата запуска включительно (ГГГГ-ММ-ДД)
+
+        Returns:
+            List[Dict]: Сырые вакансии (вакансия повторяется в каждом запуске)
+        """
+        table = self._load_table(self.VACANCIES_TABLE, query, date_from, date_to, columns=['raw'])
+        if table is None:
+            return []
+
+        return [json.loads(raw) for raw in table.column('raw').to_pylist()]
+
+    def load_processed(
+            self,
+            query: Optional[str] = None,
+            date_from: Optional[str] = None,
+            date_to: Optional[str] = None,
+            columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Обработанные данные всех запусков за период.
+
+        Args:
+            query: Ключ запроса (None - все запросы)
+            date_from: Начальная дата запуска включительно (ГГГГ-ММ-ДД)
+            date_to: Конечная дата запуска включительно (ГГГГ-ММ-ДД)
+            columns: Загружаемые колонки (None - все, включая query и run_date)
+
+        Returns:
+            pd.DataFrame: Обработанные данные (списки - колонками-списками)
+        """
+        table = self._load_table(self.PROCESSED_TABLE, query, date_from, date_to, columns)
+        if table is None:
+            return pd.DataFrame(columns=columns)
+
+        return table.to_pandas()
+
+    def _load_table(
+            self,
+            table: str,
+            query: Optional[str],
+            date_from: Optional[str],
+            date_to: Optional[str],
+            columns: Optional[List[str]]
+    ) -> Optional['pa.Table']:
+        """Чтение таблицы набора с отбором разделов по запросу и датам"""
+        path = self.root_dir / table
+        if not any(path.glob('query=*/run_date=*/*.parquet')):
+            return None
+
+        row_filter = None
+        for condition in (
+                ds.field('query') == query if query is not None else None,
+                ds.field('run_date') >= date_from if date_from else None,
+                ds.field('run_date') <= date_to if date_to else None,
+        ):
+            if condition is not None:
+                row_filter = condition if row_filter is None else row_filter & condition
+
+        dataset = ds.dataset(str(path), format='parquet', partitioning=self._partitioning)
+
+        # Схемы файлов разных запусков могут отличаться набором колонок
+        schema = pa.unify_schemas(
+            [dataset.schema] + [
+                fragment.physical_schema
+                for fragment in dataset.get_fragments(filter=row_filter)
+            ],
+            promote_options='permissive'
+        )
+        dataset = ds.dataset(
+            str(path), format='parquet', partitioning=self._partitioning, schema=schema
+        )
+
+        return dataset.to_table(columns=columns, filter=row_filter)
+
+    def _latest_part(self, table: str, query: str) -> Optional[Path]:
+        """Файл последнего запуска по запросу"""
+        parts = sorted(
+            (self.root_dir / table / f'query={query}').glob('run_date=*/*.parquet'),
+            key=lambda part: (part.parent.name, part.name)
+        )
+        return parts[-1] if parts else None
+
+
+def _normalize_table(table: 'pa.Table') -> 'pa.Table':
+    """
+    Приведение типов колонок к устойчивым между запусками.
+
+    Категориальные колонки (dictionary) сохраняются как обычные
+    строковые: Parquet все равно кодирует повторяющиеся значения
+    словарем, а одинаковые типы позволяют читать файлы разных
+    запусков как одну таблицу.
+    """
+    fields = [
+        pa.field(field.name, field.type.value_type)
+        if pa.types.is_dictionary(field.type) else field
+        for field in table.schema
+    ]
+
+    return table.cast(pa.schema(fields))
+
+
+def _to_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
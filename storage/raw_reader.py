@@ -0,0 +1,98 @@
+"""
+Модуль потокового чтения сохраненных сырых вакансий.
+raw.json - JSON-массив вакансий, который может занимать гигабайты:
+элементы массива разбираются по одному из буфера фиксированного
+размера, поэтому в памяти одновременно находится только текущая
+вакансия и недочитанный хвост буфера.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+
+# Символы, которые могут следовать за элементом массива
+_ITEM_TERMINATORS = frozenset(' \t\n\r,]')
+
+
+def iter_json_array(
+        filepath: Union[str, Path],
+        chunk_size: int = 1 << 20
+) -> Iterator[Any]:
+    """
+    Потоковый разбор файла с JSON-массивом.
+
+    Args:
+        filepath: Путь к файлу
+        chunk_size: Количество символов, читаемых за раз
+
+    Yields:
+        Any: Очередной элемент массива
+
+    Raises:
+        ValueError: Если файл не является JSON-массивом
+    """
+    decoder = json.JSONDecoder()
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        eof = False
+
+        def fill() -> bool:
+            """Дочитывание следующей порции (False - файл закончился)"""
+            nonlocal buffer, position, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            # Разобранное начало буфера отбрасывается
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+
+        def skip_whitespace() -> str:
+            """Первый непробельный символ с позиции position ('' - конец файла)"""
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                if position < len(buffer):
+                    return buffer[position]
+                if not fill():
+                    return ''
+
+        if skip_whitespace() != '[':
+            raise ValueError(f"Ожидался JSON-массив: {filepath}")
+        position += 1
+
+        if skip_whitespace() == ']':
+            return
+
+        while True:
+            if not skip_whitespace():
+                raise ValueError(f"Неожиданный конец JSON-массива: {filepath}")
+
+            # Элемент может не поместиться в буфер - дочитываем, пока
+            # он не разберется и за ним не появится разделитель
+            # (число на границе буфера иначе разобралось бы не полностью)
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    if eof or (end < len(buffer) and buffer[end] in _ITEM_TERMINATORS):
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                fill()
+
+            position = end
+            yield item
+
+            separator = skip_whitespace()
+            position += 1
+
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Ожидалась ',' или ']' в JSON-массиве: {filepath}")
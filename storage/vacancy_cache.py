@@ -0,0 +1,233 @@
+"""
+Модуль постоянного кэша детальной информации о вакансиях.
+Хранит ответы API на диске (SQLite), чтобы не запрашивать их повторно
+между запусками и между запросами batch-режима.
+Следует принципу Single Responsibility - отвечает только за кэширование.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from core.interfaces import IVacancyCache, CachedVacancy
+
+
+class SqliteVacancyCache(IVacancyCache):
+    """
+    Кэш вакансий на основе SQLite.
+
+    Ключ записи - ID вакансии, значение - JSON ответа API вместе
+    с заголовками ETag/Last-Modified. Записи старше TTL считаются
+    устаревшими: они не отдаются как готовый результат, но хранятся
+    ещё max_stale_hours для условных запросов. При превышении
+    max_entries вытесняются давно не использовавшиеся записи (LRU).
+    """
+
+    # Как часто (в количестве записей) запускать вытеснение
+    EVICTION_INTERVAL = 500
+
+    def __init__(
+            self,
+            db_path: str = './cache/vacancies.sqlite',
+            ttl_hours: float = 24.0,
+            max_entries: Optional[int] = 200_000,
+            max_stale_hours: float = 24.0 * 7
+    ):
+        """
+        Инициализация кэша.
+
+        Args:
+            db_path: Путь к файлу базы данных
+            ttl_hours: Время жизни записи (часы)
+            max_entries: Максимальное количество записей (None = без ограничений)
+            max_stale_hours: Сколько хранить устаревшие записи для условных запросов (часы)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_stale_seconds = max_stale_hours * 3600
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._writes_since_eviction = 0
+
+        # Соединение используется из разных потоков, поэтому доступ сериализуется
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS vacancies ('
+            ' vacancy_id TEXT PRIMARY KEY,'
+            ' data TEXT NOT NULL,'
+            ' fetched_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL,'
+            ' etag TEXT,'
+            ' last_modified TEXT'
+            ')'
+        )
+        self._migrate()
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_vacancies_accessed_at '
+            'ON vacancies (accessed_at)'
+        )
+
+        self._evict()
+
+    def _migrate(self) -> None:
+        """Добавление колонок, которых нет в кэше, созданном старой версией"""
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(vacancies)')}
+
+        for column in ('etag', 'last_modified'):
+            if column not in columns:
+                self._conn.execute(f'ALTER TABLE vacancies ADD COLUMN {column} TEXT')
+
+    def get(self, vacancy_id: str) -> Optional[Dict]:
+        """Получение вакансии из кэша (None, если записи нет или она устарела)"""
+        return self.get_many([vacancy_id]).get(str(vacancy_id))
+
+    def get_many(self, vacancy_ids: List[str]) -> Dict[str, Dict]:
+        """Получение нескольких актуальных вакансий из кэша"""
+        ids = [str(vacancy_id) for vacancy_id in vacancy_ids]
+        found = {
+            vacancy_id: entry.data
+            for vacancy_id, entry in self._select(ids, fresh_only=True).items()
+        }
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(ids) - len(found)
+
+        return found
+
+    def get_entries(self, vacancy_ids: List[str]) -> Dict[str, CachedVacancy]:
+        """Получение записей кэша, включая устаревшие (для условных запросов)"""
+        return self._select([str(vacancy_id) for vacancy_id in vacancy_ids], fresh_only=False)
+
+    def _select(self, ids: List[str], fresh_only: bool) -> Dict[str, CachedVacancy]:
+        """Выборка записей одним запросом на пачку ID"""
+        found = {}
+        now = time.time()
+
+        with self._lock:
+            # Ограничение SQLite на количество параметров в запросе
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT vacancy_id, data, fetched_at, etag, last_modified '
+                    f'FROM vacancies WHERE vacancy_id IN ({placeholders})',
+                    chunk
+                ).fetchall()
+
+                for vacancy_id, data, fetched_at, etag, last_modified in rows:
+                    is_fresh = now - fetched_at <= self.ttl_seconds
+                    if fresh_only and not is_fresh:
+                        continue
+
+                    found[vacancy_id] = CachedVacancy(
+                        data=json.loads(data),
+                        fetched_at=fetched_at,
+                        is_fresh=is_fresh,
+                        etag=etag,
+                        last_modified=last_modified
+                    )
+
+            if found:
+                self._conn.executemany(
+                    'UPDATE vacancies SET accessed_at = ? WHERE vacancy_id = ?',
+                    [(now, vacancy_id) for vacancy_id in found]
+                )
+
+        return found
+
+    def set(
+            self,
+            vacancy_id: str,
+            data: Dict,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None
+    ) -> None:
+        """Сохранение вакансии в кэш вместе с валидаторами"""
+        now = time.time()
+        payload = json.dumps(data, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO vacancies '
+                '(vacancy_id, data, fetched_at, accessed_at, etag, last_modified) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (str(vacancy_id), payload, now, now, etag, last_modified)
+            )
+            self._writes_since_eviction += 1
+
+            if self._writes_since_eviction >= self.EVICTION_INTERVAL:
+                self._evict_locked()
+
+    def touch(self, vacancy_id: str) -> None:
+        """Продление срока жизни записи после ответа 304 Not Modified"""
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                'UPDATE vacancies SET fetched_at = ?, accessed_at = ? WHERE vacancy_id = ?',
+                (now, now, str(vacancy_id))
+            )
+            self.revalidated += 1
+
+    def _evict(self) -> None:
+        """Удаление просроченных записей и вытеснение лишних"""
+        with self._lock:
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        """Вытеснение записей (вызывается под блокировкой)"""
+        self._writes_since_eviction = 0
+
+        self._conn.execute(
+            'DELETE FROM vacancies WHERE fetched_at < ?',
+            (time.time() - self.ttl_seconds - self.max_stale_seconds,)
+        )
+
+        if self.max_entries is None:
+            return
+
+        count = self._conn.execute('SELECT COUNT(*) FROM vacancies').fetchone()[0]
+        overflow = count - self.max_entries
+
+        if overflow > 0:
+            self._conn.execute(
+                'DELETE FROM vacancies WHERE vacancy_id IN ('
+                ' SELECT vacancy_id FROM vacancies ORDER BY accessed_at LIMIT ?'
+                ')',
+                (overflow,)
+            )
+
+    def get_statistics(self) -> Dict:
+        """Возвращает статистику использования кэша"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM vacancies').fetchone()[0]
+
+        total = self.hits + self.misses
+
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'hit_rate': round(self.hits / total * 100, 2) if total else 0.0
+        }
+
+    def close(self) -> None:
+        """Закрытие соединения с базой данных"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,100 @@
+"""
+Модуль хранения водяных знаков инкрементального сбора.
+Запоминает дату публикации самой свежей собранной вакансии
+для каждой пары (запрос, регион), чтобы следующий запуск
+запрашивал у API только более новые вакансии.
+"""
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class WatermarkStore:
+    """
+    Хранилище водяных знаков в JSON-файле.
+
+    Ключ - пара (запрос, регион), значение - максимальное значение
+    published_at среди уже собранных вакансий (строка в формате API).
+    """
+
+    def __init__(self, filepath: str = './result/watermarks.json'):
+        """
+        Args:
+            filepath: Путь к файлу с водяными знаками
+        """
+        self.filepath = Path(filepath)
+        self._lock = threading.Lock()
+        self._watermarks: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        if not self.filepath.exists():
+            return {}
+
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _key(query: str, area: int) -> str:
+        return f"{query.strip().lower()}|{area}"
+
+    def get(self, query: str, area: int) -> Optional[str]:
+        """
+        Получение водяного знака.
+
+        Args:
+            query: Поисковый запрос
+            area: Код региона
+
+        Returns:
+            Optional[str]: Дата публикации самой свежей вакансии или None
+        """
+        with self._lock:
+            return self._watermarks.get(self._key(query, area))
+
+    def update(self, query: str, area: int, vacancies: List[Dict]) -> Optional[str]:
+        """
+        Сдвиг водяного знака по собранным вакансиям (только вперед).
+
+        Args:
+            query: Поисковый запрос
+            area: Код региона
+            vacancies: Собранные вакансии с полем published_at
+
+        Returns:
+            Optional[str]: Новый водяной знак
+        """
+        key = self._key(query, area)
+
+        with self._lock:
+            candidates = [
+                vacancy['published_at'] for vacancy in vacancies
+                if vacancy.get('published_at')
+            ]
+            if key in self._watermarks:
+                candidates.append(self._watermarks[key])
+
+            if not candidates:
+                return None
+
+            self._watermarks[key] = max(candidates, key=_parse_published_at)
+            self._save()
+
+            return self._watermarks[key]
+
+    def _save(self) -> None:
+        """Атомарная запись файла (через временный файл)"""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.filepath.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._watermarks, f, ensure_ascii=False, indent=2)
+
+        tmp_path.replace(self.filepath)
+
+
+def _parse_published_at(value: str) -> datetime:
+    """Разбор даты публикации API (например, 2024-01-15T10:20:30+0300)"""
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S%z')